@@ -1,6 +1,10 @@
+import os
 import sys
 
-print("""
+# set the environment variable BBTOOL_QUIET (e.g. BBTOOL_QUIET=1) to import the package without the banner
+QUIET_VARIABLE = 'BBTOOL_QUIET'
+
+BANNER = """
 --------------------------------------------------------------------------------
 
                  ______  ______
@@ -17,7 +21,18 @@ Version:    1.0 Beta
 
 This is a beta tool! All results without warranty.
 --------------------------------------------------------------------------------
-""")
+"""
+
+
+def print_banner():
+    """
+    Prints the banner of the tool.
+    """
+    print(BANNER)
+
+
+if os.environ.get(QUIET_VARIABLE, '') in ('', '0'):
+    print_banner()
 
 if sys.version_info < (3, 5):
     raise RuntimeError("The BB Tool requires at least Python 3.5!")
@@ -0,0 +1,158 @@
+"""
+This modul contains the BatchRunner class to evaluate many independent models.
+
+Author: Lukas Rauch
+"""
+
+import os
+import traceback
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from . import QUIET_VARIABLE
+from .modelfile import read_model
+
+
+@contextmanager
+def quiet_process_pool(max_workers=None):
+    """
+    ProcessPoolExecutor whose workers import the package without the banner.
+
+    The environment variable BBTOOL_QUIET is set while the pool is open, as
+    spawned workers import the package again, and restored afterwards. An 
+    explicit value of the variable is kept.
+    """
+    previous = os.environ.get(QUIET_VARIABLE)
+    if previous is None:
+        os.environ[QUIET_VARIABLE] = '1'
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield executor
+    finally:
+        if previous is None:
+            os.environ.pop(QUIET_VARIABLE, None)
+
+
+class BatchResult(object):
+    """
+    Result of a single model of a batch run.
+
+    Attributes
+    ---------
+    index : int
+        Position of the model definition in the batch.
+    name : str
+        Name of the model.
+    results : dict
+        Dictionary that stores load_id : result array of Model.solve_all_elements
+        (or the return value of a custom task).
+    error : str
+        Traceback of the exception raised while evaluating the model, else None.
+    """
+
+    def __init__(self, index, name=None, results=None, error=None):
+        """
+        Create a new batch result.
+        """
+        self.index = index
+        self.name = name
+        self.results = results
+        self.error = error
+
+    @property
+    def ok(self):
+        """True if the model was evaluated without an error."""
+        return self.error is None
+
+
+def build_model(definition):
+    """
+    Returns the model of a model definition: a Model object, a model file
+    (.json, .toml, .npz) or a function without arguments that builds a model.
+    """
+    if isinstance(definition, str):
+        return read_model(definition)
+    elif callable(definition):
+        return definition()
+    return definition
+
+
+def _run_model(job):
+    """
+    Evaluates a single model definition. Runs in the worker processes,
+    every exception is captured in the returned BatchResult.
+    """
+    index, definition, load_ids, lm1, task = job
+    name = definition if isinstance(definition, str) else getattr(definition, 'name', None)
+
+    try:
+        model = build_model(definition)
+        name = model.name
+
+        if task is not None:
+            results = task(model)
+        else:
+            ids = list(model._loadclasses.keys()) if load_ids is None else load_ids
+            results = {load_id: model.solve_all_elements(load_id, lm1=lm1) for load_id in ids}
+
+        return BatchResult(index, name, results)
+
+    except Exception:
+        return BatchResult(index, name, error=traceback.format_exc())
+
+
+class BatchRunner(object):
+    """
+    Distributes many independent models on a process pool.
+
+    Attributes
+    ---------
+    max_workers : int
+        Number of worker processes. Defaults to the number of CPUs,
+        with 1 the models are evaluated in the calling process.
+    chunksize : int
+        Number of models sent to a worker at once. If None, the models
+        are split into about four chunks per worker.
+    """
+
+    def __init__(self, max_workers=None, chunksize=None):
+        """
+        Create a new batch runner.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+
+    def run(self, definitions, load_ids=None, lm1=False, task=None):
+        """
+        Evaluates all model definitions and yields the results in the order of the definitions.
+
+        Parameters
+        ----------
+        definitions : list
+            Model objects, model files (.json, .toml, .npz) or picklable 
+            functions without arguments that build a model.
+        load_ids : list
+            IDs of the load classes to solve. If None, all load classes of each model are solved.
+        lm1 : bool
+            Consider LM1 in the forces.
+        task : function
+            Optional picklable function task(model) that replaces the default solve.
+
+        Returns
+        -------
+        results : generator
+            BatchResult objects in the order of the definitions.
+        """
+        definitions = list(definitions)
+        jobs = [(i, definition, load_ids, lm1, task) for i, definition in enumerate(definitions)]
+
+        if self.max_workers == 1:
+            for job in jobs:
+                yield _run_model(job)
+            return
+
+        chunksize = self.chunksize or max(1, len(jobs) // (4 * self.max_workers))
+
+        with quiet_process_pool(self.max_workers) as executor:
+            for result in executor.map(_run_model, jobs, chunksize=chunksize):
+                yield result
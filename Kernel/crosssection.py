@@ -1,9 +1,27 @@
 """
-This modul only contains the Crosssection class
+This modul contains the Crosssection class and the section formulas.
 
 Author: Lukas Rauch
 """
 
+def rectangle_properties(hight, width):
+    """
+    Section values of a rectangular cross section. Works with floats as well 
+    as with broadcastable numpy arrays of hights and widths.
+
+    Returns
+    -------
+    properties : dict
+        Dictionary of the section values 'Iy', 'Iz', 'Wy', 'Wz' and 'area'.
+    """
+    return {
+        'Iy': width * hight**3 / 12,
+        'Iz': hight * width**3 / 12,
+        'Wy': width * hight**2 / 6,
+        'Wz': hight * width**2 / 6,
+        'area': hight * width
+    }
+
 class Crosssection(object):
     """
     Geomrtical data of a local cross section.
@@ -27,10 +45,12 @@ class Crosssection(object):
         self.hight = hight 
         self.width = width 
 
-        self.Iy = width * hight**3 / 12
-        self.Iz = hight * width**3 / 12
+        properties = rectangle_properties(hight, width)
+
+        self.Iy = properties['Iy']
+        self.Iz = properties['Iz']
 
-        self.Wy = width * hight**2 / 6
-        self.Wz = hight * width**2 / 6
+        self.Wy = properties['Wy']
+        self.Wz = properties['Wz']
 
-        self.area = hight * width
+        self.area = properties['area']
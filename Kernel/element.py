@@ -1,11 +1,181 @@
 """
-This modul only contains the Element class
+This modul contains the Element class and the columnar ElementStore.
 
 Author: Lukas Rauch
 """
 import math
 import numpy as np
-import numpy.linalg as la
+from collections.abc import MutableMapping
+
+class ElementStore(object):
+    """
+    Columnar storage of the element connectivity, the material and cross
+    section references and the element forces of a model. The elements 
+    are lightweight views on one row of the store.
+
+    Attributes
+    ---------
+    size : int
+        Number of stored elements.
+    id : ndarray
+        Element IDs.
+    node_a, node_b : ndarray
+        Row indices of the element nodes in the NodeStore of the model.
+    material, crosssection : ndarray
+        Indices into the lists `materials` and `crosssections`.
+    materials, crosssections : list
+        Distinct material and cross section objects used by the elements.
+    moment, q_a, q_e : ndarray
+        Element forces.
+    dx, dy, length : ndarray
+        Cached element vectors and lengths.
+    version_a, version_b : ndarray
+        Node versions the cached geometry was computed with (-1 = not computed).
+    revision : ndarray
+        Number of changes of the nodes, the material or the cross section of every element.
+    """
+
+    COLUMNS = {'id': object, 'node_a': np.int64, 'node_b': np.int64, 'material': np.int64, 'crosssection': np.int64,
+               'moment': float, 'q_a': float, 'q_e': float,
+               'dx': float, 'dy': float, 'length': float, 'version_a': np.int64, 'version_b': np.int64,
+               'revision': np.int64}
+
+    def __init__(self, capacity=16):
+        """
+        Create an empty element store.
+        """
+        self.size = 0
+        for key, dtype in self.COLUMNS.items():
+            setattr(self, key, np.zeros(capacity, dtype=dtype))
+
+        self.materials = []
+        self.crosssections = []
+        self._material_index = dict()
+        self._crosssection_index = dict()
+
+        # state of the cached geometry: node store revision and number of elements
+        self._geometry_revision = -1
+        self._geometry_size = -1
+
+    def append(self, id, node_a, node_b, material, crosssection):
+        """
+        Adds a new element row and returns its index.
+        """
+        if self.size == len(self.node_a):
+            self._grow()
+
+        index = self.size
+        self.id[index] = id
+        self.node_a[index] = node_a
+        self.node_b[index] = node_b
+        self.material[index] = self.get_material_index(material)
+        self.crosssection[index] = self.get_crosssection_index(crosssection)
+        self.version_a[index] = -1
+        self.version_b[index] = -1
+        self.size += 1
+        return index
+
+    def invalidate_geometry(self, index):
+        """
+        Forces a recalculation of the cached geometry of an element row.
+        """
+        self.version_a[index] = -1
+        self._geometry_size = -1
+        self.revision[index] += 1
+
+    def update_geometry(self, nodes):
+        """
+        Recalculates the cached vectors and lengths of all elements whose nodes 
+        were moved since the last update. Does nothing if no node of the
+        NodeStore `nodes` was moved and no element was added.
+        """
+        if self._geometry_revision == nodes.revision and self._geometry_size == self.size:
+            return
+
+        n = self.size
+        a = self.node_a[:n]
+        b = self.node_b[:n]
+        stale = np.flatnonzero((self.version_a[:n] != nodes.version[a]) | (self.version_b[:n] != nodes.version[b]))
+
+        if len(stale):
+            a = a[stale]
+            b = b[stale]
+            dx = nodes.x[b] - nodes.x[a]
+            dy = nodes.y[b] - nodes.y[a]
+
+            self.dx[stale] = dx
+            self.dy[stale] = dy
+            self.length[stale] = np.sqrt(dx*dx + dy*dy)
+            self.version_a[stale] = nodes.version[a]
+            self.version_b[stale] = nodes.version[b]
+
+        self._geometry_revision = nodes.revision
+        self._geometry_size = n
+
+    def get_material_index(self, material):
+        """
+        Index of a material object, the material is registered if it is new.
+        """
+        if material not in self._material_index:
+            self._material_index[material] = len(self.materials)
+            self.materials.append(material)
+        return self._material_index[material]
+
+    def get_crosssection_index(self, crosssection):
+        """
+        Index of a cross section object, the cross section is registered if it is new.
+        """
+        if crosssection not in self._crosssection_index:
+            self._crosssection_index[crosssection] = len(self.crosssections)
+            self.crosssections.append(crosssection)
+        return self._crosssection_index[crosssection]
+
+    def _grow(self):
+        """
+        Doubles the capacity of all columns.
+        """
+        capacity = max(2 * len(self.node_a), 1)
+        for key, dtype in self.COLUMNS.items():
+            column = np.zeros(capacity, dtype=dtype)
+            column[:self.size] = getattr(self, key)[:self.size]
+            setattr(self, key, column)
+
+
+class ElementForces(MutableMapping):
+    """
+    Dictionary like view on the forces 'moment', 'q_a' and 'q_e' of an element.
+    """
+
+    __slots__ = ('_store', '_index')
+
+    KEYS = ('moment', 'q_a', 'q_e')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self._store, key)[self._index]
+
+    def __setitem__(self, key, value):
+        if key not in self.KEYS:
+            raise KeyError('Element forces only contain the keys {}' .format(self.KEYS))
+        getattr(self._store, key)[self._index] = value
+
+    def __delitem__(self, key):
+        raise KeyError('Element forces can not be deleted.')
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
 
 class Element(object):
     """
@@ -26,36 +196,78 @@ class Element(object):
     
     """
 
-    def __init__(self, id, node_a, node_b, material, crosssection):
+    __slots__ = ('id', '_node_a', '_node_b', '_store', '_index')
+
+    def __init__(self, id, node_a, node_b, material, crosssection, store=None):
         """
         Initialize a defined element by its required attributes.
-
-        #TODO: Fix text
-         
+        The element data is kept in the passed in ElementStore 
+        (a private store is created for an element without model).
         """
+        if store is None:
+            store = ElementStore(capacity=1)
 
         self.id = id
-        self.node_a = node_a
-        self.node_b = node_b
-        self.material = material
-        self.crosssection = crosssection
+        self._node_a = node_a
+        self._node_b = node_b
+        self._store = store
+        self._index = store.append(id, node_a._index, node_b._index, material, crosssection)
 
-        
+        # self.length = float
+        # self.weight_pm = self.material.density() * self.crosssection.get_area()
+        # self.weight = self.weight_pm * self.length
 
-        # internal storage
-        self.forces = {
-            'moment' : 0,
-            'q_a' : 0,
-            'q_e' : 0 
-        }
+    @property
+    def node_a(self):
+        return self._node_a
 
+    @node_a.setter
+    def node_a(self, node):
+        self._node_a = node
+        self._store.node_a[self._index] = node._index
+        self._store.invalidate_geometry(self._index)
 
+    @property
+    def node_b(self):
+        return self._node_b
 
-        # self.length = float
-        # self.weight_pm = self.material.density() * self.crosssection.get_area()
-        # self.weight = self.weight_pm * self.length
+    @node_b.setter
+    def node_b(self, node):
+        self._node_b = node
+        self._store.node_b[self._index] = node._index
+        self._store.invalidate_geometry(self._index)
+
+    @property
+    def material(self):
+        return self._store.materials[self._store.material[self._index]]
+
+    @material.setter
+    def material(self, material):
+        self._store.material[self._index] = self._store.get_material_index(material)
+        self._store.revision[self._index] += 1
+
+    @property
+    def crosssection(self):
+        return self._store.crosssections[self._store.crosssection[self._index]]
+
+    @crosssection.setter
+    def crosssection(self, crosssection):
+        self._store.crosssection[self._index] = self._store.get_crosssection_index(crosssection)
+        self._store.revision[self._index] += 1
+
+    @property
+    def forces(self):
+        """Element forces 'moment', 'q_a' and 'q_e' as dictionary like view."""
+        return ElementForces(self._store, self._index)
 
-        pass
+    @forces.setter
+    def forces(self, forces):
+        # replaces all forces, missing keys are reset to 0
+        values = dict.fromkeys(ElementForces.KEYS, 0)
+        values.update(forces)
+        if len(values) > len(ElementForces.KEYS):
+            raise KeyError('Element forces only contain the keys {}' .format(ElementForces.KEYS))
+        ElementForces(self._store, self._index).update(values)
 
     @property
     def dofs(self):
@@ -66,19 +278,35 @@ class Element(object):
     
         return [(a_id), (b_id)]
     
+    def _get_geometry(self):
+        """
+        Returns the store row of the cached geometry, updated if a node was moved.
+        """
+        store = self._store
+        i = self._index
+        node_a = self._node_a
+        node_b = self._node_b
+
+        if store.version_a[i] != node_a._store.version[node_a._index] or \
+                store.version_b[i] != node_b._store.version[node_b._index]:
+            dx = node_b.x - node_a.x
+            dy = node_b.y - node_a.y
+            store.dx[i] = dx
+            store.dy[i] = dy
+            store.length[i] = math.sqrt(dx*dx + dy*dy)
+            store.version_a[i] = node_a._store.version[node_a._index]
+            store.version_b[i] = node_b._store.version[node_b._index]
+
+        return i
+
     def get_element_vector(self):
         """Returns the 2D element orientation"""
-        actual_a = self.node_a.get_actual_location()
-        actual_b = self.node_b.get_actual_location()
+        i = self._get_geometry()
 
-        return actual_b - actual_a
+        return np.array([self._store.dx[i], self._store.dy[i]], dtype=float)
     
     def get_actual_length(self):
         """Returns the 2D Element vector length"""
-        actual_a = self.node_a.get_actual_location()
-        actual_b = self.node_b.get_actual_location()
-
-        return la.norm(actual_b - actual_a)
-
-    
+        i = self._get_geometry()
 
+        return self._store.length[i]
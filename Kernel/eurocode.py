@@ -6,6 +6,25 @@ Author: Lukas Rauch
 
 import numpy as np
 
+
+def _admissible(nu, design=True):
+    """
+    Governing utilisation of the results of Eurocode.design_check, a section 
+    is admissible if it is <= 1. The maximum of the bending and the shear 
+    utilisation and, for steel, the von Mises utilisation.
+
+    Parameters
+    ----------
+    nu : dict
+        Utilisations 'nu_md', 'nu_qd', 'nu_vmd' resp. 'nu_mk', 'nu_qk', 'nu_vmk'.
+    design : bool
+        Use the design or the characteristic utilisations.
+    """
+    m, q, vm = ('nu_md', 'nu_qd', 'nu_vmd') if design else ('nu_mk', 'nu_qk', 'nu_vmk')
+    # the von Mises utilisation is NaN for wood
+    return np.fmax(np.maximum(nu[m], nu[q]), nu[vm])
+
+
 class Eurocode(object):
     """
         Class for predefining and storing data concerning the EUROCODE norm. 
@@ -33,66 +52,55 @@ class Eurocode(object):
         self.Gm_cs = 1.15   # Betonstahl
 
 
-    def design_crosssection(self, element_id, load_id, lm1=False):
+    def design_check(self, mk_max, qk_max, Wy, area, fmk, fvk, kcr, materialtype):
         """
-        Tool for designing a given cross section by the passed in load.
-        distinguishes by the material type
+        Vectorized design check of the bending and shear utilisation of wood 
+        and steel members. All arguments are arrays (or scalars) that are 
+        broadcasted against each other, the material types are masked.
+
+        Parameters
+        ----------
+        mk_max, qk_max : ndarray
+            Characteristic moment [kNm] and shear force [kN].
+        Wy, area : ndarray
+            Section modulus [m^3] and area [m^2] of the cross sections.
+        fmk, fvk : ndarray
+            Characteristic bending (steel: yield) and shear strength [N/mm^2].
+        kcr : ndarray
+            Crack factor of wood, ignored for steel.
+        materialtype : ndarray
+            'wood' or 'steal'.
+
+        Returns
+        -------
+        nu : dict
+            Characteristic and design utilisations 'nu_mk', 'nu_qk', 'nu_md', 'nu_qd'
+            and the von Mises utilisations 'nu_vmk', 'nu_vmd' of steel (NaN for wood).
         """
+        materialtype = np.asarray(materialtype, dtype=object)
+        wood = materialtype == 'wood'
+        steel = materialtype == 'steal'
+
+        unknown = ~(wood | steel)
+        if np.any(unknown):
+            raise RuntimeError('Material with type "{}" is not part of the library. Solving the system is not possible!' .format(materialtype[unknown].flat[0]))
+
+        # wood: shear with kcr and fvk, steel: approximated web area av and fyk
+        fvk = np.where(wood, fvk, fmk)
+        av = np.where(wood, kcr*area, 0.4*area)     # TODO fix correct crosssection area web - 0.4 is only approximation
+        qf = np.where(wood, 1.5, np.sqrt(3))
+        Gm = np.where(wood, self.Gm_w, self.Gm_s0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            nu_mk = mk_max/(1000*Wy*fmk)
+            nu_qk = qf*qk_max/(1000*av*fvk)
+
+        # design values: Gq on the loads, Gm on the strength
+        nu_md = (self.Gq*Gm)*nu_mk
+        nu_qd = (self.Gq*Gm)*nu_qk
+
+        # von Mises sqrt(sigma^2 + 3 tau^2) / fy, the factor sqrt(3) of the shear is part of nu_q
+        nu_vmk = np.where(steel, np.sqrt(nu_mk**2 + nu_qk**2), np.nan)
+        nu_vmd = np.where(steel, np.sqrt(nu_md**2 + nu_qd**2), np.nan)
 
-        Gg = self.ec.Gg
-        Gq = self.ec.Gq
-
-        materialtype = self._elements[element_id].material.materialtype 
-        material = self._elements[element_id].material
-        crosssection = self._elements[element_id].crosssection
-        
-        Wy = crosssection.Wy
-        mk_max , qk_max =  self.calc_forces(element_id, load_id, lm1=False)
-
-        if materialtype == 'wood':
-            kcr = self._materials[material.id].get_kcr()
-            kmod = self._materials[material.id].get_kmod(nkl=1, kled='kurz')
-            
-            kh = (150/crosssection.hight*1000)**0.2  # TODO fix problem with variable units. kh has to be [mm] !
-            if kh >= 1.3:
-                kh = 1.3
-            if kh <= 1.0:
-                kh = 1.0
-
-            fmk = material.fmk
-            fvk = material.fvk
-
-            Gm = self.ec.Gm_w
-            fmd = fmk/Gm
-            fvd = fvk/Gm
-
-            nu_mk = mk_max/(1000*Wy*fmk)                                # fix Teislicherheitsbeiwerte
-            nu_qk = 1.5*qk_max/(1000*kcr*crosssection.area*fvk)      # fix Teislicherheitsbeiwerte 
-            
-            nu_md = Gq*mk_max/(1000*Wy*fmd)                             # fix Teislicherheitsbeiwerte
-            nu_qd = 1.5*Gq*qk_max/(1000*kcr*crosssection.area*fvd)     # fix Teislicherheitsbeiwerte 
-
-        elif materialtype == 'steal':
-            Gm = self.ec.Gm_s0
-
-            fyk = material.fmk
-            fyd = fyk/Gm
-            av = 0.4*crosssection.area      # TODO fix correct crosssection area web - 0.4 is only approximation 
-
-            nu_mk = mk_max/(1000*Wy*fyk)
-            nu_qk = np.sqrt(3)*qk_max/(1000*av*fyk)
-
-            nu_vmk =  nu_mk**2 + 3*nu_qk**2
-            
-            nu_md = Gq*mk_max/(1000*Wy*fyd)
-            nu_qd = np.sqrt(3)*Gq*qk_max/(1000*av*fyd)    
-            
-            nu_vmd =  nu_md**2 + 3*nu_qd**2
-
-        else:
-            raise RuntimeError('Material with type "{}" is not part of the library. Solving the system is not possible!' .format(id))
-        
-        return {'nu_mk': nu_mk, 'nu_qk': nu_qk, 'nu_md': nu_md, 'nu_qd': nu_qd}
-
-        
-    
+        return {'nu_mk': nu_mk, 'nu_qk': nu_qk, 'nu_md': nu_md, 'nu_qd': nu_qd, 'nu_vmk': nu_vmk, 'nu_vmd': nu_vmd}
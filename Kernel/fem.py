@@ -0,0 +1,354 @@
+"""
+This modul contains the FemSolver class, a linear finite element solver
+for plane beam structures with a sparse global stiffness matrix.
+
+Units: coordinates [m], forces [kN], moments [kNm]. The youngs modulus of the
+materials is given in [N/mm^2] like the strength values and converted to [kN/m^2].
+
+Author: Lukas Rauch
+"""
+
+import numpy as np
+
+
+def _import_scipy():
+    """
+    Imports the sparse matrix modules of scipy.
+    """
+    try:
+        import scipy.sparse as sparse
+        import scipy.sparse.linalg as sparse_linalg
+    except ImportError:
+        raise RuntimeError('The FE solver requires the package "scipy"!')
+
+    return sparse, sparse_linalg
+
+
+def beam_stiffness(length, EA, EI):
+    """
+    Local stiffness matrices of plane Euler-Bernoulli beam elements.
+    Works with floats as well as with arrays of element values.
+
+    Returns
+    -------
+    k : ndarray
+        Stiffness matrices with shape (..., 6, 6) for the local degrees of
+        freedom (u_a, v_a, phi_a, u_b, v_b, phi_b).
+    """
+    length = np.asarray(length, dtype=float)
+    ea = np.asarray(EA, dtype=float) / length
+    ei = np.asarray(EI, dtype=float) / length**3
+    l = length
+
+    k = np.zeros(np.shape(length) + (6, 6), dtype=float)
+
+    k[..., 0, 0] = k[..., 3, 3] = ea
+    k[..., 0, 3] = k[..., 3, 0] = -ea
+
+    k[..., 1, 1] = k[..., 4, 4] = 12 * ei
+    k[..., 1, 4] = k[..., 4, 1] = -12 * ei
+    k[..., 1, 2] = k[..., 2, 1] = k[..., 1, 5] = k[..., 5, 1] = 6 * ei * l
+    k[..., 4, 2] = k[..., 2, 4] = k[..., 4, 5] = k[..., 5, 4] = -6 * ei * l
+    k[..., 2, 2] = k[..., 5, 5] = 4 * ei * l**2
+    k[..., 2, 5] = k[..., 5, 2] = 2 * ei * l**2
+
+    return k
+
+
+class FemSolver(object):
+    """
+    Linear plane beam FE solver with three degrees of freedom per node
+    (u, v, phi). The global stiffness matrix is assembled once as sparse
+    matrix and factorized on the first solve.
+
+    Supports are vertical supports (v = 0). The horizontal displacement
+    of the first support is fixed as well, the rotations are free. So a
+    girder over several supports is a continuous beam.
+
+    Attributes
+    ---------
+    node_ids : list
+        IDs of the nodes in the order of the degrees of freedom.
+    element_ids : list
+        IDs of the elements.
+    n_dof : int
+        Number of degrees of freedom.
+    stiffness : sparse matrix
+        Global stiffness matrix (CSC) without boundary conditions.
+    free : ndarray
+        Indices of the free degrees of freedom.
+    EA, EI : ndarray
+        Axial and bending stiffness of the elements.
+    """
+
+    def __init__(self, x, y, node_a, node_b, EA, EI, supports, node_ids=None, element_ids=None):
+        """
+        Create a new solver from node and element arrays.
+
+        Parameters
+        ----------
+        x, y : array_like
+            Node coordinates [m].
+        node_a, node_b : array_like
+            Node indices of the elements.
+        EA, EI : array_like
+            Axial [kN] and bending stiffness [kNm^2] of the elements.
+        supports : array_like
+            Indices of the supported nodes.
+        """
+        sparse, self._sparse_linalg = _import_scipy()
+
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.node_a = np.asarray(node_a, dtype=np.int64)
+        self.node_b = np.asarray(node_b, dtype=np.int64)
+        self.node_ids = list(range(len(x))) if node_ids is None else list(node_ids)
+        self.element_ids = list(range(len(self.node_a))) if element_ids is None else list(element_ids)
+        self.n_dof = 3 * len(x)
+
+        EA = np.broadcast_to(np.asarray(EA, dtype=float), self.node_a.shape)
+        EI = np.broadcast_to(np.asarray(EI, dtype=float), self.node_a.shape)
+        if np.any(EA <= 0) or np.any(EI <= 0):
+            invalid = [self.element_ids[i] for i in np.flatnonzero((EA <= 0) | (EI <= 0))]
+            raise RuntimeError('The elements {} have no stiffness! Check the youngs modulus of the materials.' .format(invalid))
+
+        dx = x[self.node_b] - x[self.node_a]
+        dy = y[self.node_b] - y[self.node_a]
+        self.length = np.hypot(dx, dy)
+        if np.any(self.length == 0):
+            raise RuntimeError('The elements {} have zero length!' .format(
+                [self.element_ids[i] for i in np.flatnonzero(self.length == 0)]))
+        self.cos = dx / self.length
+        self.sin = dy / self.length
+
+        # transformation global -> local of every element
+        t = np.zeros(self.length.shape + (6, 6), dtype=float)
+        for i in (0, 3):
+            t[:, i, i] = t[:, i + 1, i + 1] = self.cos
+            t[:, i, i + 1] = self.sin
+            t[:, i + 1, i] = -self.sin
+            t[:, i + 2, i + 2] = 1
+        self.transformation = t
+
+        self.EA = EA
+        self.EI = EI
+        self.local_stiffness = beam_stiffness(self.length, EA, EI)
+        k_global = np.matmul(np.swapaxes(t, 1, 2), np.matmul(self.local_stiffness, t))
+
+        self.dofs = np.column_stack((3 * self.node_a, 3 * self.node_a + 1, 3 * self.node_a + 2,
+                                     3 * self.node_b, 3 * self.node_b + 1, 3 * self.node_b + 2))
+        rows = np.repeat(self.dofs, 6, axis=1).ravel()
+        cols = np.tile(self.dofs, (1, 6)).ravel()
+        self.stiffness = sparse.coo_matrix((k_global.ravel(), (rows, cols)), shape=(self.n_dof, self.n_dof)).tocsc()
+
+        supports = np.unique(np.asarray(supports, dtype=np.int64))
+        if len(supports) == 0:
+            raise RuntimeError('The structure has no supports!')
+        fixed = np.concatenate(([3 * supports[0]], 3 * supports + 1))
+        self.supports = supports
+        self.free = np.setdiff1d(np.arange(self.n_dof), fixed)
+
+        self._factor = None
+
+    @classmethod
+    def from_model(cls, model, supports=None):
+        """
+        Creates a solver of all nodes and elements of a model. By default the
+        nodes of the substructures are the supports.
+        """
+        nodes = model._node_store
+        store = model._element_store
+        n = store.size
+
+        if supports is None:
+            supports = list(model._substructures)
+        index = {id: i for i, id in enumerate(nodes.id[:nodes.size])}
+        for id in supports:
+            if id not in index:
+                raise RuntimeError('The model does not contain a node with id {}'.format(id))
+
+        E = 1000 * np.array([m.youngs_modulus for m in store.materials], dtype=float)[store.material[:n]]
+        Iy = np.array([c.Iy for c in store.crosssections], dtype=float)[store.crosssection[:n]]
+        area = np.array([c.area for c in store.crosssections], dtype=float)[store.crosssection[:n]]
+
+        return cls(nodes.x[:nodes.size], nodes.y[:nodes.size], store.node_a[:n], store.node_b[:n],
+                   E * area, E * Iy, [index[id] for id in supports],
+                   node_ids=nodes.id[:nodes.size], element_ids=store.id[:n])
+
+    def factorize(self):
+        """
+        Sparse LU factorisation of the stiffness matrix of the free degrees of freedom.
+        """
+        if self._factor is None:
+            k_free = self.stiffness[self.free][:, self.free].tocsc()
+            try:
+                self._factor = self._sparse_linalg.splu(k_free)
+            except RuntimeError:
+                raise RuntimeError('The stiffness matrix is singular! The structure is kinematic.')
+
+        return self._factor
+
+    def load_vector(self, nodal_loads=None, element_loads=None):
+        """
+        Global load vector of nodal loads and uniform line loads.
+
+        Parameters
+        ----------
+        nodal_loads : dict
+            node index : [Fx, Fy, M] in global directions [kN, kNm].
+        element_loads : array_like
+            Line load of every element perpendicular to the element axis [kN/m],
+            positive downwards for an element from left to right.
+
+        Returns
+        -------
+        load : ndarray
+            Load vector with n_dof entries.
+        """
+        load = np.zeros(self.n_dof, dtype=float)
+
+        if nodal_loads:
+            for i, values in nodal_loads.items():
+                load[3 * i:3 * i + 3] += values
+
+        if element_loads is not None:
+            load += self._element_load_vector(element_loads)
+
+        return load
+
+    def _element_load_vector(self, element_loads):
+        """
+        Global load vector(s) of line loads with shape (n_elements,) or (n_elements, n).
+        """
+        f = np.einsum('eji,ej...->ei...', self.transformation, self._fixed_end_forces(element_loads))
+        load = np.zeros((self.n_dof,) + f.shape[2:], dtype=float)
+        np.add.at(load, self.dofs, f)
+
+        return load
+
+    def _line_loads(self, element_loads, shape=()):
+        """
+        Line loads as array with shape (n_elements,) + shape.
+        """
+        if element_loads is None:
+            return np.zeros(self.length.shape + shape, dtype=float)
+
+        q = np.asarray(element_loads, dtype=float)
+        if q.ndim == 0:
+            return np.full(self.length.shape + shape, float(q))
+        return q
+
+    def _fixed_end_forces(self, element_loads):
+        """
+        Local equivalent nodal forces of uniform line loads.
+        """
+        q = self._line_loads(element_loads)
+        l = self.length.reshape((-1,) + (1,) * (q.ndim - 1))
+        f = np.zeros((len(self.length), 6) + q.shape[1:], dtype=float)
+        f[:, 1] = f[:, 4] = -q * l / 2
+        f[:, 2] = -q * l**2 / 12
+        f[:, 5] = q * l**2 / 12
+        return f
+
+    def displacements(self, load):
+        """
+        Displacement vectors of load vectors. A load matrix with shape (n_dof, n)
+        is solved as one block with n right hand sides.
+        """
+        load = np.asarray(load, dtype=float)
+        u = np.zeros(load.shape, dtype=float)
+        u[self.free] = self.factorize().solve(np.ascontiguousarray(load[self.free]))
+
+        return u
+
+    def solve(self, nodal_loads=None, element_loads=None):
+        """
+        Solves the structure for one load case.
+
+        Returns
+        -------
+        results : dict
+            'displacements' : ndarray (n_nodes, 3) of u, v [m] and phi [rad]
+            'reactions' : ndarray (n_nodes, 3) of the support forces Rx, Ry [kN] and M [kNm]
+            'element_forces' : structured array with one row per element and the fields
+                'id', 'normal', 'shear_a', 'shear_b', 'moment_a', 'moment_b', 'moment_field'.
+                Internal forces with sagging moments positive.
+        """
+        load = self.load_vector(nodal_loads, element_loads)
+        return self._results(load, self._line_loads(element_loads))
+
+    def solve_block(self, load, element_loads=None):
+        """
+        Solves many load cases with one factorisation. The load cases are
+        the columns of the load matrix.
+
+        Parameters
+        ----------
+        load : array_like
+            Global nodal load matrix with shape (n_dof, n).
+        element_loads : array_like
+            Line loads with shape (n_elements, n) (see load_vector).
+
+        Returns
+        -------
+        results : dict
+            Results like solve with an additional last axis of length n for the 
+            load cases. The element forces are subarray fields of shape (n,).
+        """
+        load = np.array(load, dtype=float)
+        if load.ndim != 2 or load.shape[0] != self.n_dof:
+            raise RuntimeError('The load matrix must have the shape ({}, number of load cases)!' .format(self.n_dof))
+
+        q = self._line_loads(element_loads, load.shape[1:])
+        if element_loads is not None:
+            load += self._element_load_vector(q)
+
+        return self._results(load, q)
+
+    def _results(self, load, q):
+        """
+        Displacements, reactions and element forces of the load vector(s).
+        """
+        u = self.displacements(load)
+
+        reactions = self.stiffness.dot(u) - load
+        reactions[self.free] = 0
+
+        shape = (-1, 3) + load.shape[1:]
+        return {
+            'displacements': u.reshape(shape),
+            'reactions': reactions.reshape(shape),
+            'element_forces': self.element_forces(u, q)
+        }
+
+    def element_forces(self, u, element_loads):
+        """
+        Internal forces of the elements of a displacement vector or 
+        of a displacement matrix with one column per load case.
+        """
+        q = self._line_loads(element_loads, np.shape(u)[1:])
+        u_local = np.einsum('eij,ej...->ei...', self.transformation, u[self.dofs])
+        f = np.einsum('eij,ej...->ei...', self.local_stiffness, u_local) - self._fixed_end_forces(q)
+
+        l = self.length.reshape((-1,) + (1,) * (q.ndim - 1))
+        shear_a = f[:, 1]
+        moment_a = -f[:, 2]
+
+        # maximum sagging moment within the element: M(x) = M_a + V_a x - q x^2 / 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x0 = np.where(q > 0, np.clip(shear_a / q, 0, l), 0)
+        moment_field = np.maximum(np.maximum(moment_a, f[:, 5]), moment_a + shear_a * x0 - q * x0**2 / 2)
+
+        cases = q.shape[1:]
+        results = np.empty(len(self.length), dtype=[
+            ('id', object), ('normal', float, cases), ('shear_a', float, cases), ('shear_b', float, cases),
+            ('moment_a', float, cases), ('moment_b', float, cases), ('moment_field', float, cases)])
+        results['id'] = self.element_ids
+        results['normal'] = f[:, 3]
+        results['shear_a'] = shear_a
+        results['shear_b'] = -f[:, 4]
+        results['moment_a'] = moment_a
+        results['moment_b'] = f[:, 5]
+        results['moment_field'] = moment_field
+
+        return results
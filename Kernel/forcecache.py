@@ -0,0 +1,81 @@
+"""
+This modul only contains the ForceCache class and the process wide cache instance.
+
+Author: Lukas Rauch
+"""
+
+from collections import OrderedDict
+
+class ForceCache(object):
+    """
+    Bounded least recently used cache of the maximum element forces
+    (span, loadclass, loadtype, lm1, conservative) : (m_max, q_max).
+
+    Attributes
+    ---------
+    maxsize : int
+        Maximum number of cached entries.
+    hits : int
+        Number of successful lookups.
+    misses : int
+        Number of lookups without cached entry.
+    """
+
+    def __init__(self, maxsize=4096):
+        """
+        Create a new empty cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        """
+        Returns the cached value of the key or None.
+        """
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """
+        Adds a value and removes the least recently used entries above maxsize.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        """
+        Changes the maximum number of cached entries.
+        """
+        self.maxsize = maxsize
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters.
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+        Returns the cache statistics as dictionary.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'maxsize': self.maxsize, 'currsize': len(self._data)}
+
+
+# cache shared by all models of the process
+FORCE_CACHE = ForceCache()
@@ -0,0 +1,92 @@
+"""
+This modul only contains the GradeTable class
+
+Author: Lukas Rauch
+"""
+
+import numpy as np
+
+class GradeTable(object):
+    """
+    Indexed, read only table of material grades.
+
+    The table is built once from a dictionary {grade: {column: value}}. Every
+    numeric column is stored as a float64 array with one row per grade, text
+    columns as object arrays. Grades are looked up case insensitive.
+
+    Attributes
+    ---------
+    grades : tuple
+        Grade names in the order of the rows.
+    names : tuple
+        Names of the columns.
+    """
+
+    def __init__(self, data):
+        """
+        Create a new table from a dictionary.
+        """
+        self.grades = tuple(data)
+        self.names = tuple(data[self.grades[0]])
+
+        for grade in self.grades:
+            if tuple(data[grade]) != self.names:
+                raise RuntimeError('The columns of grade {} do not match the table columns!' .format(grade))
+
+        self._columns = dict()
+        for name in self.names:
+            values = [data[grade][name] for grade in self.grades]
+            column = np.array(values, dtype=object if isinstance(values[0], str) else float)
+            column.flags.writeable = False
+            self._columns[name] = column
+
+        self._index = {grade.lower(): i for i, grade in enumerate(self.grades)}
+
+    def __contains__(self, grade):
+        return str(grade).lower() in self._index
+
+    def index(self, grades):
+        """
+        Returns the row of a grade or an array of rows for a list of grades.
+        Raises a RuntimeError for grades that are not part of the table.
+        """
+        try:
+            if isinstance(grades, str):
+                return self._index[grades.lower()]
+            return np.array([self._index[grade.lower()] for grade in grades], dtype=np.int64)
+        except KeyError as error:
+            raise RuntimeError('The material grade {} is not part of the library!' .format(error.args[0]))
+
+    def get(self, grade, name):
+        """
+        Returns a single value of a grade.
+        """
+        return self._columns[name][self.index(grade)]
+
+    def column(self, name, grades=None):
+        """
+        Returns a column of the table. If a list of grades is passed in,
+        only the rows of these grades are returned (in the order of the list).
+        """
+        if grades is None:
+            return self._columns[name]
+        return self._columns[name][self.index(grades)]
+
+    def columns(self, grades, names=None):
+        """
+        Bulk access to several columns of several grades.
+
+        Returns
+        -------
+        columns : dict
+            Dictionary of arrays name : values in the order of the grades.
+        """
+        rows = self.index(grades)
+        return {name: self._columns[name][rows] for name in (self.names if names is None else names)}
+
+    def record(self, grade):
+        """
+        Returns all values of a grade as dictionary.
+        """
+        row = self.index(grade)
+        return {name: self._columns[name][row:row + 1].tolist()[0] for name in self.names}
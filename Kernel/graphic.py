@@ -83,12 +83,7 @@ class Graphic(object):
         C     = (x2 * x3 * (x2-x3) * y1+x3 * x1 * (x3-x1) * y2+x1 * x2 * (x1-x2) * y3) / denom
 
         x_pos=np.linspace(x1,x3,20)
-        y_pos=[]
-
-        for x in range(len(x_pos)):
-            x_val=x_pos[x]
-            y=(A*(x_val**2))+(B*x_val)+C
-            y_pos.append(-y)
+        y_pos=-((A*(x_pos**2))+(B*x_pos)+C)
 
         plt.plot(x_pos, y_pos, linestyle='-', color='black') # parabola line
 
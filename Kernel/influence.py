@@ -0,0 +1,224 @@
+"""
+This modul contains the InfluenceLines class and the axle trains of the
+MLC vehicles for the moving load analysis.
+
+The bridge girder runs along the global x axis. The influence lines of the
+element moments and shear forces are calculated once with the FE solver on a
+refined mesh and interpolated to a uniform grid of load positions. A vehicle
+is a load kernel on the same grid, so the responses of all vehicle positions
+are one convolution of the influence lines with the kernel.
+
+Author: Lukas Rauch
+"""
+
+import numpy as np
+from .fem import FemSolver
+from .load import MLC_CLASSES, LOAD_GEOMETRY
+
+# [kN/t]
+GRAVITY = 9.81
+
+
+def vehicle_loads(loadtype, loadclass, step=0.1):
+    """
+    Axle positions and axle loads of a MLC vehicle.
+
+    Wheeled vehicles are the axle loads of the load class database at the
+    axle spacings of the load geometry. The weight of tracked vehicles is
+    distributed over the track length with point loads of at most `step` spacing.
+
+    Returns
+    -------
+    positions : ndarray
+        Distance of the axles from the first axle [m].
+    loads : ndarray
+        Axle loads [kN].
+    """
+    if loadtype == 'mlc_wheeled':
+        positions = np.cumsum(LOAD_GEOMETRY[loadtype][loadclass]['spacing'])
+        loads = GRAVITY * np.array(MLC_CLASSES[loadtype][loadclass]['axis'], dtype=float)
+
+    elif loadtype == 'mlc_tracked':
+        length = LOAD_GEOMETRY[loadtype][loadclass]['total_length']
+        positions = np.linspace(0, length, max(2, int(np.ceil(length / step)) + 1))
+        loads = np.full(len(positions), 1.0)
+        loads[[0, -1]] = 0.5
+        loads *= GRAVITY * MLC_CLASSES[loadtype][loadclass]['weight'] / loads.sum()
+
+    else:
+        raise RuntimeError('The moving load analysis does not support the loadtype {}!' .format(loadtype))
+
+    return positions, loads
+
+
+class InfluenceLines(object):
+    """
+    Influence lines of the moments and shear forces of all elements of a model
+    for a vertical unit load [kN] moving along the girder.
+
+    Attributes
+    ---------
+    element_ids : list
+        IDs of the model elements.
+    step : float
+        Spacing of the load positions [m].
+    positions : ndarray
+        x coordinates of the load positions.
+    moment, shear : ndarray
+        Influence lines with one row per section and one column per load position.
+        Sagging moments are positive.
+    """
+
+    def __init__(self, model, step=0.1, supports=None):
+        """
+        Calculates the influence lines of a model. Every element is divided
+        into sub elements not longer than `step`, the unit loads at all
+        nodes of the mesh are solved as one block.
+        """
+        solver = model.get_fem_solver(supports)
+        self.element_ids = solver.element_ids
+        self.step = step
+
+        # === refined mesh
+        n_sub = np.maximum(1, np.ceil(solver.length / step).astype(np.int64))
+        n_nodes = len(solver.node_ids)
+        x = model._node_store.x[:n_nodes]
+        y = model._node_store.y[:n_nodes]
+
+        element = np.repeat(np.arange(len(n_sub)), n_sub)
+        first = np.cumsum(n_sub) - n_sub
+        local = np.arange(len(element)) - first[element]
+        t = (local + 1) / n_sub[element]
+
+        # interior nodes of the elements are appended to the model nodes
+        interior = local < n_sub[element] - 1
+        interior_index = n_nodes + np.cumsum(interior) - 1
+        node_b = np.where(interior, interior_index, solver.node_b[element])
+        node_a = np.empty_like(node_b)
+        node_a[first] = solver.node_a
+        node_a[local > 0] = node_b[np.flatnonzero(local > 0) - 1]
+
+        xa, xb = x[solver.node_a[element]], x[solver.node_b[element]]
+        ya, yb = y[solver.node_a[element]], y[solver.node_b[element]]
+        mesh_x = np.concatenate((x, (xa + t * (xb - xa))[interior]))
+        mesh_y = np.concatenate((y, (ya + t * (yb - ya))[interior]))
+
+        mesh = FemSolver(mesh_x, mesh_y, node_a, node_b, solver.EA[element], solver.EI[element], solver.supports)
+
+        # === unit loads at all mesh nodes
+        order = np.argsort(mesh_x, kind='stable')
+        if np.any(np.diff(mesh_x[order]) <= 0):
+            raise RuntimeError('The influence lines require a girder along the x axis without overlapping nodes!')
+
+        load = np.zeros((mesh.n_dof, len(mesh_x)), dtype=float)
+        load[3 * order + 1, np.arange(len(order))] = -1
+        u = mesh.displacements(load)
+
+        u_local = np.einsum('eij,ejp->eip', mesh.transformation, u[mesh.dofs])
+        f = np.einsum('eij,ejp->eip', mesh.local_stiffness, u_local)
+
+        # moment sections: start of every sub element and the end of the last one,
+        # shear sections: both ends of every sub element
+        last = first + n_sub - 1
+        moment = np.concatenate((-f[:, 2, :], f[last, 5, :]))
+        moment_element = np.concatenate((element, np.arange(len(n_sub))))
+        shear = np.concatenate((f[:, 1, :], -f[:, 4, :]))
+        shear_element = np.concatenate((element, element))
+
+        # the shear influence lines jump by the unit load at the section. The jump is
+        # removed before the interpolation and added again on the grid. The FE values
+        # of a load at the section node belong to the outer side of the sub element,
+        # on the grid a load at the section is on the inner side.
+        shear_x = mesh_x[np.concatenate((node_a, node_b))][:, np.newaxis]
+        shear_end = np.concatenate((np.zeros(len(element), dtype=bool), np.ones(len(element), dtype=bool)))[:, np.newaxis]
+        node_x = mesh_x[order]
+        shear = shear - np.where(shear_end, node_x >= shear_x, node_x > shear_x)
+
+        # === interpolation to a uniform grid of load positions
+        n_grid = int(round((node_x[-1] - node_x[0]) / step)) + 1
+        self.positions = node_x[0] + step * np.arange(n_grid)
+        upper = np.clip(np.searchsorted(node_x, self.positions, side='right'), 1, len(node_x) - 1)
+        lower = upper - 1
+        w = np.clip((self.positions - node_x[lower]) / (node_x[upper] - node_x[lower]), 0, 1)
+
+        sort_m = np.argsort(moment_element, kind='stable')
+        sort_q = np.argsort(shear_element, kind='stable')
+        moment = moment[sort_m]
+        shear = shear[sort_q]
+        self.moment = (1 - w) * moment[:, lower] + w * moment[:, upper]
+        self.shear = (1 - w) * shear[:, lower] + w * shear[:, upper]
+        shear_x = shear_x[sort_q]
+        self.shear += np.where(shear_end[sort_q], self.positions > shear_x, self.positions >= shear_x)
+        self._moment_start = np.searchsorted(moment_element[sort_m], np.arange(len(n_sub)))
+        self._shear_start = np.searchsorted(shear_element[sort_q], np.arange(len(n_sub)))
+
+        # spectra of the influence lines by FFT length
+        self._spectra = dict()
+
+    def kernel(self, loadtype, loadclass):
+        """
+        Load kernel of a vehicle on the grid of the load positions. The axle loads
+        are split linearly to the two neighbouring grid points.
+        """
+        positions, loads = vehicle_loads(loadtype, loadclass, self.step)
+        j = np.floor(positions / self.step + 1e-9).astype(np.int64)
+        t = np.clip(positions / self.step - j, 0, 1)
+
+        kernel = np.zeros(j[-1] + 2, dtype=float)
+        np.add.at(kernel, j, (1 - t) * loads)
+        np.add.at(kernel, j + 1, t * loads)
+
+        return kernel
+
+    def _spectrum(self, n_fft):
+        """
+        Cached FFT of the moment and shear influence lines.
+        """
+        if n_fft not in self._spectra:
+            self._spectra[n_fft] = (np.fft.rfft(self.moment, n_fft, axis=1), np.fft.rfft(self.shear, n_fft, axis=1))
+        return self._spectra[n_fft]
+
+    def responses(self, kernel):
+        """
+        Moments and shear forces of all sections for all positions of a load kernel
+        in both driving directions, including the positions with the vehicle
+        partially on the bridge.
+
+        Returns
+        -------
+        moment, shear : ndarray
+            Responses with one row per section.
+        """
+        n = self.moment.shape[1] + len(kernel) - 1
+        n_fft = 1 << (n - 1).bit_length()
+        moment_spectrum, shear_spectrum = self._spectrum(n_fft)
+
+        forward = np.fft.rfft(kernel[::-1], n_fft)
+        backward = np.fft.rfft(kernel, n_fft)
+        spectra = np.stack((forward, backward))[:, np.newaxis, :]
+
+        moment = np.fft.irfft(moment_spectrum * spectra, n_fft, axis=2)[..., :n]
+        shear = np.fft.irfft(shear_spectrum * spectra, n_fft, axis=2)[..., :n]
+
+        return np.concatenate(moment, axis=1), np.concatenate(shear, axis=1)
+
+    def envelope(self, loadtype, loadclass):
+        """
+        Maximum and minimum element forces of a vehicle crossing the bridge.
+
+        Returns
+        -------
+        envelope : ndarray
+            Structured array with one row per element and the fields
+            'id', 'moment_max', 'moment_min', 'shear'. The shear is the maximum absolute value.
+        """
+        moment, shear = self.responses(self.kernel(loadtype, loadclass))
+
+        results = np.empty(len(self.element_ids), dtype=[
+            ('id', object), ('moment_max', float), ('moment_min', float), ('shear', float)])
+        results['id'] = self.element_ids
+        results['moment_max'] = np.maximum.reduceat(moment.max(axis=1), self._moment_start)
+        results['moment_min'] = np.minimum.reduceat(moment.min(axis=1), self._moment_start)
+        results['shear'] = np.maximum.reduceat(np.abs(shear).max(axis=1), self._shear_start)
+
+        return results
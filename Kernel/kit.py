@@ -0,0 +1,266 @@
+"""
+This modul contains the KitEnumerator class, that generates the feasible
+layouts of a bridge kit (Behelfsbrueckenbausatz) for a gap.
+
+Author: Lukas Rauch
+"""
+
+from functools import partial
+import numpy as np
+from .model import Model
+from .eurocode import _admissible
+from .load import Load
+from .material import material_from_grade
+from .crosssection import rectangle_properties
+from .batch import BatchRunner
+
+
+def build_kit_model(name, spans, supports, elements, loadtype='mlc_wheeled', loadclass=40):
+    """
+    Builds the model of a kit layout: a girder of the elements `spans` (names
+    of the element types) from x = 0 with a substructure at every joint.
+
+    Parameters
+    ----------
+    spans : tuple
+        Names of the element types from the left to the right bank.
+    supports : tuple
+        Structure types of the interior substructures, the banks have none.
+    elements : dict
+        Element types name : {'length', 'hight', 'width', 'grade'}.
+    """
+    model = Model(name)
+    model.add_loadclass(id=1, loadtype=loadtype, loadclass=loadclass)
+
+    for span in dict.fromkeys(spans):
+        element = elements[span]
+        if element['grade'] not in model._materials:
+            model.add_material_from_grade(element['grade'])
+        model.add_crosssection(id=span, hight=element['hight'], width=element['width'])
+
+    x = 0.0
+    model.add_node(0, x, 0)
+    for i, span in enumerate(spans):
+        x += elements[span]['length']
+        model.add_node(i + 1, x, 0)
+        model.add_element(i, i, i + 1, crosssection=span, material=elements[span]['grade'])
+
+    model.add_substructure(list(range(len(spans) + 1)))
+    for i, structuretype in enumerate(supports):
+        model.update_substructure(i + 1, structuretype=structuretype)
+
+    return model
+
+
+def _evaluate_kit(model, lm1=False):
+    """
+    Solves a kit model. Runs in the worker processes of the batch runner.
+    """
+    results = model.solve_all_elements(1, lm1)
+    model.calc_supportforce_auto()
+    max_loadclass, bridge_loadclass = model.get_max_loadclass(lm1)
+    support = [node.support_y for node in model._nodes.values() if node.support_y is not None]
+
+    return {
+        'utilisation': float(np.max(_admissible(results))),
+        'mlc': bridge_loadclass,
+        'max_support': float(max(support)) if support else 0.0
+    }
+
+
+class KitEnumerator(object):
+    """
+    Enumerates all layouts of a bridge kit for a gap and ranks them.
+
+    A layout is a sequence of element types from bank to bank with a
+    substructure at every interior joint. The layouts are generated depth
+    first. A branch is pruned as soon as the inventory is exhausted, the
+    remaining gap cannot be reached with the remaining spans, or an interior
+    support force exceeds the capacity of all available substructures.
+    Element types that fail the design as single span are removed before.
+    The surviving layouts are solved with the BatchRunner.
+
+    Attributes
+    ---------
+    elements : dict
+        Element types name : {'length' [m], 'hight' [m], 'width' [m], 'grade', 'count'}.
+        'count' is the number of available elements, None for unlimited.
+    substructures : dict
+        Substructure types name : {'capacity' [kN], 'count'}.
+    loadtype, loadclass : str, int
+        Design load class of the layouts.
+    lm1 : bool
+        Consider LM1 in the forces.
+    overlap : float
+        Maximum length of the bridge beyond the gap (bearing on the banks) [m].
+    max_spans : int
+        Maximum number of spans, None for no limit.
+    mirrored : bool
+        Keep layouts that are the mirror image of another layout.
+    """
+
+    def __init__(self, elements, substructures, loadtype='mlc_wheeled', loadclass=40, lm1=False,
+                 overlap=0.5, max_spans=None, mirrored=False):
+        """
+        Create a new kit enumerator.
+        """
+        self.elements = elements
+        self.substructures = substructures
+        self.loadtype = loadtype
+        self.loadclass = loadclass
+        self.lm1 = lm1
+        self.overlap = overlap
+        self.max_spans = max_spans
+        self.mirrored = mirrored
+
+    def element_forces(self):
+        """
+        Characteristic moment, shear force and design utilisation of every element
+        type as single span. Element types outside of the load tables are infeasible.
+
+        Returns
+        -------
+        forces : dict
+            name : (moment, shear, utilisation)
+        """
+        model = Model('kit')
+        load = Load(None, self.loadtype, self.loadclass)
+        forces = dict()
+
+        for name, element in self.elements.items():
+            material = material_from_grade(element['grade'], element['grade'])
+            properties = rectangle_properties(element['hight'], element['width'])
+            try:
+                mk_max, qk_max = model._calc_forces_arrays(load, np.array([element['length']]), self.loadclass, self.lm1)
+            except (RuntimeError, KeyError):
+                forces[name] = (np.inf, np.inf, np.inf)
+                continue
+
+            nu = model.ec.design_check(mk_max, qk_max, properties['Wy'], properties['area'], material.fmk, material.fvk,
+                material.get_kcr() if material.materialtype == 'wood' else np.nan, material.materialtype)
+            forces[name] = (float(mk_max[0]), float(qk_max[0]), float(_admissible(nu)[0]))
+
+        return forces
+
+    def layouts(self, gap):
+        """
+        Generates the feasible layouts of a gap [m].
+
+        Returns
+        -------
+        layouts : generator
+            Tuples (spans, supports) of the element type names and the structure
+            types of the interior substructures. At every joint the weakest
+            substructure that carries the support force is used.
+        """
+        forces = self.element_forces()
+        types = sorted((name for name in self.elements if forces[name][2] <= 1.0),
+            key=lambda name: -self.elements[name]['length'])
+        if not types:
+            return
+
+        lengths = {name: self.elements[name]['length'] for name in types}
+        shortest = min(lengths.values())
+        longest = max(lengths.values())
+        count = {name: self.elements[name].get('count') for name in types}
+        supports = sorted(self.substructures, key=lambda name: self.substructures[name]['capacity'])
+        available = {name: self.substructures[name].get('count') for name in supports}
+        max_spans = self.max_spans or int(np.ceil((gap + self.overlap) / shortest))
+
+        spans = []
+        structures = []
+
+        def support(force):
+            for name in supports:
+                if self.substructures[name]['capacity'] >= force and available[name] != 0:
+                    return name
+            return None
+
+        def search(length):
+            if length >= gap:
+                if length <= gap + self.overlap and (self.mirrored or tuple(spans) <= tuple(reversed(spans))):
+                    yield tuple(spans), tuple(structures)
+                return
+            # the remaining spans can not reach the other bank
+            if len(spans) == max_spans or length + (max_spans - len(spans)) * longest < gap:
+                return
+
+            for name in types:
+                if count[name] == 0 or length + lengths[name] > gap + self.overlap:
+                    continue
+
+                structure = None
+                if spans:
+                    structure = support(forces[spans[-1]][1] + forces[name][1])
+                    if structure is None:
+                        continue
+                    structures.append(structure)
+                    if available[structure] is not None:
+                        available[structure] -= 1
+
+                spans.append(name)
+                if count[name] is not None:
+                    count[name] -= 1
+
+                for layout in search(length + lengths[name]):
+                    yield layout
+
+                spans.pop()
+                if count[name] is not None:
+                    count[name] += 1
+                if structure is not None:
+                    structures.pop()
+                    if available[structure] is not None:
+                        available[structure] += 1
+
+        for layout in search(0.0):
+            yield layout
+
+    def weight(self, spans):
+        """
+        Material weight of the elements of a layout [kg].
+        """
+        weight = 0.0
+        for name in spans:
+            element = self.elements[name]
+            density = material_from_grade(element['grade'], element['grade']).density
+            weight += element['length'] * rectangle_properties(element['hight'], element['width'])['area'] * density
+
+        return weight
+
+    def evaluate(self, gap, max_workers=1):
+        """
+        Solves all feasible layouts of a gap with the BatchRunner and ranks them
+        by the material weight and the maximum admissible MLC.
+
+        Returns
+        -------
+        layouts : ndarray
+            Structured array with the fields 'spans', 'supports' (tuples of type names),
+            'length' [m], 'weight' [kg], 'utilisation', 'mlc', 'max_support' [kN] and
+            'pareto', sorted by weight and descending MLC. Pareto layouts are
+            not outweighed by a lighter layout with an equal or higher MLC.
+        """
+        layouts = list(self.layouts(gap))
+        definitions = [partial(build_kit_model, 'kit_{}'.format(i), spans, supports, self.elements, self.loadtype, self.loadclass)
+            for i, (spans, supports) in enumerate(layouts)]
+
+        results = np.empty(len(layouts), dtype=[('spans', object), ('supports', object), ('length', float),
+            ('weight', float), ('utilisation', float), ('mlc', np.int64), ('max_support', float), ('pareto', bool)])
+        if not layouts:
+            return results
+
+        runner = BatchRunner(max_workers)
+        for result in runner.run(definitions, task=partial(_evaluate_kit, lm1=self.lm1)):
+            if not result.ok:
+                raise RuntimeError('The layout {} can not be solved:\n{}' .format(layouts[result.index][0], result.error))
+            spans, supports = layouts[result.index]
+            results[result.index] = (spans, supports, sum(self.elements[name]['length'] for name in spans),
+                self.weight(spans), result.results['utilisation'], result.results['mlc'], result.results['max_support'], False)
+
+        results = results[np.lexsort((-results['mlc'], results['weight']))]
+        best = np.maximum.accumulate(results['mlc'])
+        results['pareto'][0] = True
+        results['pareto'][1:] = results['mlc'][1:] > best[:-1]
+
+        return results
@@ -1,10 +1,355 @@
 """
-This modul only contains the load class
+This modul contains the load class and the load class database.
 
 Author: Lukas Rauch
 """
 
+import copy
 import numpy as np
+from .loadtable import LoadTable
+
+# === load class database
+# The databases are built once on import. The influence tables are stored as
+# LoadTable objects so a lookup is an index operation on a dense array.
+
+MLC_CLASSES = {
+    'mlc_wheeled': {
+        4:      {'weight' : 4.09	, 'axis' : [0.91	,1.59	,1.59   ]},
+        8:      {'weight' : 8.16	, 'axis' : [2.72	,2.72	,2.72   ]},
+        12:     {'weight' : 13.61	, 'axis' : [2.72	,4.54	,4.54	,1.81   ]},
+        16:     {'weight' : 16.79	, 'axis' : [2.72	,5.9	,5.9	,2.27   ]},
+        20:     {'weight' : 21.77	, 'axis' : [3.63	,7.71	,7.71	,2.72   ]},
+        24:     {'weight' : 25.4	, 'axis' : [4.54	,9.07	,9.07	,2.72	]},
+        30:     {'weight' : 30.84	, 'axis' : [5.44	,9.98	,9.98	,5.44	]},
+        40:     {'weight' : 42.63	, 'axis' : [6.35	,11.79	,11.79	,12.7	]},
+        50:     {'weight' : 52.62	, 'axis' : [7.26	,13.61	,13.61	,18.14	]},
+        60:     {'weight' : 63.5	, 'axis' : [7.26	,16.33	,16.33	,11.79	,11.79	]},
+        70:     {'weight' : 73.02	, 'axis' : [9.52	,19.05	,19.05	,12.7	,12.7	]},
+        80:     {'weight' : 83.45	, 'axis' : [10.89	,21.77	,21.77	,14.51	,14.51  ]},
+        90:     {'weight' : 93.89	, 'axis' : [12.25	,24.49	,24.49	,16.33	,16.33	]},
+        100:    {'weight' : 104.33	, 'axis' : [13.61	,27.22	,27.22	,18.14	,18.14	]},
+        120:    {'weight' : 125.19	, 'axis' : [16.33	,32.66	,32.66	,21.77	,21.77	]},
+        150:    {'weight' : 154.22	, 'axis' : [19.96	,38.1	,38.1	,29.03	,29.03	]}},
+    'mlc_tracked': {
+        4	:   {'weight' : 3.63},
+        8	:   {'weight' : 7.26},
+        12	:   {'weight' : 10.88},
+        16	:   {'weight' : 14.51},
+        20	:   {'weight' : 18.14},
+        24	:   {'weight' : 21.77},
+        30	:   {'weight' : 27.22},
+        40	:   {'weight' : 36.29},
+        50	:   {'weight' : 45.36},
+        60	:   {'weight' : 54.43},
+        70	:   {'weight' : 63.50},
+        80	:   {'weight' : 72.58},
+        90	:   {'weight' : 81.65},
+        100	:   {'weight' : 90.72},
+        120	:   {'weight' : 108.86},
+        150	:   {'weight' : 136.08}},
+    'lm' : {
+        1   :   {'line_load' : 300, 'single_load' : 12}
+    }
+}
+
+LOAD_GEOMETRY = {
+    'mlc_wheeled' :{
+        4	: {'total_length' : 3.66	, 'spacing' : [0.00,    2.44	,1.22 ]},
+        8	: {'total_length' : 4.27	, 'spacing' : [0.00,    3.05	,1.22 ]},
+        12	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
+        16	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
+        20	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
+        24	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
+        30	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
+        40	: {'total_length' : 9.76	, 'spacing' : [0.00,    3.66	,1.22	,4.88 ]},
+        50	: {'total_length' : 9.76	, 'spacing' : [0.00,    3.66	,1.22	,4.88 ]},
+        60	: {'total_length' : 10.97	, 'spacing' : [0.00,    3.66	,1.52	,4.57	,1.22 ]},
+        70	: {'total_length' : 10.97	, 'spacing' : [0.00,    3.66	,1.52	,4.57	,1.22 ]},
+        80	: {'total_length' : 12.19	, 'spacing' : [0.00,    3.66	,1.52	,5.49	,1.52 ]},
+        90	: {'total_length' : 12.19	, 'spacing' : [0.00,    3.66	,1.52	,5.49	,1.52 ]},
+        100	: {'total_length' : 13.11	, 'spacing' : [0.00,    3.66	,1.68	,6.25	,1.52 ]},
+        120	: {'total_length' : 13.11	, 'spacing' : [0.00,    3.66	,1.83	,6.10	,1.52 ]},
+        150	: {'total_length' : 14.33	, 'spacing' : [0.00,    3.66	,2.13	,6.71	,1.83 ]}
+    },
+    'mlc_tracked' :{
+        4	: { 'total_length' : 1.83, 'width' :	1.83, 'chain_width' : 0.30 },
+        8	: { 'total_length' : 1.98, 'width' :	1.98, 'chain_width' : 0.30 },
+        12	: { 'total_length' : 2.74, 'width' :	2.03, 'chain_width' : 0.30 },
+        16	: { 'total_length' : 2.74, 'width' :	2.13, 'chain_width' : 0.30 },
+        20	: { 'total_length' : 2.74, 'width' :	2.44, 'chain_width' : 0.41 },
+        24	: { 'total_length' : 2.74, 'width' :	2.54, 'chain_width' : 0.46 },
+        30	: { 'total_length' : 3.35, 'width' :	2.54, 'chain_width' : 0.46 },
+        40	: { 'total_length' : 3.66, 'width' :	2.84, 'chain_width' : 0.56 },
+        50	: { 'total_length' : 3.96, 'width' :	3.25, 'chain_width' : 0.66 },
+        60	: { 'total_length' : 4.27, 'width' :	3.35, 'chain_width' : 0.71 },
+        70	: { 'total_length' : 4.57, 'width' :	3.51, 'chain_width' : 0.79 },
+        80	: { 'total_length' : 4.88, 'width' :	3.66, 'chain_width' : 0.84 },
+        90	: { 'total_length' : 5.18, 'width' :	3.81, 'chain_width' : 0.89 },
+        100	: { 'total_length' : 5.49, 'width' :	3.96, 'chain_width' : 0.94 },
+        120	: { 'total_length' : 6.10, 'width' :	4.27, 'chain_width' : 1.02 },
+        150	: { 'total_length' : 7.32, 'width' :	4.67, 'chain_width' : 1.27 }
+    },
+    'lm' : {
+        1   : { 'total_length' : 1.20, 'width' : 2.00,  'spacing' : 1.20} 
+    }
+}
+
+_unit_moment_mlc_data = {
+    'mlc_wheeled' : {
+        1	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 26.71, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.73, 100:   71.20, 120:  80.10, 150:  93.44},
+        1.5	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 26.71, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.73, 100:   71.20, 120:  80.10, 150:  93.44},
+        2	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 26.71, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.73, 100:   71.20, 120:  80.10, 150:  93.44},
+        2.5	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 26.71, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.73, 100:   71.20, 120:  80.10, 150:  93.44},
+        3	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 28.24, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.97, 100:   71.20, 120:  80.10, 150:  93.44},
+        3.5	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 25.78, 24: 30.33, 30:  33.38, 40:  39.43, 50:  45.52, 60:  51.16, 70:  57.27, 80:  65.44, 90:  73.62, 100:   77.12, 120:  87.39, 150:  93.44},
+        4	: {4:  5.60, 8: 12.24, 12: 17.81, 16: 21.14, 20: 27.16, 24: 31.95, 30:  35.16, 40:  41.54, 50:  47.95, 60:  52.55, 70:  61.31, 80:  70.06, 90:  78.81, 100:   83.33, 120:  95.29, 150: 100.61},
+        4.5	: {4:  5.83, 8: 12.24, 12: 17.81, 16: 21.63, 20: 28.26, 24: 33.25, 30:  36.58, 40:  43.21, 50:  49.89, 60:  55.33, 70:  64.54, 80:  73.76, 90:  82.98, 100:   88.32, 120: 101.67, 150: 108.89},
+        5	: {4:  6.01, 8: 12.24, 12: 17.81, 16: 22.31, 20: 29.15, 24: 34.30, 30:  37.74, 40:  44.58, 50:  51.46, 60:  57.60, 70:  67.19, 80:  76.79, 90:  86.38, 100:   92.42, 120: 106.93, 150: 115.75},
+        5.5	: {4:  6.32, 8: 12.24, 12: 17.81, 16: 22.88, 20: 29.89, 24: 35.17, 30:  38.70, 40:  45.71, 50:  52.77, 60:  59.49, 70:  69.40, 80:  79.31, 90:  89.22, 100:   95.85, 120: 111.33, 150: 121.51},
+        6	: {4:  6.63, 8: 12.24, 12: 17.97, 16: 23.35, 20: 30.52, 24: 35.90, 30:  39.50, 40:  46.67, 50:  53.87, 60:  61.09, 70:  71.27, 80:  81.44, 90:  91.62, 100:   98.75, 120: 115.06, 150: 126.43},
+        7	: {4:  7.12, 8: 12.24, 12: 19.28, 16: 24.76, 20: 32.38, 24: 38.18, 30:  42.17, 40:  48.19, 50:  55.63, 60:  63.65, 70:  74.25, 80:  84.85, 90:  95.46, 100:  103.39, 120: 121.05, 150: 134.34},
+        8	: {4:  7.48, 8: 13.01, 12: 20.48, 16: 26.11, 20: 34.17, 24: 40.36, 30:  44.69, 40:  50.44, 50:  58.20, 60:  66.40, 70:  77.70, 80:  88.80, 90:  99.89, 100:  108.32, 120: 126.96, 150: 141.31},
+        9	: {4:  7.76, 8: 13.77, 12: 21.42, 16: 27.17, 20: 35.56, 24: 42.06, 30:  46.64, 40:  52.98, 50:  61.12, 60:  69.90, 70:  82.04, 80:  93.76, 90: 105.47, 100:  114.83, 120: 135.10, 150: 151.81},
+        10	: {4:  7.99, 8: 14.39, 12: 22.33, 16: 28.29, 20: 36.99, 24: 43.67, 30:  48.89, 40:  55.01, 50:  63.46, 60:  72.70, 70:  85.51, 80:  97.73, 90: 109.94, 100:  120.04, 120: 141.61, 150: 160.21},
+        11	: {4:  8.18, 8: 14.90, 12: 23.33, 16: 29.45, 20: 38.47, 24: 45.35, 30:  51.29, 40:  56.81, 50:  66.89, 60:  75.81, 70:  88.35, 80: 100.98, 90: 113.60, 100:  124.29, 120: 146.95, 150: 167.08},
+        12	: {4:  8.33, 8: 15.32, 12: 24.16, 16: 30.42, 20: 39.70, 24: 46.76, 30:  53.30, 40:  60.78, 50:  72.03, 60:  81.25, 70:  93.97, 80: 103.69, 90: 116.64, 100:  127.84, 120: 151.39, 150: 172.81},
+        13	: {4:  8.46, 8: 15.67, 12: 24.87, 16: 31.24, 20: 40.75, 24: 47.95, 30:  55.00, 40:  64.14, 50:  76.39, 60:  86.91, 70: 100.47, 80: 105.98, 90: 119.22, 100:  130.85, 120: 155.15, 150: 177.66},
+        14	: {4:  8.57, 8: 15.98, 12: 25.47, 16: 31.94, 20: 41.64, 24: 48.97, 30:  56.45, 40:  67.02, 50:  80.12, 60:  91.77, 70: 106.05, 80: 111.02, 90: 124.90, 100:  133.42, 120: 158.37, 150: 181.81},
+        15	: {4:  8.67, 8: 16.25, 12: 26.00, 16: 32.55, 20: 42.42, 24: 49.85, 30:  57.72, 40:  69.52, 50:  83.36, 60:  95.99, 70: 110.89, 80: 117.19, 90: 131.84, 100:  135.92, 120: 162.44, 150: 185.41},
+        16	: {4:  8.76, 8: 16.48, 12: 26.46, 16: 33.09, 20: 43.10, 24: 50.63, 30:  58.83, 40:  71.70, 50:  86.20, 60:  99.69, 70: 115.13, 80: 122.59, 90: 137.92, 100:  143.30, 120: 171.36, 150: 188.57},
+        17	: {4:  8.83, 8: 16.69, 12: 26.86, 16: 33.56, 20: 43.71, 24: 51.31, 30:  59.81, 40:  73.63, 50:  88.71, 60: 102.96, 70: 118.87, 80: 127.36, 90: 143.29, 100:  149.83, 120: 179.25, 150: 197.06},
+        18	: {4:  8.90, 8: 16.87, 12: 27.22, 16: 33.98, 20: 44.24, 24: 51.92, 30:  60.68, 40:  75.35, 50:  90.94, 60: 105.86, 70: 122.19, 80: 131.61, 90: 148.07, 100:  155.64, 120: 186.27, 150: 206.95},
+        19	: {4:  8.96, 8: 17.04, 12: 27.55, 16: 34.36, 20: 44.72, 24: 52.47, 30:  61.46, 40:  76.88, 50:  92.94, 60: 108.47, 70: 125.17, 80: 135.42, 90: 152.35, 100:  160.85, 120: 192.56, 150: 215.82},
+        20	: {4:  9.01, 8: 17.18, 12: 27.84, 16: 34.70, 20: 45.15, 24: 52.96, 30:  62.17, 40:  78.26, 50:  94.73, 60: 110.81, 70: 127.86, 80: 138.85, 90: 156.21, 100:  165.54, 120: 198.22, 150: 223.81},
+        22	: {4:  9.10, 8: 17.44, 12: 28.34, 16: 35.28, 20: 45.90, 24: 53.80, 30:  63.38, 40:  80.65, 50:  97.84, 60: 114.87, 70: 132.49, 80: 144.78, 90: 162.89, 100:  173.67, 120: 208.02, 150: 237.65},
+        24	: {4:  9.18, 8: 17.65, 12: 28.76, 16: 35.77, 20: 46.52, 24: 54.51, 30:  64.40, 40:  82.64, 50: 100.43, 60: 118.25, 70: 136.36, 80: 149.73, 90: 168.46, 100:  180.45, 120: 216.21, 150: 249.21},
+        26	: {4:  9.25, 8: 17.83, 12: 29.11, 16: 36.19, 20: 47.05, 24: 55.11, 30:  65.26, 40:  84.32, 50: 102.63, 60: 121.12, 70: 139.64, 80: 153.93, 90: 173.18, 100:  186.20, 120: 223.14, 150: 259.02},
+        28	: {4:  9.30, 8: 17.99, 12: 29.42, 16: 36.54, 20: 47.50, 24: 55.62, 30:  66.00, 40:  85.77, 50: 104.51, 60: 123.58, 70: 142.44, 80: 157.53, 90: 177.23, 100:  191.13, 120: 229.09, 150: 267.44},
+        30	: {4:  9.35, 8: 18.12, 12: 29.68, 16: 36.85, 20: 47.89, 24: 56.06, 30:  66.63, 40:  87.02, 50: 106.14, 60: 125.71, 70: 144.88, 80: 160.65, 90: 180.74, 100:  195.41, 120: 234.25, 150: 274.75},
+        35	: {4:  9.45, 8: 18.39, 12: 30.21, 16: 37.47, 20: 48.67, 24: 56.95, 30:  67.92, 40:  89.52, 50: 109.40, 60: 129.98, 70: 149.75, 80: 166.90, 90: 187.78, 100:  203.99, 120: 244.59, 150: 289.40},
+        40	: {4:  9.52, 8: 18.59, 12: 30.60, 16: 37.93, 20: 49.26, 24: 57.62, 30:  68.88, 40:  91.40, 50: 111.85, 60: 133.19, 70: 153.41, 80: 171.60, 90: 193.06, 100:  210.44, 120: 252.35, 150: 300.42},
+        45	: {4:  9.58, 8: 18.75, 12: 30.91, 16: 38.29, 20: 49.72, 24: 58.14, 30:  69.63, 40:  92.86, 50: 113.76, 60: 135.68, 70: 156.26, 80: 175.26, 90: 197.18, 100:  215.46, 120: 258.40, 150: 309.00},
+        50	: {4:  9.62, 8: 18.88, 12: 31.16, 16: 38.58, 20: 50.09, 24: 58.55, 30:  70.22, 40:  94.03, 50: 115.29, 60: 137.68, 70: 158.53, 80: 178.19, 90: 200.48, 100:  219.48, 120: 263.24, 150: 315.88},
+        55	: {4:  9.66, 8: 18.98, 12: 31.36, 16: 38.81, 20: 50.39, 24: 58.89, 30:  70.72, 40:  94.98, 50: 116.54, 60: 139.32, 70: 160.40, 80: 180.59, 90: 203.18, 100:  222.77, 120: 267.21, 150: 321.52},
+        60	: {4: 10.03, 8: 19.52, 12: 31.53, 16: 39.01, 20: 50.64, 24: 59.18, 30:  71.12, 40:  95.78, 50: 117.58, 60: 140.68, 70: 161.95, 80: 182.59, 90: 205.43, 100:  225.52, 120: 270.52, 150: 326.22},
+        65	: {4: 10.70, 8: 20.91, 12: 31.74, 16: 39.24, 20: 50.93, 24: 59.52, 30:  71.66, 40:  96.45, 50: 118.46, 60: 141.84, 70: 163.27, 80: 184.28, 90: 207.33, 100:  227.85, 120: 273.32, 150: 330.20},
+        70	: {4: 11.29, 8: 22.12, 12: 33.81, 16: 41.81, 20: 54.25, 24: 63.41, 30:  76.46, 40: 100.27, 50: 123.52, 60: 144.98, 70: 166.74, 80: 186.90, 90: 210.28, 100:  230.74, 120: 276.53, 150: 333.62},
+        75	: {4: 11.81, 8: 23.19, 12: 35.72, 16: 44.15, 20: 57.28, 24: 66.95, 30:  80.79, 40: 106.57, 50: 131.30, 60: 154.26, 70: 177.32, 80: 196.64, 90: 221.23, 100:  240.47, 120: 288.40, 150: 345.05},
+        80	: {4: 12.71, 8: 24.54, 12: 37.42, 16: 46.24, 20: 59.99, 24: 70.11, 30:  84.66, 40: 112.23, 50: 138.46, 60: 163.01, 70: 187.35, 80: 208.43, 90: 234.51, 100:  255.00, 120: 305.84, 150: 364.88},
+        85	: {4: 13.73, 8: 26.63, 12: 38.95, 16: 48.12, 20: 62.43, 24: 72.95, 30:  88.13, 40: 117.31, 50: 144.93, 60: 170.84, 70: 196.34, 80: 219.01, 90: 246.41, 100:  268.53, 120: 322.10, 150: 385.63},
+        90	: {4: 14.64, 8: 28.48, 12: 41.89, 16: 51.76, 20: 67.15, 24: 78.41, 30:  94.72, 40: 121.93, 50: 150.74, 60: 177.90, 70: 204.44, 80: 228.54, 90: 257.13, 100:  280.73, 120: 336.74, 150: 404.31},
+        95	: {4: 15.45, 8: 30.14, 12: 44.96, 16: 55.54, 20: 72.04, 24: 84.12, 30: 101.68, 40: 130.88, 50: 161.15, 60: 186.09, 70: 214.10, 80: 237.18, 90: 266.85, 100:  291.77, 120: 350.00, 150: 421.22},
+        100	: {4: 16.18, 8: 31.64, 12: 47.72, 16: 58.94, 20: 76.45, 24: 89.25, 30: 107.94, 40: 140.02, 50: 172.45, 60: 199.86, 70: 229.92, 80: 251.29, 90: 282.73, 100:  306.04, 120: 366.96, 150: 437.06} 
+    },
+    'mlc_tracked' : {
+        1	: {4:  2.43, 8:  4.50, 12:  4.87, 16:  6.49, 20:  8.12, 24:  9.74, 30:   9.96, 40:  12.16, 50:  14.05, 60:  15.63, 70:  17.04, 80:  18.24, 90:  19.33, 100:  20.26, 120:  21.88, 150:  22.80},
+        1.5	: {4:  3.65, 8:  6.74, 12:  7.30, 16:  9.74, 20: 12.18, 24: 14.61, 30:  14.95, 40:  18.24, 50:  21.07, 60:  23.45, 70:  25.56, 80:  27.36, 90:  28.99, 100:  30.40, 120:  32.83, 150:  34.19},
+        2	: {4:  4.83, 8:  8.99, 12:  9.74, 16: 12.99, 20: 16.24, 24: 19.49, 30:  19.93, 40:  24.32, 50:  28.09, 60:  31.26, 70:  34.08, 80:  36.48, 90:  38.66, 100:  40.53, 120:  43.77, 150:  45.59},
+        2.5	: {4:  5.64, 8: 10.75, 12: 12.17, 16: 16.23, 20: 20.30, 24: 24.36, 30:  24.91, 40:  30.40, 50:  35.12, 60:  39.08, 70:  42.60, 80:  45.60, 90:  48.32, 100:  50.66, 120:  54.71, 150:  56.99},
+        3	: {4:  6.19, 8: 11.93, 12: 14.50, 16: 19.34, 20: 24.17, 24: 29.01, 30:  29.89, 40:  36.48, 50:  42.14, 60:  46.89, 70:  51.12, 80:  54.71, 90:  57.99, 100:  60.79, 120:  65.65, 150:  68.39},
+        3.5	: {4:  6.58, 8: 12.77, 12: 16.24, 16: 21.66, 20: 27.07, 24: 32.49, 30:  34.81, 40:  42.56, 50:  49.16, 60:  54.71, 70:  59.64, 80:  63.83, 90:  67.65, 100:  70.92, 120:  76.59, 150:  79.79},
+        4	: {4:  6.87, 8: 13.40, 12: 17.54, 16: 23.40, 20: 29.25, 24: 35.11, 30:  38.80, 40:  48.28, 50:  56.18, 60:  62.52, 70:  68.16, 80:  72.95, 90:  77.32, 100:  81.05, 120:  87.53, 150:  91.19},
+        4.5	: {4:  7.09, 8: 13.89, 12: 18.56, 16: 24.75, 20: 30.94, 24: 37.14, 30:  41.91, 40:  52.81, 50:  62.30, 60:  70.16, 70:  76.67, 80:  82.07, 90:  86.98, 100:  91.19, 120:  98.48, 150: 102.58},
+        5	: {4:  7.27, 8: 14.28, 12: 19.37, 16: 25.84, 20: 32.30, 24: 38.76, 30:  44.39, 40:  56.43, 50:  67.19, 60:  76.49, 70:  84.56, 80:  91.14, 90:  96.64, 100: 101.32, 120: 109.42, 150: 113.98},
+        5.5	: {4:  7.42, 8: 14.60, 12: 20.04, 16: 26.72, 20: 33.41, 24: 40.09, 30:  46.43, 40:  59.39, 50:  71.20, 60:  81.67, 70:  91.03, 80:  99.03, 90: 105.95, 100: 111.45, 120: 120.36, 150: 125.38},
+        6	: {4:  7.55, 8: 14.87, 12: 20.59, 16: 27.46, 20: 34.33, 24: 41.20, 30:  48.12, 40:  61.86, 50:  74.53, 60:  85.99, 70:  96.43, 80: 105.62, 90: 113.81, 100: 120.70, 120: 131.30, 150: 136.78},
+        7	: {4:  7.74, 8: 15.29, 12: 21.46, 16: 28.62, 20: 35.78, 24: 42.94, 30:  50.78, 40:  65.73, 50:  79.78, 60:  92.78, 70: 104.90, 80: 115.96, 90: 126.16, 100: 135.24, 120: 150.65, 150: 159.57},
+        8	: {4:  7.88, 8: 15.60, 12: 22.11, 16: 29.49, 20: 36.87, 24: 44.25, 30:  52.78, 40:  68.64, 50:  83.71, 60:  97.87, 70: 111.25, 80: 123.71, 90: 135.42, 100: 146.15, 120: 165.19, 150: 181.05},
+        9	: {4:  8.00, 8: 15.85, 12: 22.62, 16: 30.17, 20: 37.72, 24: 45.26, 30:  54.33, 40:  70.90, 50:  86.77, 60: 101.82, 70: 116.20, 80: 129.74, 90: 142.62, 100: 154.63, 120: 176.50, 150: 198.02},
+        10	: {4:  8.09, 8: 16.04, 12: 23.03, 16: 30.71, 20: 38.39, 24: 46.08, 30:  55.58, 40:  72.71, 50:  89.22, 60: 104.99, 70: 120.15, 80: 134.57, 90: 148.38, 100: 161.42, 120: 185.55, 150: 211.59},
+        11	: {4:  8.16, 8: 16.20, 12: 23.36, 16: 31.15, 20: 38.95, 24: 46.74, 30:  56.59, 40:  74.20, 50:  91.22, 60: 107.58, 70: 123.38, 80: 138.52, 90: 153.10, 100: 166.97, 120: 192.95, 150: 222.69},
+        12	: {4:  8.22, 8: 16.34, 12: 23.64, 16: 31.52, 20: 39.41, 24: 47.30, 30:  57.44, 40:  75.43, 50:  92.89, 60: 109.74, 70: 126.08, 80: 141.81, 90: 157.03, 100: 171.60, 120: 199.12, 150: 231.95},
+        13	: {4:  8.28, 8: 16.45, 12: 23.87, 16: 31.84, 20: 39.80, 24: 47.76, 30:  58.16, 40:  76.47, 50:  94.30, 60: 111.57, 70: 128.36, 80: 144.59, 90: 160.35, 100: 175.51, 120: 204.34, 150: 239.78},
+        14	: {4:  8.32, 8: 16.55, 12: 24.07, 16: 32.10, 20: 40.14, 24: 48.17, 30:  58.77, 40:  77.37, 50:  95.51, 60: 113.13, 70: 130.32, 80: 146.98, 90: 163.20, 100: 178.87, 120: 208.82, 150: 246.49},
+        15	: {4:  8.36, 8: 16.63, 12: 24.25, 16: 32.34, 20: 40.43, 24: 48.52, 30:  59.30, 40:  78.14, 50:  96.56, 60: 114.49, 70: 132.01, 80: 149.05, 90: 165.67, 100: 181.78, 120: 212.69, 150: 252.31},
+        16	: {4:  8.39, 8: 16.70, 12: 24.40, 16: 32.54, 20: 40.68, 24: 48.82, 30:  59.77, 40:  78.82, 50:  97.48, 60: 115.68, 70: 133.49, 80: 150.86, 90: 167.83, 100: 184.32, 120: 216.09, 150: 257.39},
+        17	: {4:  8.42, 8: 16.77, 12: 24.53, 16: 32.72, 20: 40.90, 24: 49.09, 30:  60.18, 40:  79.42, 50:  98.29, 60: 116.73, 70: 134.80, 80: 152.45, 90: 169.74, 100: 186.57, 120: 219.08, 150: 261.89},
+        18	: {4:  8.45, 8: 16.83, 12: 24.65, 16: 32.88, 20: 41.10, 24: 49.33, 30:  60.55, 40:  79.95, 50:  99.01, 60: 117.66, 70: 135.96, 80: 153.87, 90: 171.43, 100: 188.56, 120: 221.74, 150: 265.88},
+        19	: {4:  8.47, 8: 16.88, 12: 24.76, 16: 33.02, 20: 41.28, 24: 49.54, 30:  60.87, 40:  80.43, 50:  99.65, 60: 118.49, 70: 137.01, 80: 155.14, 90: 172.95, 100: 190.35, 120: 224.12, 150: 269.45},
+        20	: {4:  8.50, 8: 16.92, 12: 24.86, 16: 33.15, 20: 41.44, 24: 49.73, 30:  61.17, 40:  80.86, 50: 100.23, 60: 119.24, 70: 137.94, 80: 156.29, 90: 174.32, 100: 191.95, 120: 226.27, 150: 272.66},
+        22	: {4:  8.53, 8: 17.00, 12: 25.02, 16: 33.37, 20: 41.72, 24: 50.07, 30:  61.67, 40:  81.60, 50: 101.23, 60: 120.54, 70: 139.56, 80: 158.26, 90: 176.67, 100: 194.73, 120: 229.97, 150: 278.22},
+        24	: {4:  8.56, 8: 17.07, 12: 25.16, 16: 33.55, 20: 41.95, 24: 50.34, 30:  62.10, 40:  82.22, 50: 102.07, 60: 121.62, 70: 140.91, 80: 159.91, 90: 178.64, 100: 197.04, 120: 233.05, 150: 282.84},
+        26	: {4:  8.59, 8: 17.13, 12: 25.28, 16: 33.71, 20: 42.14, 24: 50.58, 30:  62.46, 40:  82.74, 50: 102.77, 60: 122.53, 70: 142.05, 80: 161.30, 90: 180.30, 100: 199.00, 120: 235.66, 150: 286.76},
+        28	: {4:  8.61, 8: 17.18, 12: 25.38, 16: 33.85, 20: 42.31, 24: 50.78, 30:  62.76, 40:  83.18, 50: 103.38, 60: 123.31, 70: 143.03, 80: 162.49, 90: 181.72, 100: 200.68, 120: 237.90, 150: 290.11},
+        30	: {4:  8.63, 8: 17.22, 12: 25.47, 16: 33.96, 20: 42.46, 24: 50.95, 30:  63.03, 40:  83.57, 50: 103.90, 60: 123.99, 70: 143.87, 80: 163.53, 90: 182.96, 100: 202.13, 120: 239.84, 150: 293.02},
+        35	: {4:  8.67, 8: 17.30, 12: 25.64, 16: 34.19, 20: 42.75, 24: 51.30, 30:  63.56, 40:  84.35, 50: 104.95, 60: 125.35, 70: 145.57, 80: 165.59, 90: 185.43, 100: 205.04, 120: 243.71, 150: 298.84},
+        40	: {4:  8.70, 8: 17.36, 12: 25.77, 16: 34.37, 20: 42.97, 24: 51.56, 30:  63.96, 40:  84.93, 50: 105.74, 60: 126.37, 70: 146.84, 80: 167.14, 90: 187.28, 100: 207.22, 120: 246.62, 150: 303.20},
+        45	: {4:  8.72, 8: 17.41, 12: 25.87, 16: 34.50, 20: 43.13, 24: 51.77, 30:  64.27, 40:  85.38, 50: 106.35, 60: 127.16, 70: 147.83, 80: 168.35, 90: 188.72, 100: 208.92, 120: 248.88, 150: 306.59},
+        50	: {4:  8.74, 8: 17.45, 12: 25.95, 16: 34.61, 20: 43.27, 24: 51.93, 30:  64.52, 40:  85.74, 50: 106.84, 60: 127.79, 70: 148.62, 80: 169.32, 90: 189.87, 100: 210.28, 120: 250.69, 150: 309.31},
+        55	: {4:  8.76, 8: 17.49, 12: 26.02, 16: 34.70, 20: 43.38, 24: 52.06, 30:  64.72, 40:  86.04, 50: 107.24, 60: 128.31, 70: 149.26, 80: 170.11, 90: 190.82, 100: 211.39, 120: 252.17, 150: 311.53},
+        60	: {4:  9.40, 8: 18.71, 12: 27.41, 16: 36.56, 20: 45.71, 24: 54.85, 30:  67.33, 40:  88.91, 50: 110.10, 60: 130.83, 70: 151.20, 80: 171.12, 90: 191.60, 100: 212.31, 120: 253.41, 150: 313.38},
+        65	: {4:  9.96, 8: 19.84, 12: 29.14, 16: 38.87, 20: 48.59, 24: 58.31, 30:  71.73, 40:  94.84, 50: 117.58, 60: 139.90, 70: 161.86, 80: 183.42, 90: 204.61, 100: 225.35, 120: 265.73, 150: 320.51},
+        70	: {4: 10.45, 8: 20.83, 12: 30.66, 16: 40.89, 20: 51.12, 24: 61.35, 30:  75.61, 40: 100.05, 50: 124.16, 60: 147.86, 70: 171.24, 80: 194.23, 90: 216.88, 100: 239.11, 120: 282.54, 150: 342.23},
+        75	: {4: 11.25, 8: 22.34, 12: 32.26, 16: 43.02, 20: 53.78, 24: 64.55, 30:  79.03, 40: 104.67, 50: 129.98, 60: 154.91, 70: 179.54, 80: 203.81, 90: 227.75, 100: 251.30, 120: 297.42, 150: 361.47},
+        80	: {4: 12.22, 8: 24.28, 12: 35.25, 16: 47.00, 20: 58.76, 24: 70.52, 30:  85.89, 40: 112.95, 50: 139.31, 60: 164.84, 70: 189.67, 80: 213.69, 90: 237.43, 100: 262.16, 120: 310.68, 150: 378.62},
+        85	: {4: 13.07, 8: 25.99, 12: 37.88, 16: 50.52, 20: 63.16, 24: 75.80, 30:  92.62, 40: 122.02, 50: 150.74, 60: 178.70, 70: 206.00, 80: 232.53, 90: 258.41, 100: 283.47, 120: 331.53, 150: 394.00},
+        90	: {4: 13.83, 8: 27.52, 12: 40.22, 16: 53.64, 20: 67.06, 24: 80.48, 30:  98.60, 40: 130.07, 50: 160.91, 60: 191.02, 70: 220.51, 80: 249.28, 90: 277.43, 100: 304.80, 120: 357.60, 150: 426.66},
+        95	: {4: 14.50, 8: 28.88, 12: 42.32, 16: 56.44, 20: 70.56, 24: 84.68, 30: 103.95, 40: 137.28, 50: 170.01, 60: 202.04, 70: 233.49, 80: 264.27, 90: 294.45, 100: 323.89, 120: 380.94, 150: 456.90},
+        100	: {4: 15.11, 8: 30.11, 12: 44.21, 16: 58.96, 20: 73.70, 24: 88.45, 30: 108.76, 40: 143.76, 50: 178.19, 60: 211.96, 70: 245.18, 80: 277.76, 90: 309.76, 100: 341.07, 120: 401.94, 150: 484.12}
+    }
+}
+
+_shear_mlc_data = {
+    'mlc_wheeled' : {
+        1	: {4: 22.27, 8: 48.95, 12:  71.22, 16:  84.56, 20:  97.90, 24: 106.83, 30: 129.00, 40: 151.27, 50: 177.95, 60: 204.64, 70: 226.91, 80: 249.17, 90: 266.93, 100: 284.78, 120: 320.40, 150:  373.76},
+        1.5	: {4: 22.27, 8: 48.95, 12:  71.22, 16:  84.56, 20:  97.90, 24: 106.83, 30: 129.00, 40: 151.27, 50: 177.95, 60: 204.64, 70: 226.91, 80: 249.17, 90: 266.93, 100: 284.78, 120: 320.40, 150:  373.76},
+        2	: {4: 22.27, 8: 48.95, 12:  71.22, 16:  84.56, 20: 105.13, 24: 123.68, 30: 136.09, 40: 160.77, 50: 185.59, 60: 204.64, 70: 231.73, 80: 264.82, 90: 297.91, 100: 309.75, 120: 347.63, 150:  373.76},
+        2.5	: {4: 23.58, 8: 48.95, 12:  71.22, 16:  87.51, 20: 114.36, 24: 134.53, 30: 148.03, 40: 174.88, 50: 201.87, 60: 223.00, 70: 260.14, 80: 297.28, 90: 334.42, 100: 354.61, 120: 406.26, 150:  429.08},
+        3	: {4: 24.85, 8: 48.95, 12:  71.22, 16:  92.22, 20: 120.51, 24: 141.77, 30: 155.99, 40: 184.29, 50: 212.73, 60: 239.23, 70: 279.08, 80: 318.92, 90: 358.77, 100: 384.52, 120: 445.35, 150:  482.15},
+        3.5	: {4: 25.76, 8: 48.95, 12:  73.55, 16:  95.58, 20: 124.91, 24: 146.94, 30: 161.68, 40: 191.00, 50: 220.49, 60: 250.82, 70: 292.60, 80: 334.38, 90: 376.16, 100: 405.88, 120: 473.27, 150:  520.06},
+        4	: {4: 27.20, 8: 48.95, 12:  75.49, 16:  98.11, 20: 128.20, 24: 150.82, 30: 165.95, 40: 196.04, 50: 226.31, 60: 259.52, 70: 302.75, 80: 345.97, 90: 389.20, 100: 421.91, 120: 494.21, 150:  548.49},
+        4.5	: {4: 28.63, 8: 48.95, 12:  78.36, 16: 101.43, 20: 132.59, 24: 156.11, 30: 171.99, 40: 199.96, 50: 230.83, 60: 266.28, 70: 310.64, 80: 354.99, 90: 399.34, 100: 434.37, 120: 510.50, 150:  570.61},
+        5	: {4: 29.78, 8: 50.75, 12:  82.10, 16: 105.53, 20: 138.01, 24: 162.75, 30: 179.71, 40: 204.59, 50: 236.16, 60: 271.70, 70: 316.95, 80: 362.20, 90: 407.46, 100: 444.34, 120: 523.53, 150:  588.30},
+        5.5	: {4: 30.72, 8: 53.42, 12:  85.16, 16: 108.89, 20: 142.46, 24: 168.18, 30: 186.03, 40: 212.69, 50: 245.44, 60: 280.27, 70: 327.55, 80: 374.32, 90: 421.09, 100: 456.38, 120: 534.48, 150:  602.78},
+        6	: {4: 31.51, 8: 55.63, 12:  87.71, 16: 111.68, 20: 146.16, 24: 172.70, 30: 191.29, 40: 219.43, 50: 253.18, 60: 289.55, 70: 339.18, 80: 387.63, 90: 436.06, 100: 473.98, 120: 556.69, 150:  621.69},
+        7	: {4: 32.74, 8: 59.12, 12:  91.72, 16: 116.08, 20: 151.98, 24: 179.82, 30: 199.56, 40: 230.03, 50: 266.64, 60: 304.13, 70: 357.46, 80: 408.53, 90: 459.57, 100: 501.63, 120: 591.59, 150:  667.64},
+        8	: {4: 33.66, 8: 61.74, 12:  94.72, 16: 119.37, 20: 156.34, 24: 185.15, 30: 205.76, 40: 243.27, 50: 288.93, 60: 327.55, 70: 378.74, 80: 424.21, 90: 477.21, 100: 522.37, 120: 617.76, 150:  702.10},
+        9	: {4: 34.38, 8: 63.77, 12:  97.06, 16: 121.94, 20: 159.73, 24: 189.30, 30: 210.58, 40: 255.79, 50: 306.27, 60: 352.45, 70: 405.88, 80: 436.40, 90: 490.93, 100: 538.51, 120: 638.12, 150:  728.90},
+        10	: {4: 34.95, 8: 65.40, 12:  98.93, 16: 123.99, 20: 162.45, 24: 192.62, 30: 214.44, 40: 265.80, 50: 320.14, 60: 372.38, 70: 427.58, 80: 458.15, 90: 515.42, 100: 551.41, 120: 654.41, 150:  750.35},
+        11	: {4: 35.42, 8: 66.73, 12: 100.46, 16: 125.66, 20: 164.67, 24: 195.33, 30: 217.60, 40: 273.99, 50: 331.49, 60: 388.68, 70: 445.34, 80: 481.21, 90: 541.38, 100: 568.01, 120: 677.18, 150:  767.89},
+        12	: {4: 35.81, 8: 67.84, 12: 101.74, 16: 127.06, 20: 166.52, 24: 197.60, 30: 220.23, 40: 280.82, 50: 340.95, 60: 402.27, 70: 460.14, 80: 500.43, 90: 563.00, 100: 594.84, 120: 709.75, 150:  787.74},
+        13	: {4: 36.15, 8: 68.78, 12: 102.81, 16: 128.25, 20: 168.09, 24: 199.51, 30: 222.46, 40: 286.59, 50: 349.96, 60: 413.77, 70: 472.66, 80: 516.69, 90: 581.30, 100: 617.55, 120: 737.30, 150:  828.46},
+        14	: {4: 36.43, 8: 69.59, 12: 103.74, 16: 129.26, 20: 169.43, 24: 201.15, 30: 224.37, 40: 291.54, 50: 361.84, 60: 423.62, 70: 483.40, 80: 530.63, 90: 596.99, 100: 637.00, 120: 760.91, 150:  863.36},
+        15	: {4: 36.68, 8: 70.28, 12: 104.54, 16: 130.14, 20: 170.59, 24: 202.58, 30: 226.55, 40: 295.83, 50: 372.13, 60: 432.16, 70: 492.70, 80: 542.71, 90: 610.58, 100: 653.87, 120: 781.38, 150:  893.61},
+        16	: {4: 36.89, 8: 70.89, 12: 105.24, 16: 130.91, 20: 171.61, 24: 203.82, 30: 231.30, 40: 300.83, 50: 381.13, 60: 439.63, 70: 500.84, 80: 553.27, 90: 622.47, 100: 668.62, 120: 799.29, 150:  920.08},
+        17	: {4: 37.08, 8: 71.43, 12: 106.05, 16: 131.59, 20: 172.51, 24: 204.92, 30: 235.49, 40: 307.73, 50: 389.08, 60: 446.22, 70: 508.02, 80: 562.60, 90: 632.97, 100: 681.64, 120: 815.09, 150:  943.43},
+        18	: {4: 37.25, 8: 71.91, 12: 107.58, 16: 132.19, 20: 173.31, 24: 205.90, 30: 239.22, 40: 313.87, 50: 396.14, 60: 455.10, 70: 514.96, 80: 570.89, 90: 642.30, 100: 693.22, 120: 829.14, 150:  964.19},
+        19	: {4: 37.40, 8: 72.34, 12: 108.95, 16: 133.12, 20: 174.02, 24: 206.77, 30: 242.55, 40: 319.36, 50: 402.46, 60: 463.94, 70: 525.56, 80: 578.31, 90: 650.64, 100: 703.57, 120: 841.70, 150:  982.76},
+        20	: {4: 37.54, 8: 72.73, 12: 110.17, 16: 134.70, 20: 175.30, 24: 207.55, 30: 245.55, 40: 324.30, 50: 408.15, 60: 471.89, 70: 535.10, 80: 584.98, 90: 658.16, 100: 712.89, 120: 853.01, 150:  999.48},
+        22	: {4: 37.77, 8: 73.39, 12: 112.30, 16: 137.43, 20: 178.78, 24: 209.95, 30: 250.73, 40: 332.84, 50: 417.97, 60: 485.62, 70: 551.57, 80: 598.76, 90: 673.71, 100: 728.99, 120: 872.55, 150: 1035.31},
+        24	: {4: 37.97, 8: 73.95, 12: 114.06, 16: 139.70, 20: 181.68, 24: 213.22, 30: 255.05, 40: 339.95, 50: 426.16, 60: 497.06, 70: 565.30, 80: 617.09, 90: 694.32, 100: 747.68, 120: 899.20, 150: 1075.11},
+        26	: {4: 38.13, 8: 74.42, 12: 115.56, 16: 141.62, 20: 184.13, 24: 215.99, 30: 258.70, 40: 345.97, 50: 433.08, 60: 506.74, 70: 576.92, 80: 632.59, 90: 711.76, 100: 768.90, 120: 924.50, 150: 1108.78},
+        28	: {4: 38.28, 8: 74.82, 12: 116.84, 16: 143.27, 20: 186.23, 24: 218.36, 30: 261.83, 40: 351.13, 50: 439.02, 60: 515.04, 70: 586.88, 80: 645.88, 90: 726.71, 100: 787.08, 120: 946.19, 150: 1137.65},
+        30	: {4: 38.40, 8: 75.17, 12: 117.95, 16: 144.70, 20: 188.06, 24: 220.41, 30: 264.55, 40: 355.60, 50: 444.17, 60: 522.24, 70: 595.51, 80: 657.40, 90: 739.67, 100: 802.84, 120: 964.98, 150: 1162.66},
+        35	: {4: 39.02, 8: 76.04, 12: 120.18, 16: 147.56, 20: 191.70, 24: 224.52, 30: 269.97, 40: 364.55, 50: 454.46, 60: 536.62, 70: 612.77, 80: 680.43, 90: 765.58, 100: 834.36, 120: 002.57, 150: 1212.70},
+        40	: {4: 43.40, 8: 83.19, 12: 122.89, 16: 150.75, 20: 195.83, 24: 229.35, 30: 276.14, 40: 371.25, 50: 462.18, 60: 547.41, 70: 625.71, 80: 697.71, 90: 785.02, 100: 858.00, 120: 030.77, 150: 1250.22},
+        45	: {4: 47.49, 8: 91.74, 12: 132.80, 16: 162.75, 20: 211.54, 24: 248.01, 30: 297.66, 40: 389.59, 50: 486.92, 60: 570.81, 70: 651.95, 80: 720.95, 90: 811.17, 100: 881.88, 120: 059.29, 150: 1280.49},
+        50	: {4: 50.77, 8: 98.57, 12: 145.74, 16: 178.81, 20: 232.37, 24: 272.32, 30: 326.95, 40: 424.57, 50: 530.34, 60: 611.84, 70: 698.10, 80: 760.47, 90: 855.64, 100: 931.17, 120: 118.33, 150: 1351.23},
+        55	: {4: 53.45, 8: 04.17, 12: 156.76, 16: 192.51, 20: 250.08, 24: 292.87, 30: 352.24, 40: 461.99, 50: 575.96, 60: 666.32, 70: 760.74, 80: 825.97, 90: 929.33, 100: 998.91, 120: 200.40, 150: 1428.78},
+        60	: {4: 55.68, 8: 08.83, 12: 165.95, 16: 203.91, 20: 264.83, 24: 309.99, 30: 373.31, 40: 493.19, 50: 614.00, 60: 714.62, 70: 816.73, 80: 893.58, 90: 005.39, 100: 082.42, 120: 300.46, 150: 1545.18},
+        65	: {4: 57.57, 8: 12.77, 12: 173.73, 16: 213.57, 20: 277.32, 24: 324.48, 30: 391.14, 40: 519.59, 50: 646.18, 60: 755.48, 70: 864.11, 80: 950.79, 90: 069.76, 100: 156.62, 120: 389.37, 150: 1659.07},
+        70	: {4: 59.67, 8: 16.33, 12: 180.39, 16: 221.84, 20: 288.02, 24: 336.90, 30: 406.42, 40: 542.22, 50: 673.77, 60: 790.51, 70: 904.72, 80: 999.82, 90: 124.93, 100: 220.21, 120: 465.57, 150: 1756.69},
+        75	: {4: 63.48, 8: 22.96, 12: 186.17, 16: 229.02, 20: 297.29, 24: 347.66, 30: 419.66, 40: 561.83, 50: 697.68, 60: 820.87, 70: 939.92, 80: 042.32, 90: 172.74, 100: 275.33, 120: 531.62, 150: 1841.30},
+        80	: {4: 67.03, 8: 30.28, 12: 192.32, 16: 236.40, 20: 306.89, 24: 358.93, 30: 433.46, 40: 578.99, 50: 718.60, 60: 847.43, 70: 970.71, 80: 079.51, 90: 214.58, 100: 323.55, 120: 589.40, 150: 1915.33},
+        85	: {4: 70.17, 8: 36.74, 12: 202.97, 16: 249.54, 20: 324.02, 24: 379.10, 30: 457.04, 40: 600.70, 50: 746.44, 60: 874.82, 70: 002.14, 80: 112.32, 90: 251.49, 100: 366.11, 120: 640.39, 150: 1980.65},
+        90	: {4: 72.96, 8: 42.49, 12: 213.95, 16: 263.13, 20: 341.61, 24: 399.57, 30: 482.07, 40: 630.97, 50: 784.05, 60: 910.54, 70: 042.53, 80: 153.69, 90: 298.04, 100: 411.92, 120: 695.30, 150: 2039.79},
+        95	: {4: 75.45, 8: 47.63, 12: 223.77, 16: 275.29, 20: 357.35, 24: 417.88, 30: 504.47, 40: 663.61, 50: 824.08, 60: 957.62, 70: 096.43, 80: 202.44, 90: 352.90, 100: 464.10, 120: 758.37, 150: 2117.20},
+        100	: {4: 77.70, 8: 52.25, 12: 232.61, 16: 286.23, 20: 371.52, 24: 434.36, 30: 524.63, 40: 693.16, 50: 860.31, 60: 003.18, 70: 149.06, 80: 262.37, 90: 420.33, 100: 533.29, 120: 841.31, 150: 2197.83}
+    },
+    'mlc_tracked' : {
+        1	: {4:  9.73, 8:  17.99, 12:  19.48,	16:  25.98, 20:  32.47, 24:  38.97, 30:  39.86, 40:  48.64, 50:  56.19, 60:   62.52, 70:   68.16, 80:   72.95, 90:   77.32, 100:   81.05, 120:   87.53, 150:   91.19},
+        1.5	: {4: 14.59, 8:  26.98, 12:  29.22,	16:  38.96, 20:  48.71, 24:  58.46, 30:  59.78, 40:  72.95, 50:  84.28, 60:   93.79, 70:  102.23, 80:  109.43, 90:  115.97, 100:  121.58, 120:  131.30, 150:  136.78},	
+        2	: {4: 19.32, 8:  35.97, 12:  38.95,	16:  51.95, 20:  64.95, 24:  77.94, 30:  79.71, 40:  97.27, 50: 112.37, 60:  125.05, 70:  136.31, 80:  145.90, 90:  154.63, 100:  162.11, 120:  175.07, 150:  182.37},	
+        2.5	: {4: 22.58, 8:  43.02, 12:  48.69,	16:  64.94, 20:  81.18, 24:  97.43, 30:  99.64, 40: 121.59, 50: 140.46, 60:  156.31, 70:  170.39, 80:  182.38, 90:  193.29, 100:  202.63, 120:  218.84, 150:  227.96},	
+        3	: {4: 24.75, 8:  47.72, 12:  57.99,	16:  77.34, 20:  96.69, 24: 116.04, 30: 119.57, 40: 145.90, 50: 168.55, 60:  187.57, 70:  204.46, 80:  218.86, 90:  231.95, 100:  243.16, 120:  262.60, 150:  273.55},	
+        3.5	: {4: 26.30, 8:  51.08, 12:  64.96,	16:  86.63, 20: 108.30, 24: 129.97, 30: 139.24, 40: 170.22, 50: 196.65, 60:  218.84, 70:  238.54, 80:  255.33, 90:  270.60, 100:  283.69, 120:  306.37, 150:  319.15},	
+        4	: {4: 27.46, 8:  53.59, 12:  70.18,	16:  93.59, 20: 117.00, 24: 140.42, 30: 155.21, 40: 193.13, 50: 224.72, 60:  250.10, 70:  272.62, 80:  291.81, 90:  309.26, 100:  324.21, 120:  350.14, 150:  364.74},	
+        4.5	: {4: 28.37, 8:  55.55, 12:  74.24,	16:  99.01, 20: 123.78, 24: 148.55, 30: 167.63, 40: 211.23, 50: 249.19, 60:  280.63, 70:  306.70, 80:  328.28, 90:  347.92, 100:  364.74, 120:  393.90, 150:  410.33},	
+        5	: {4: 29.09, 8:  57.12, 12:  77.49,	16: 103.34, 20: 129.19, 24: 155.05, 30: 177.57, 40: 225.71, 50: 268.77, 60:  305.96, 70:  338.25, 80:  364.55, 90:  386.58, 100:  405.27, 120:  437.67, 150:  455.92},	
+        5.5	: {4: 29.69, 8:  58.40, 12:  80.15,	16: 106.89, 20: 133.63, 24: 160.37, 30: 185.71, 40: 237.55, 50: 284.79, 60:  326.69, 70:  364.13, 80:  396.14, 90:  423.80, 100:  445.79, 120:  481.44, 150:  501.52},	
+        6	: {4: 30.18, 8:  59.47, 12:  82.36,	16: 109.84, 20: 137.32, 24: 164.80, 30: 192.48, 40: 247.42, 50: 298.14, 60:  343.96, 70:  385.70, 80:  422.46, 90:  455.23, 100:  482.81, 120:  525.21, 150:  547.11},	
+        7	: {4: 30.96, 8:  61.15, 12:  85.84,	16: 114.49, 20: 143.13, 24: 171.77, 30: 203.13, 40: 262.94, 50: 319.12, 60:  371.10, 70:  419.59, 80:  463.82, 90:  504.62, 100:  540.97, 120:  602.61, 150:  638.29},	
+        8	: {4: 31.54, 8:  62.41, 12:  88.46,	16: 117.97, 20: 147.48, 24: 176.99, 30: 211.12, 40: 274.57, 50: 334.85, 60:  391.46, 70:  445.01, 80:  494.85, 90:  541.67, 100:  584.60, 120:  660.77, 150:  724.21},	
+        9	: {4: 31.99, 8:  63.39, 12:  90.49,	16: 120.68, 20: 150.87, 24: 181.06, 30: 217.33, 40: 283.62, 50: 347.09, 60:  407.29, 70:  464.78, 80:  518.98, 90:  570.48, 100:  618.52, 120:  706.01, 150:  792.07},	
+        10	: {4: 32.35, 8:  64.17, 12:  92.11,	16: 122.84, 20: 153.57, 24: 184.31, 30: 222.30, 40: 290.86, 50: 356.88, 60:  419.96, 70:  480.59, 80:  538.28, 90:  593.53, 100:  645.67, 120:  742.20, 150:  846.36},	
+        11	: {4: 32.65, 8:  64.81, 12:  93.44,	16: 124.62, 20: 155.79, 24: 186.97, 30: 226.37, 40: 296.78, 50: 364.89, 60:  430.32, 70:  493.53, 80:  554.07, 90:  612.39, 100:  667.88, 120:  771.81, 150:  890.77},	
+        12	: {4: 32.90, 8:  65.35, 12:  94.55,	16: 126.09, 20: 157.64, 24: 189.18, 30: 229.76, 40: 301.71, 50: 371.56, 60:  438.96, 70:  504.32, 80:  567.23, 90:  628.11, 100:  686.38, 120:  796.49, 150:  927.79},	
+        13	: {4: 33.10, 8:  65.80, 12:  95.49,	16: 127.34, 20: 159.20, 24: 191.06, 30: 232.62, 40: 305.89, 50: 377.21, 60:  446.27, 70:  513.44, 80:  578.37, 90:  641.41, 100:  702.04, 120:  817.37, 150:  959.11},	
+        14	: {4: 33.28, 8:  66.18, 12:  96.29,	16: 128.41, 20: 160.54, 24: 192.67, 30: 235.08, 40: 309.47, 50: 382.05, 60:  452.53, 70:  521.26, 80:  587.92, 90:  652.80, 100:  715.47, 120:  835.26, 150:  985.95},	
+        15	: {4: 33.44, 8:  66.52, 12:  96.99,	16: 129.34, 20: 161.70, 24: 194.06, 30: 237.21, 40: 312.57, 50: 386.24, 60:  457.96, 70:  528.04, 80:  596.19, 90:  662.68, 100:  727.10, 120:  850.77, 150: 1009.22},	
+        16	: {4: 33.57, 8:  66.81, 12:  97.59,	16: 130.16, 20: 162.72, 24: 195.28, 30: 239.07, 40: 315.29, 50: 389.92, 60:  462.71, 70:  533.97, 80:  603.43, 90:  671.33, 100:  737.28, 120:  864.35, 150: 1029.58},	
+        17	: {4: 33.69, 8:  67.07, 12:  98.13,	16: 130.87, 20: 163.61, 24: 196.35, 30: 240.72, 40: 317.68, 50: 393.15, 60:  466.90, 70:  539.21, 80:  609.82, 90:  678.95, 100:  746.26, 120:  876.32, 150: 1047.54},	
+        18	: {4: 33.80, 8:  67.30, 12:  98.61,	16: 131.51, 20: 164.41, 24: 197.31, 30: 242.18, 40: 319.81, 50: 396.03, 60:  470.63, 70:  543.86, 80:  615.49, 90:  685.73, 100:  754.24, 120:  886.96, 150: 1063.51},	
+        19	: {4: 33.90, 8:  67.51, 12:  99.04,	16: 132.08, 20: 165.12, 24: 198.17, 30: 243.49, 40: 321.72, 50: 398.61, 60:  473.96, 70:  548.02, 80:  620.57, 90:  691.80, 100:  761.39, 120:  896.49, 150: 1077.79},	
+        20	: {4: 33.98, 8:  67.70, 12:  99.42,	16: 132.59, 20: 165.76, 24: 198.94, 30: 244.67, 40: 323.43, 50: 400.93, 60:  476.96, 70:  551.77, 80:  625.15, 90:  697.26, 100:  767.82, 120:  905.06, 150: 1090.65},	
+        22	: {4: 34.13, 8:  68.02, 12: 100.09,	16: 133.48, 20: 166.87, 24: 200.26, 30: 246.70, 40: 326.39, 50: 404.93, 60:  482.14, 70:  558.24, 80:  633.04, 90:  706.69, 100:  778.92, 120:  919.87, 150: 1112.86},	
+        24	: {4: 34.25, 8:  68.28, 12: 100.64,	16: 134.22, 20: 167.80, 24: 201.37, 30: 248.39, 40: 328.86, 50: 408.27, 60:  486.46, 70:  563.63, 80:  639.62, 90:  714.55, 100:  788.17, 120:  932.20, 150: 1131.37},	
+        26	: {4: 34.36, 8:  68.51, 12: 101.11,	16: 134.84, 20: 168.58, 24: 202.31, 30: 249.83, 40: 330.95, 50: 411.10, 60:  490.11, 70:  568.19, 80:  645.19, 90:  721.20, 100:  796.00, 120:  942.64, 150: 1147.03},	
+        28	: {4: 34.45, 8:  68.70, 12: 101.51,	16: 135.38, 20: 169.25, 24: 203.11, 30: 251.05, 40: 332.74, 50: 413.52, 60:  493.24, 70:  572.10, 80:  649.96, 90:  726.90, 100:  802.72, 120:  951.59, 150: 1160.45},	
+        30	: {4: 34.52, 8:  68.87, 12: 101.86,	16: 135.84, 20: 169.83, 24: 203.81, 30: 252.12, 40: 334.29, 50: 415.61, 60:  495.96, 70:  575.49, 80:  654.10, 90:  731.84, 100:  808.53, 120:  959.35, 150: 1172.08},	
+        35	: {4: 36.47, 8:  72.32, 12: 104.28,	16: 139.07, 20: 173.86, 24: 208.65, 30: 255.76, 40: 338.37, 50: 420.28, 60:  501.48, 70:  582.27, 80:  662.37, 90:  741.71, 100:  820.17, 120:  974.86, 150: 1195.35},	
+        40	: {4: 40.81, 8:  81.09, 12: 117.46,	16: 156.65, 20: 195.84, 24: 235.03, 30: 285.72, 40: 375.41, 50: 462.56, 60:  546.77, 70:  628.54, 80:  707.51, 90:  785.20, 100:  861.47, 120: 1011.79, 150: 1223.63},	
+        45	: {4: 44.19, 8:  87.90, 12: 128.13,	16: 170.88, 20: 213.62, 24: 256.37, 30: 313.31, 40: 412.81, 50: 510.05, 60:  604.68, 70:  697.13, 80:  787.01, 90:  874.68, 100:  959.58, 120: 1122.50, 150: 1330.83},	
+        50	: {4: 46.89, 8:  93.36, 12: 136.66,	16: 182.26, 20: 227.85, 24: 273.45, 30: 335.39, 40: 442.73, 50: 548.04, 60:  651.00, 70:  752.01, 80:  850.71, 90:  947.41, 100: 1041.61, 120: 1223.83, 150: 1464.70},	
+        55	: {4: 49.10, 8:  97.82, 12: 143.64,	16: 191.57, 20: 239.49, 24: 287.42, 30: 353.45, 40: 467.21, 50: 579.12, 60:  688.90, 70:  796.90, 80:  902.83, 90: 1006.91, 100: 1108.73, 120: 1306.74, 150: 1574.26},	
+        60	: {4: 50.95, 8: 101.54, 12: 149.46,	16: 199.33, 20: 249.19, 24: 299.06, 30: 368.50, 40: 487.61, 50: 605.03, 60:  720.49, 70:  834.32, 80:  946.26, 90: 1056.50, 100: 1164.67, 120: 1375.83, 150: 1665.57},	
+        65	: {4: 52.52, 8: 104.68, 12: 154.39,	16: 205.89, 20: 257.40, 24: 308.91, 30: 381.23, 40: 504.87, 50: 626.95, 60:  747.21, 70:  865.98, 80:  983.01, 90: 1098.46, 100: 1211.99, 120: 1434.29, 150: 1742.82},	
+        70	: {4: 56.09, 8: 111.50, 12: 161.88,	16: 215.89, 20: 269.90, 24: 323.92, 30: 395.16, 40: 521.63, 50: 646.67, 60:  770.31, 70:  893.11, 80: 1014.51, 90: 1134.43, 100: 1252.56, 120: 1484.40, 150: 1809.04},	
+        75	: {4: 59.48, 8: 118.31, 12: 172.44,	16: 229.97, 20: 287.50, 24: 345.03, 30: 421.64, 40: 555.51, 50: 686.34, 60:  813.65, 70:  938.02, 80: 1059.30, 90: 1179.25, 100: 1297.57, 120: 1531.62, 150: 1866.43},	
+        80	: {4: 62.44, 8: 124.27, 12: 181.67,	16: 242.29, 20: 302.90, 24: 363.51, 30: 445.35, 40: 587.54, 50: 726.88, 60:  862.91, 70:  996.19, 80: 1126.22, 90: 1253.44, 100: 1377.16, 120: 1615.89, 150: 1938.32},	
+        85	: {4: 65.05, 8: 129.53, 12: 189.82,	16: 253.15, 20: 316.49, 24: 379.82, 30: 466.28, 40: 615.81, 50: 762.65, 60:  906.38, 70: 1047.52, 80: 1185.62, 90: 1321.06, 100: 1453.21, 120: 1709.30, 150: 2050.48},	
+        90	: {4: 67.37, 8: 134.20, 12: 197.06,	16: 262.81, 20: 328.56, 24: 394.31, 30: 484.88, 40: 640.93, 50: 794.44, 60:  945.02, 70: 1093.15, 80: 1238.42, 90: 1381.17, 100: 1520.80, 120: 1792.32, 150: 2159.05},	
+        95	: {4: 69.45, 8: 138.39, 12: 203.55,	16: 271.46, 20: 339.37, 24: 407.28, 30: 501.52, 40: 663.41, 50: 822.89, 60:  979.59, 70: 1133.97, 80: 1285.67, 90: 1434.95, 100: 1581.28, 120: 1866.61, 150: 2256.20},	
+        100	: {4: 72.06, 8: 143.27, 12: 209.39,	16: 279.26, 20: 349.12, 24: 418.98, 30: 516.50, 40: 683.64, 50: 848.49, 60: 1010.70, 70: 1170.71, 80: 1328.18, 90: 1483.35, 100: 1635.71, 120: 1933.46, 150: 2343.63}	
+
+    }
+}
+
+_unit_moment_lm1_data = {
+    'lm1' : {
+        1	: 108.08,
+        1.5	: 111.50,
+        2	: 114.92,
+        2.5	: 122.39,
+        3	: 142.00,
+        3.5	: 156.99,
+        4	: 169.09,
+        4.5	: 179.25,
+        5	: 188.07,
+        5.5	: 195.91,
+        6	: 203.01,
+        7	: 215.63,
+        8	: 226.80,
+        9	: 237.01,
+        10	: 246.54,
+        11	: 255.59,
+        12	: 264.26,
+        13	: 272.65,
+        14	: 280.82,
+        15	: 288.82,
+        16	: 296.66,
+        17	: 304.39,
+        18	: 312.02,
+        19	: 319.56,
+        20	: 327.04,
+        22	: 341.81,
+        24	: 356.40,
+        26	: 370.85,
+        28	: 385.18,
+        30	: 399.43,
+        35	: 434.76,
+        40	: 469.80,
+        45	: 504.65,
+        50	: 539.36,
+        55	: 573.97,
+        60	: 608.51,
+        65	: 643.00,
+        70	: 677.43,
+        75	: 711.84,
+        80	: 746.21,
+        85	: 780.56,
+        90	: 814.89,
+        95	: 849.21,
+        100	: 883.51
+    }
+}
+
+UNIT_MOMENT_MLC = {
+    'mlc_wheeled' : LoadTable(_unit_moment_mlc_data['mlc_wheeled']),
+    'mlc_tracked' : LoadTable(_unit_moment_mlc_data['mlc_tracked'])
+}
+
+SHEAR_MLC = {
+    'mlc_wheeled' : LoadTable(_shear_mlc_data['mlc_wheeled']),
+    'mlc_tracked' : LoadTable(_shear_mlc_data['mlc_tracked'])
+}
+
+# all MLC classes of the influence tables
+MLC_LOADCLASSES = UNIT_MOMENT_MLC['mlc_wheeled'].loadclasses.astype(int)
+
+# LM1 is stored with the single load class 1 of the 'lm' database entry
+UNIT_MOMENT_LM1 = LoadTable({span: {1: value} for span, value in _unit_moment_lm1_data['lm1'].items()})
+
 
 class Load(object):
     """
@@ -46,95 +391,14 @@ class Load(object):
             classification  of loadtype (total weight = 'weight', weight of the axis = 'axis')
         """
 
-        MLC_classes ={
-        'mlc_wheeled': {
-            4:      {'weight' : 4.09	, 'axis' : [0.91	,1.59	,1.59   ]},
-            8:      {'weight' : 8.16	, 'axis' : [2.72	,2.72	,2.72   ]},
-            12:     {'weight' : 13.61	, 'axis' : [2.72	,4.54	,4.54	,1.81   ]},
-            16:     {'weight' : 16.79	, 'axis' : [2.72	,5.9	,5.9	,2.27   ]},
-            20:     {'weight' : 21.77	, 'axis' : [3.63	,7.71	,7.71	,2.72   ]},
-            24:     {'weight' : 25.4	, 'axis' : [4.54	,9.07	,9.07	,2.72	]},
-            30:     {'weight' : 30.84	, 'axis' : [5.44	,9.98	,9.98	,5.44	]},
-            40:     {'weight' : 42.63	, 'axis' : [6.35	,11.79	,11.79	,12.7	]},
-            50:     {'weight' : 52.62	, 'axis' : [7.26	,13.61	,13.61	,18.14	]},
-            60:     {'weight' : 63.5	, 'axis' : [7.26	,16.33	,16.33	,11.79	,11.79	]},
-            70:     {'weight' : 73.02	, 'axis' : [9.52	,19.05	,19.05	,12.7	,12.7	]},
-            80:     {'weight' : 83.45	, 'axis' : [10.89	,21.77	,21.77	,14.51	,14.51  ]},
-            90:     {'weight' : 93.89	, 'axis' : [12.25	,24.49	,24.49	,16.33	,16.33	]},
-            100:    {'weight' : 104.33	, 'axis' : [13.61	,27.22	,27.22	,18.14	,18.14	]},
-            120:    {'weight' : 125.19	, 'axis' : [16.33	,32.66	,32.66	,21.77	,21.77	]},
-            150:    {'weight' : 154.22	, 'axis' : [19.96	,38.1	,38.1	,29.03	,29.03	]}},
-        'mlc_tracked': {
-            4	:   {'weight' : 3.63},
-            8	:   {'weight' : 7.26},
-            12	:   {'weight' : 10.88},
-            16	:   {'weight' : 14.51},
-            20	:   {'weight' : 18.14},
-            24	:   {'weight' : 21.77},
-            30	:   {'weight' : 27.22},
-            40	:   {'weight' : 36.29},
-            50	:   {'weight' : 45.36},
-            60	:   {'weight' : 54.43},
-            70	:   {'weight' : 63.50},
-            80	:   {'weight' : 72.58},
-            90	:   {'weight' : 81.65},
-            100	:   {'weight' : 90.72},
-            120	:   {'weight' : 108.86},
-            150	:   {'weight' : 136.08}},
-        'lm' : {
-            1   :   {'line_load' : 300, 'single_load' : 12}
-        }
-        }
-
-        return MLC_classes[self.loadtype][loadclass]
+        # copy, the database is shared by all loads
+        return copy.deepcopy(MLC_CLASSES[self.loadtype][loadclass])
 
     def get_load_loadclass_geometry(self, loadclass):
         """
         Gets loadclass geometry value form database.
         """
-        load_geometry = {
-            'mlc_wheeled' :{
-                4	: {'total_length' : 3.66	, 'spacing' : [0.00,    2.44	,1.22 ]},
-                8	: {'total_length' : 4.27	, 'spacing' : [0.00,    3.05	,1.22 ]},
-                12	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
-                16	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
-                20	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
-                24	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
-                30	: {'total_length' : 7.93	, 'spacing' : [0.00,    3.05	,1.22	,3.66 ]},
-                40	: {'total_length' : 9.76	, 'spacing' : [0.00,    3.66	,1.22	,4.88 ]},
-                50	: {'total_length' : 9.76	, 'spacing' : [0.00,    3.66	,1.22	,4.88 ]},
-                60	: {'total_length' : 10.97	, 'spacing' : [0.00,    3.66	,1.52	,4.57	,1.22 ]},
-                70	: {'total_length' : 10.97	, 'spacing' : [0.00,    3.66	,1.52	,4.57	,1.22 ]},
-                80	: {'total_length' : 12.19	, 'spacing' : [0.00,    3.66	,1.52	,5.49	,1.52 ]},
-                90	: {'total_length' : 12.19	, 'spacing' : [0.00,    3.66	,1.52	,5.49	,1.52 ]},
-                100	: {'total_length' : 13.11	, 'spacing' : [0.00,    3.66	,1.68	,6.25	,1.52 ]},
-                120	: {'total_length' : 13.11	, 'spacing' : [0.00,    3.66	,1.83	,6.10	,1.52 ]},
-                150	: {'total_length' : 14.33	, 'spacing' : [0.00,    3.66	,2.13	,6.71	,1.83 ]}
-            },
-            'mlc_tracked' :{
-                4	: { 'total_length' : 1.83, 'width' :	1.83, 'chain_width' : 0.30 },
-                8	: { 'total_length' : 1.98, 'width' :	1.98, 'chain_width' : 0.30 },
-                12	: { 'total_length' : 2.74, 'width' :	2.03, 'chain_width' : 0.30 },
-                16	: { 'total_length' : 2.74, 'width' :	2.13, 'chain_width' : 0.30 },
-                20	: { 'total_length' : 2.74, 'width' :	2.44, 'chain_width' : 0.41 },
-                24	: { 'total_length' : 2.74, 'width' :	2.54, 'chain_width' : 0.46 },
-                30	: { 'total_length' : 3.35, 'width' :	2.54, 'chain_width' : 0.46 },
-                40	: { 'total_length' : 3.66, 'width' :	2.84, 'chain_width' : 0.56 },
-                50	: { 'total_length' : 3.96, 'width' :	3.25, 'chain_width' : 0.66 },
-                60	: { 'total_length' : 4.27, 'width' :	3.35, 'chain_width' : 0.71 },
-                70	: { 'total_length' : 4.57, 'width' :	3.51, 'chain_width' : 0.79 },
-                80	: { 'total_length' : 4.88, 'width' :	3.66, 'chain_width' : 0.84 },
-                90	: { 'total_length' : 5.18, 'width' :	3.81, 'chain_width' : 0.89 },
-                100	: { 'total_length' : 5.49, 'width' :	3.96, 'chain_width' : 0.94 },
-                120	: { 'total_length' : 6.10, 'width' :	4.27, 'chain_width' : 1.02 },
-                150	: { 'total_length' : 7.32, 'width' :	4.67, 'chain_width' : 1.27 }
-            },
-            'lm' : {
-                1   : { 'total_length' : 1.20, 'width' : 2.00,  'spacing' : 1.20} 
-            }
-        }
-        
-        return load_geometry[self.loadtype][loadclass]
+        return copy.deepcopy(LOAD_GEOMETRY[self.loadtype][loadclass])
 
     
     def get_unit_moment_mlc(self, loadclass, span):
@@ -153,103 +417,8 @@ class Load(object):
         return: np.array([x,y], dtype=float)   ; x = MLC wheeled , y = MLC tracked
         """
         
-        load_data = {
-            'mlc_wheeled' : {
-                1	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 26.71, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.73, 100:   71.20, 120:  80.10, 150:  93.44},
-                1.5	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 26.71, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.73, 100:   71.20, 120:  80.10, 150:  93.44},
-                2	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 26.71, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.73, 100:   71.20, 120:  80.10, 150:  93.44},
-                2.5	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 26.71, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.73, 100:   71.20, 120:  80.10, 150:  93.44},
-                3	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 24.48, 24: 28.24, 30:  32.25, 40:  37.82, 50:  44.49, 60:  51.16, 70:  56.73, 80:  62.29, 90:  66.97, 100:   71.20, 120:  80.10, 150:  93.44},
-                3.5	: {4:  5.57, 8: 12.24, 12: 17.81, 16: 21.14, 20: 25.78, 24: 30.33, 30:  33.38, 40:  39.43, 50:  45.52, 60:  51.16, 70:  57.27, 80:  65.44, 90:  73.62, 100:   77.12, 120:  87.39, 150:  93.44},
-                4	: {4:  5.60, 8: 12.24, 12: 17.81, 16: 21.14, 20: 27.16, 24: 31.95, 30:  35.16, 40:  41.54, 50:  47.95, 60:  52.55, 70:  61.31, 80:  70.06, 90:  78.81, 100:   83.33, 120:  95.29, 150: 100.61},
-                4.5	: {4:  5.83, 8: 12.24, 12: 17.81, 16: 21.63, 20: 28.26, 24: 33.25, 30:  36.58, 40:  43.21, 50:  49.89, 60:  55.33, 70:  64.54, 80:  73.76, 90:  82.98, 100:   88.32, 120: 101.67, 150: 108.89},
-                5	: {4:  6.01, 8: 12.24, 12: 17.81, 16: 22.31, 20: 29.15, 24: 34.30, 30:  37.74, 40:  44.58, 50:  51.46, 60:  57.60, 70:  67.19, 80:  76.79, 90:  86.38, 100:   92.42, 120: 106.93, 150: 115.75},
-                5.5	: {4:  6.32, 8: 12.24, 12: 17.81, 16: 22.88, 20: 29.89, 24: 35.17, 30:  38.70, 40:  45.71, 50:  52.77, 60:  59.49, 70:  69.40, 80:  79.31, 90:  89.22, 100:   95.85, 120: 111.33, 150: 121.51},
-                6	: {4:  6.63, 8: 12.24, 12: 17.97, 16: 23.35, 20: 30.52, 24: 35.90, 30:  39.50, 40:  46.67, 50:  53.87, 60:  61.09, 70:  71.27, 80:  81.44, 90:  91.62, 100:   98.75, 120: 115.06, 150: 126.43},
-                7	: {4:  7.12, 8: 12.24, 12: 19.28, 16: 24.76, 20: 32.38, 24: 38.18, 30:  42.17, 40:  48.19, 50:  55.63, 60:  63.65, 70:  74.25, 80:  84.85, 90:  95.46, 100:  103.39, 120: 121.05, 150: 134.34},
-                8	: {4:  7.48, 8: 13.01, 12: 20.48, 16: 26.11, 20: 34.17, 24: 40.36, 30:  44.69, 40:  50.44, 50:  58.20, 60:  66.40, 70:  77.70, 80:  88.80, 90:  99.89, 100:  108.32, 120: 126.96, 150: 141.31},
-                9	: {4:  7.76, 8: 13.77, 12: 21.42, 16: 27.17, 20: 35.56, 24: 42.06, 30:  46.64, 40:  52.98, 50:  61.12, 60:  69.90, 70:  82.04, 80:  93.76, 90: 105.47, 100:  114.83, 120: 135.10, 150: 151.81},
-                10	: {4:  7.99, 8: 14.39, 12: 22.33, 16: 28.29, 20: 36.99, 24: 43.67, 30:  48.89, 40:  55.01, 50:  63.46, 60:  72.70, 70:  85.51, 80:  97.73, 90: 109.94, 100:  120.04, 120: 141.61, 150: 160.21},
-                11	: {4:  8.18, 8: 14.90, 12: 23.33, 16: 29.45, 20: 38.47, 24: 45.35, 30:  51.29, 40:  56.81, 50:  66.89, 60:  75.81, 70:  88.35, 80: 100.98, 90: 113.60, 100:  124.29, 120: 146.95, 150: 167.08},
-                12	: {4:  8.33, 8: 15.32, 12: 24.16, 16: 30.42, 20: 39.70, 24: 46.76, 30:  53.30, 40:  60.78, 50:  72.03, 60:  81.25, 70:  93.97, 80: 103.69, 90: 116.64, 100:  127.84, 120: 151.39, 150: 172.81},
-                13	: {4:  8.46, 8: 15.67, 12: 24.87, 16: 31.24, 20: 40.75, 24: 47.95, 30:  55.00, 40:  64.14, 50:  76.39, 60:  86.91, 70: 100.47, 80: 105.98, 90: 119.22, 100:  130.85, 120: 155.15, 150: 177.66},
-                14	: {4:  8.57, 8: 15.98, 12: 25.47, 16: 31.94, 20: 41.64, 24: 48.97, 30:  56.45, 40:  67.02, 50:  80.12, 60:  91.77, 70: 106.05, 80: 111.02, 90: 124.90, 100:  133.42, 120: 158.37, 150: 181.81},
-                15	: {4:  8.67, 8: 16.25, 12: 26.00, 16: 32.55, 20: 42.42, 24: 49.85, 30:  57.72, 40:  69.52, 50:  83.36, 60:  95.99, 70: 110.89, 80: 117.19, 90: 131.84, 100:  135.92, 120: 162.44, 150: 185.41},
-                16	: {4:  8.76, 8: 16.48, 12: 26.46, 16: 33.09, 20: 43.10, 24: 50.63, 30:  58.83, 40:  71.70, 50:  86.20, 60:  99.69, 70: 115.13, 80: 122.59, 90: 137.92, 100:  143.30, 120: 171.36, 150: 188.57},
-                17	: {4:  8.83, 8: 16.69, 12: 26.86, 16: 33.56, 20: 43.71, 24: 51.31, 30:  59.81, 40:  73.63, 50:  88.71, 60: 102.96, 70: 118.87, 80: 127.36, 90: 143.29, 100:  149.83, 120: 179.25, 150: 197.06},
-                18	: {4:  8.90, 8: 16.87, 12: 27.22, 16: 33.98, 20: 44.24, 24: 51.92, 30:  60.68, 40:  75.35, 50:  90.94, 60: 105.86, 70: 122.19, 80: 131.61, 90: 148.07, 100:  155.64, 120: 186.27, 150: 206.95},
-                19	: {4:  8.96, 8: 17.04, 12: 27.55, 16: 34.36, 20: 44.72, 24: 52.47, 30:  61.46, 40:  76.88, 50:  92.94, 60: 108.47, 70: 125.17, 80: 135.42, 90: 152.35, 100:  160.85, 120: 192.56, 150: 215.82},
-                20	: {4:  9.01, 8: 17.18, 12: 27.84, 16: 34.70, 20: 45.15, 24: 52.96, 30:  62.17, 40:  78.26, 50:  94.73, 60: 110.81, 70: 127.86, 80: 138.85, 90: 156.21, 100:  165.54, 120: 198.22, 150: 223.81},
-                22	: {4:  9.10, 8: 17.44, 12: 28.34, 16: 35.28, 20: 45.90, 24: 53.80, 30:  63.38, 40:  80.65, 50:  97.84, 60: 114.87, 70: 132.49, 80: 144.78, 90: 162.89, 100:  173.67, 120: 208.02, 150: 237.65},
-                24	: {4:  9.18, 8: 17.65, 12: 28.76, 16: 35.77, 20: 46.52, 24: 54.51, 30:  64.40, 40:  82.64, 50: 100.43, 60: 118.25, 70: 136.36, 80: 149.73, 90: 168.46, 100:  180.45, 120: 216.21, 150: 249.21},
-                26	: {4:  9.25, 8: 17.83, 12: 29.11, 16: 36.19, 20: 47.05, 24: 55.11, 30:  65.26, 40:  84.32, 50: 102.63, 60: 121.12, 70: 139.64, 80: 153.93, 90: 173.18, 100:  186.20, 120: 223.14, 150: 259.02},
-                28	: {4:  9.30, 8: 17.99, 12: 29.42, 16: 36.54, 20: 47.50, 24: 55.62, 30:  66.00, 40:  85.77, 50: 104.51, 60: 123.58, 70: 142.44, 80: 157.53, 90: 177.23, 100:  191.13, 120: 229.09, 150: 267.44},
-                30	: {4:  9.35, 8: 18.12, 12: 29.68, 16: 36.85, 20: 47.89, 24: 56.06, 30:  66.63, 40:  87.02, 50: 106.14, 60: 125.71, 70: 144.88, 80: 160.65, 90: 180.74, 100:  195.41, 120: 234.25, 150: 274.75},
-                35	: {4:  9.45, 8: 18.39, 12: 30.21, 16: 37.47, 20: 48.67, 24: 56.95, 30:  67.92, 40:  89.52, 50: 109.40, 60: 129.98, 70: 149.75, 80: 166.90, 90: 187.78, 100:  203.99, 120: 244.59, 150: 289.40},
-                40	: {4:  9.52, 8: 18.59, 12: 30.60, 16: 37.93, 20: 49.26, 24: 57.62, 30:  68.88, 40:  91.40, 50: 111.85, 60: 133.19, 70: 153.41, 80: 171.60, 90: 193.06, 100:  210.44, 120: 252.35, 150: 300.42},
-                45	: {4:  9.58, 8: 18.75, 12: 30.91, 16: 38.29, 20: 49.72, 24: 58.14, 30:  69.63, 40:  92.86, 50: 113.76, 60: 135.68, 70: 156.26, 80: 175.26, 90: 197.18, 100:  215.46, 120: 258.40, 150: 309.00},
-                50	: {4:  9.62, 8: 18.88, 12: 31.16, 16: 38.58, 20: 50.09, 24: 58.55, 30:  70.22, 40:  94.03, 50: 115.29, 60: 137.68, 70: 158.53, 80: 178.19, 90: 200.48, 100:  219.48, 120: 263.24, 150: 315.88},
-                55	: {4:  9.66, 8: 18.98, 12: 31.36, 16: 38.81, 20: 50.39, 24: 58.89, 30:  70.72, 40:  94.98, 50: 116.54, 60: 139.32, 70: 160.40, 80: 180.59, 90: 203.18, 100:  222.77, 120: 267.21, 150: 321.52},
-                60	: {4: 10.03, 8: 19.52, 12: 31.53, 16: 39.01, 20: 50.64, 24: 59.18, 30:  71.12, 40:  95.78, 50: 117.58, 60: 140.68, 70: 161.95, 80: 182.59, 90: 205.43, 100:  225.52, 120: 270.52, 150: 326.22},
-                65	: {4: 10.70, 8: 20.91, 12: 31.74, 16: 39.24, 20: 50.93, 24: 59.52, 30:  71.66, 40:  96.45, 50: 118.46, 60: 141.84, 70: 163.27, 80: 184.28, 90: 207.33, 100:  227.85, 120: 273.32, 150: 330.20},
-                70	: {4: 11.29, 8: 22.12, 12: 33.81, 16: 41.81, 20: 54.25, 24: 63.41, 30:  76.46, 40: 100.27, 50: 123.52, 60: 144.98, 70: 166.74, 80: 186.90, 90: 210.28, 100:  230.74, 120: 276.53, 150: 333.62},
-                75	: {4: 11.81, 8: 23.19, 12: 35.72, 16: 44.15, 20: 57.28, 24: 66.95, 30:  80.79, 40: 106.57, 50: 131.30, 60: 154.26, 70: 177.32, 80: 196.64, 90: 221.23, 100:  240.47, 120: 288.40, 150: 345.05},
-                80	: {4: 12.71, 8: 24.54, 12: 37.42, 16: 46.24, 20: 59.99, 24: 70.11, 30:  84.66, 40: 112.23, 50: 138.46, 60: 163.01, 70: 187.35, 80: 208.43, 90: 234.51, 100:  255.00, 120: 305.84, 150: 364.88},
-                85	: {4: 13.73, 8: 26.63, 12: 38.95, 16: 48.12, 20: 62.43, 24: 72.95, 30:  88.13, 40: 117.31, 50: 144.93, 60: 170.84, 70: 196.34, 80: 219.01, 90: 246.41, 100:  268.53, 120: 322.10, 150: 385.63},
-                90	: {4: 14.64, 8: 28.48, 12: 41.89, 16: 51.76, 20: 67.15, 24: 78.41, 30:  94.72, 40: 121.93, 50: 150.74, 60: 177.90, 70: 204.44, 80: 228.54, 90: 257.13, 100:  280.73, 120: 336.74, 150: 404.31},
-                95	: {4: 15.45, 8: 30.14, 12: 44.96, 16: 55.54, 20: 72.04, 24: 84.12, 30: 101.68, 40: 130.88, 50: 161.15, 60: 186.09, 70: 214.10, 80: 237.18, 90: 266.85, 100:  291.77, 120: 350.00, 150: 421.22},
-                100	: {4: 16.18, 8: 31.64, 12: 47.72, 16: 58.94, 20: 76.45, 24: 89.25, 30: 107.94, 40: 140.02, 50: 172.45, 60: 199.86, 70: 229.92, 80: 251.29, 90: 282.73, 100:  306.04, 120: 366.96, 150: 437.06} 
-            },
-            'mlc_tracked' : {
-                1	: {4:  2.43, 8:  4.50, 12:  4.87, 16:  6.49, 20:  8.12, 24:  9.74, 30:   9.96, 40:  12.16, 50:  14.05, 60:  15.63, 70:  17.04, 80:  18.24, 90:  19.33, 100:  20.26, 120:  21.88, 150:  22.80},
-                1.5	: {4:  3.65, 8:  6.74, 12:  7.30, 16:  9.74, 20: 12.18, 24: 14.61, 30:  14.95, 40:  18.24, 50:  21.07, 60:  23.45, 70:  25.56, 80:  27.36, 90:  28.99, 100:  30.40, 120:  32.83, 150:  34.19},
-                2	: {4:  4.83, 8:  8.99, 12:  9.74, 16: 12.99, 20: 16.24, 24: 19.49, 30:  19.93, 40:  24.32, 50:  28.09, 60:  31.26, 70:  34.08, 80:  36.48, 90:  38.66, 100:  40.53, 120:  43.77, 150:  45.59},
-                2.5	: {4:  5.64, 8: 10.75, 12: 12.17, 16: 16.23, 20: 20.30, 24: 24.36, 30:  24.91, 40:  30.40, 50:  35.12, 60:  39.08, 70:  42.60, 80:  45.60, 90:  48.32, 100:  50.66, 120:  54.71, 150:  56.99},
-                3	: {4:  6.19, 8: 11.93, 12: 14.50, 16: 19.34, 20: 24.17, 24: 29.01, 30:  29.89, 40:  36.48, 50:  42.14, 60:  46.89, 70:  51.12, 80:  54.71, 90:  57.99, 100:  60.79, 120:  65.65, 150:  68.39},
-                3.5	: {4:  6.58, 8: 12.77, 12: 16.24, 16: 21.66, 20: 27.07, 24: 32.49, 30:  34.81, 40:  42.56, 50:  49.16, 60:  54.71, 70:  59.64, 80:  63.83, 90:  67.65, 100:  70.92, 120:  76.59, 150:  79.79},
-                4	: {4:  6.87, 8: 13.40, 12: 17.54, 16: 23.40, 20: 29.25, 24: 35.11, 30:  38.80, 40:  48.28, 50:  56.18, 60:  62.52, 70:  68.16, 80:  72.95, 90:  77.32, 100:  81.05, 120:  87.53, 150:  91.19},
-                4.5	: {4:  7.09, 8: 13.89, 12: 18.56, 16: 24.75, 20: 30.94, 24: 37.14, 30:  41.91, 40:  52.81, 50:  62.30, 60:  70.16, 70:  76.67, 80:  82.07, 90:  86.98, 100:  91.19, 120:  98.48, 150: 102.58},
-                5	: {4:  7.27, 8: 14.28, 12: 19.37, 16: 25.84, 20: 32.30, 24: 38.76, 30:  44.39, 40:  56.43, 50:  67.19, 60:  76.49, 70:  84.56, 80:  91.14, 90:  96.64, 100: 101.32, 120: 109.42, 150: 113.98},
-                5.5	: {4:  7.42, 8: 14.60, 12: 20.04, 16: 26.72, 20: 33.41, 24: 40.09, 30:  46.43, 40:  59.39, 50:  71.20, 60:  81.67, 70:  91.03, 80:  99.03, 90: 105.95, 100: 111.45, 120: 120.36, 150: 125.38},
-                6	: {4:  7.55, 8: 14.87, 12: 20.59, 16: 27.46, 20: 34.33, 24: 41.20, 30:  48.12, 40:  61.86, 50:  74.53, 60:  85.99, 70:  96.43, 80: 105.62, 90: 113.81, 100: 120.70, 120: 131.30, 150: 136.78},
-                7	: {4:  7.74, 8: 15.29, 12: 21.46, 16: 28.62, 20: 35.78, 24: 42.94, 30:  50.78, 40:  65.73, 50:  79.78, 60:  92.78, 70: 104.90, 80: 115.96, 90: 126.16, 100: 135.24, 120: 150.65, 150: 159.57},
-                8	: {4:  7.88, 8: 15.60, 12: 22.11, 16: 29.49, 20: 36.87, 24: 44.25, 30:  52.78, 40:  68.64, 50:  83.71, 60:  97.87, 70: 111.25, 80: 123.71, 90: 135.42, 100: 146.15, 120: 165.19, 150: 181.05},
-                9	: {4:  8.00, 8: 15.85, 12: 22.62, 16: 30.17, 20: 37.72, 24: 45.26, 30:  54.33, 40:  70.90, 50:  86.77, 60: 101.82, 70: 116.20, 80: 129.74, 90: 142.62, 100: 154.63, 120: 176.50, 150: 198.02},
-                10	: {4:  8.09, 8: 16.04, 12: 23.03, 16: 30.71, 20: 38.39, 24: 46.08, 30:  55.58, 40:  72.71, 50:  89.22, 60: 104.99, 70: 120.15, 80: 134.57, 90: 148.38, 100: 161.42, 120: 185.55, 150: 211.59},
-                11	: {4:  8.16, 8: 16.20, 12: 23.36, 16: 31.15, 20: 38.95, 24: 46.74, 30:  56.59, 40:  74.20, 50:  91.22, 60: 107.58, 70: 123.38, 80: 138.52, 90: 153.10, 100: 166.97, 120: 192.95, 150: 222.69},
-                12	: {4:  8.22, 8: 16.34, 12: 23.64, 16: 31.52, 20: 39.41, 24: 47.30, 30:  57.44, 40:  75.43, 50:  92.89, 60: 109.74, 70: 126.08, 80: 141.81, 90: 157.03, 100: 171.60, 120: 199.12, 150: 231.95},
-                13	: {4:  8.28, 8: 16.45, 12: 23.87, 16: 31.84, 20: 39.80, 24: 47.76, 30:  58.16, 40:  76.47, 50:  94.30, 60: 111.57, 70: 128.36, 80: 144.59, 90: 160.35, 100: 175.51, 120: 204.34, 150: 239.78},
-                14	: {4:  8.32, 8: 16.55, 12: 24.07, 16: 32.10, 20: 40.14, 24: 48.17, 30:  58.77, 40:  77.37, 50:  95.51, 60: 113.13, 70: 130.32, 80: 146.98, 90: 163.20, 100: 178.87, 120: 208.82, 150: 246.49},
-                15	: {4:  8.36, 8: 16.63, 12: 24.25, 16: 32.34, 20: 40.43, 24: 48.52, 30:  59.30, 40:  78.14, 50:  96.56, 60: 114.49, 70: 132.01, 80: 149.05, 90: 165.67, 100: 181.78, 120: 212.69, 150: 252.31},
-                16	: {4:  8.39, 8: 16.70, 12: 24.40, 16: 32.54, 20: 40.68, 24: 48.82, 30:  59.77, 40:  78.82, 50:  97.48, 60: 115.68, 70: 133.49, 80: 150.86, 90: 167.83, 100: 184.32, 120: 216.09, 150: 257.39},
-                17	: {4:  8.42, 8: 16.77, 12: 24.53, 16: 32.72, 20: 40.90, 24: 49.09, 30:  60.18, 40:  79.42, 50:  98.29, 60: 116.73, 70: 134.80, 80: 152.45, 90: 169.74, 100: 186.57, 120: 219.08, 150: 261.89},
-                18	: {4:  8.45, 8: 16.83, 12: 24.65, 16: 32.88, 20: 41.10, 24: 49.33, 30:  60.55, 40:  79.95, 50:  99.01, 60: 117.66, 70: 135.96, 80: 153.87, 90: 171.43, 100: 188.56, 120: 221.74, 150: 265.88},
-                19	: {4:  8.47, 8: 16.88, 12: 24.76, 16: 33.02, 20: 41.28, 24: 49.54, 30:  60.87, 40:  80.43, 50:  99.65, 60: 118.49, 70: 137.01, 80: 155.14, 90: 172.95, 100: 190.35, 120: 224.12, 150: 269.45},
-                20	: {4:  8.50, 8: 16.92, 12: 24.86, 16: 33.15, 20: 41.44, 24: 49.73, 30:  61.17, 40:  80.86, 50: 100.23, 60: 119.24, 70: 137.94, 80: 156.29, 90: 174.32, 100: 191.95, 120: 226.27, 150: 272.66},
-                22	: {4:  8.53, 8: 17.00, 12: 25.02, 16: 33.37, 20: 41.72, 24: 50.07, 30:  61.67, 40:  81.60, 50: 101.23, 60: 120.54, 70: 139.56, 80: 158.26, 90: 176.67, 100: 194.73, 120: 229.97, 150: 278.22},
-                24	: {4:  8.56, 8: 17.07, 12: 25.16, 16: 33.55, 20: 41.95, 24: 50.34, 30:  62.10, 40:  82.22, 50: 102.07, 60: 121.62, 70: 140.91, 80: 159.91, 90: 178.64, 100: 197.04, 120: 233.05, 150: 282.84},
-                26	: {4:  8.59, 8: 17.13, 12: 25.28, 16: 33.71, 20: 42.14, 24: 50.58, 30:  62.46, 40:  82.74, 50: 102.77, 60: 122.53, 70: 142.05, 80: 161.30, 90: 180.30, 100: 199.00, 120: 235.66, 150: 286.76},
-                28	: {4:  8.61, 8: 17.18, 12: 25.38, 16: 33.85, 20: 42.31, 24: 50.78, 30:  62.76, 40:  83.18, 50: 103.38, 60: 123.31, 70: 143.03, 80: 162.49, 90: 181.72, 100: 200.68, 120: 237.90, 150: 290.11},
-                30	: {4:  8.63, 8: 17.22, 12: 25.47, 16: 33.96, 20: 42.46, 24: 50.95, 30:  63.03, 40:  83.57, 50: 103.90, 60: 123.99, 70: 143.87, 80: 163.53, 90: 182.96, 100: 202.13, 120: 239.84, 150: 293.02},
-                35	: {4:  8.67, 8: 17.30, 12: 25.64, 16: 34.19, 20: 42.75, 24: 51.30, 30:  63.56, 40:  84.35, 50: 104.95, 60: 125.35, 70: 145.57, 80: 165.59, 90: 185.43, 100: 205.04, 120: 243.71, 150: 298.84},
-                40	: {4:  8.70, 8: 17.36, 12: 25.77, 16: 34.37, 20: 42.97, 24: 51.56, 30:  63.96, 40:  84.93, 50: 105.74, 60: 126.37, 70: 146.84, 80: 167.14, 90: 187.28, 100: 207.22, 120: 246.62, 150: 303.20},
-                45	: {4:  8.72, 8: 17.41, 12: 25.87, 16: 34.50, 20: 43.13, 24: 51.77, 30:  64.27, 40:  85.38, 50: 106.35, 60: 127.16, 70: 147.83, 80: 168.35, 90: 188.72, 100: 208.92, 120: 248.88, 150: 306.59},
-                50	: {4:  8.74, 8: 17.45, 12: 25.95, 16: 34.61, 20: 43.27, 24: 51.93, 30:  64.52, 40:  85.74, 50: 106.84, 60: 127.79, 70: 148.62, 80: 169.32, 90: 189.87, 100: 210.28, 120: 250.69, 150: 309.31},
-                55	: {4:  8.76, 8: 17.49, 12: 26.02, 16: 34.70, 20: 43.38, 24: 52.06, 30:  64.72, 40:  86.04, 50: 107.24, 60: 128.31, 70: 149.26, 80: 170.11, 90: 190.82, 100: 211.39, 120: 252.17, 150: 311.53},
-                60	: {4:  9.40, 8: 18.71, 12: 27.41, 16: 36.56, 20: 45.71, 24: 54.85, 30:  67.33, 40:  88.91, 50: 110.10, 60: 130.83, 70: 151.20, 80: 171.12, 90: 191.60, 100: 212.31, 120: 253.41, 150: 313.38},
-                65	: {4:  9.96, 8: 19.84, 12: 29.14, 16: 38.87, 20: 48.59, 24: 58.31, 30:  71.73, 40:  94.84, 50: 117.58, 60: 139.90, 70: 161.86, 80: 183.42, 90: 204.61, 100: 225.35, 120: 265.73, 150: 320.51},
-                70	: {4: 10.45, 8: 20.83, 12: 30.66, 16: 40.89, 20: 51.12, 24: 61.35, 30:  75.61, 40: 100.05, 50: 124.16, 60: 147.86, 70: 171.24, 80: 194.23, 90: 216.88, 100: 239.11, 120: 282.54, 150: 342.23},
-                75	: {4: 11.25, 8: 22.34, 12: 32.26, 16: 43.02, 20: 53.78, 24: 64.55, 30:  79.03, 40: 104.67, 50: 129.98, 60: 154.91, 70: 179.54, 80: 203.81, 90: 227.75, 100: 251.30, 120: 297.42, 150: 361.47},
-                80	: {4: 12.22, 8: 24.28, 12: 35.25, 16: 47.00, 20: 58.76, 24: 70.52, 30:  85.89, 40: 112.95, 50: 139.31, 60: 164.84, 70: 189.67, 80: 213.69, 90: 237.43, 100: 262.16, 120: 310.68, 150: 378.62},
-                85	: {4: 13.07, 8: 25.99, 12: 37.88, 16: 50.52, 20: 63.16, 24: 75.80, 30:  92.62, 40: 122.02, 50: 150.74, 60: 178.70, 70: 206.00, 80: 232.53, 90: 258.41, 100: 283.47, 120: 331.53, 150: 394.00},
-                90	: {4: 13.83, 8: 27.52, 12: 40.22, 16: 53.64, 20: 67.06, 24: 80.48, 30:  98.60, 40: 130.07, 50: 160.91, 60: 191.02, 70: 220.51, 80: 249.28, 90: 277.43, 100: 304.80, 120: 357.60, 150: 426.66},
-                95	: {4: 14.50, 8: 28.88, 12: 42.32, 16: 56.44, 20: 70.56, 24: 84.68, 30: 103.95, 40: 137.28, 50: 170.01, 60: 202.04, 70: 233.49, 80: 264.27, 90: 294.45, 100: 323.89, 120: 380.94, 150: 456.90},
-                100	: {4: 15.11, 8: 30.11, 12: 44.21, 16: 58.96, 20: 73.70, 24: 88.45, 30: 108.76, 40: 143.76, 50: 178.19, 60: 211.96, 70: 245.18, 80: 277.76, 90: 309.76, 100: 341.07, 120: 401.94, 150: 484.12}
-            }
-        }
-
-        wheeled = load_data['mlc_wheeled'][span][loadclass]
-        tracked = load_data['mlc_tracked'][span][loadclass]
+        wheeled = UNIT_MOMENT_MLC['mlc_wheeled'].get(span, loadclass)
+        tracked = UNIT_MOMENT_MLC['mlc_tracked'].get(span, loadclass)
         return np.array(([wheeled , tracked]), dtype=float)
 
     def get_shear_mlc(self, loadclass, span):
@@ -268,104 +437,8 @@ class Load(object):
         return: np.array([x,y], dtype=float)   ; x = MLC wheeled , y = MLC tracked
         """
         
-        load_data = {
-            'mlc_wheeled' : {
-                1	: {4: 22.27, 8: 48.95, 12:  71.22, 16:  84.56, 20:  97.90, 24: 106.83, 30: 129.00, 40: 151.27, 50: 177.95, 60: 204.64, 70: 226.91, 80: 249.17, 90: 266.93, 100: 284.78, 120: 320.40, 150:  373.76},
-                1.5	: {4: 22.27, 8: 48.95, 12:  71.22, 16:  84.56, 20:  97.90, 24: 106.83, 30: 129.00, 40: 151.27, 50: 177.95, 60: 204.64, 70: 226.91, 80: 249.17, 90: 266.93, 100: 284.78, 120: 320.40, 150:  373.76},
-                2	: {4: 22.27, 8: 48.95, 12:  71.22, 16:  84.56, 20: 105.13, 24: 123.68, 30: 136.09, 40: 160.77, 50: 185.59, 60: 204.64, 70: 231.73, 80: 264.82, 90: 297.91, 100: 309.75, 120: 347.63, 150:  373.76},
-                2.5	: {4: 23.58, 8: 48.95, 12:  71.22, 16:  87.51, 20: 114.36, 24: 134.53, 30: 148.03, 40: 174.88, 50: 201.87, 60: 223.00, 70: 260.14, 80: 297.28, 90: 334.42, 100: 354.61, 120: 406.26, 150:  429.08},
-                3	: {4: 24.85, 8: 48.95, 12:  71.22, 16:  92.22, 20: 120.51, 24: 141.77, 30: 155.99, 40: 184.29, 50: 212.73, 60: 239.23, 70: 279.08, 80: 318.92, 90: 358.77, 100: 384.52, 120: 445.35, 150:  482.15},
-                3.5	: {4: 25.76, 8: 48.95, 12:  73.55, 16:  95.58, 20: 124.91, 24: 146.94, 30: 161.68, 40: 191.00, 50: 220.49, 60: 250.82, 70: 292.60, 80: 334.38, 90: 376.16, 100: 405.88, 120: 473.27, 150:  520.06},
-                4	: {4: 27.20, 8: 48.95, 12:  75.49, 16:  98.11, 20: 128.20, 24: 150.82, 30: 165.95, 40: 196.04, 50: 226.31, 60: 259.52, 70: 302.75, 80: 345.97, 90: 389.20, 100: 421.91, 120: 494.21, 150:  548.49},
-                4.5	: {4: 28.63, 8: 48.95, 12:  78.36, 16: 101.43, 20: 132.59, 24: 156.11, 30: 171.99, 40: 199.96, 50: 230.83, 60: 266.28, 70: 310.64, 80: 354.99, 90: 399.34, 100: 434.37, 120: 510.50, 150:  570.61},
-                5	: {4: 29.78, 8: 50.75, 12:  82.10, 16: 105.53, 20: 138.01, 24: 162.75, 30: 179.71, 40: 204.59, 50: 236.16, 60: 271.70, 70: 316.95, 80: 362.20, 90: 407.46, 100: 444.34, 120: 523.53, 150:  588.30},
-                5.5	: {4: 30.72, 8: 53.42, 12:  85.16, 16: 108.89, 20: 142.46, 24: 168.18, 30: 186.03, 40: 212.69, 50: 245.44, 60: 280.27, 70: 327.55, 80: 374.32, 90: 421.09, 100: 456.38, 120: 534.48, 150:  602.78},
-                6	: {4: 31.51, 8: 55.63, 12:  87.71, 16: 111.68, 20: 146.16, 24: 172.70, 30: 191.29, 40: 219.43, 50: 253.18, 60: 289.55, 70: 339.18, 80: 387.63, 90: 436.06, 100: 473.98, 120: 556.69, 150:  621.69},
-                7	: {4: 32.74, 8: 59.12, 12:  91.72, 16: 116.08, 20: 151.98, 24: 179.82, 30: 199.56, 40: 230.03, 50: 266.64, 60: 304.13, 70: 357.46, 80: 408.53, 90: 459.57, 100: 501.63, 120: 591.59, 150:  667.64},
-                8	: {4: 33.66, 8: 61.74, 12:  94.72, 16: 119.37, 20: 156.34, 24: 185.15, 30: 205.76, 40: 243.27, 50: 288.93, 60: 327.55, 70: 378.74, 80: 424.21, 90: 477.21, 100: 522.37, 120: 617.76, 150:  702.10},
-                9	: {4: 34.38, 8: 63.77, 12:  97.06, 16: 121.94, 20: 159.73, 24: 189.30, 30: 210.58, 40: 255.79, 50: 306.27, 60: 352.45, 70: 405.88, 80: 436.40, 90: 490.93, 100: 538.51, 120: 638.12, 150:  728.90},
-                10	: {4: 34.95, 8: 65.40, 12:  98.93, 16: 123.99, 20: 162.45, 24: 192.62, 30: 214.44, 40: 265.80, 50: 320.14, 60: 372.38, 70: 427.58, 80: 458.15, 90: 515.42, 100: 551.41, 120: 654.41, 150:  750.35},
-                11	: {4: 35.42, 8: 66.73, 12: 100.46, 16: 125.66, 20: 164.67, 24: 195.33, 30: 217.60, 40: 273.99, 50: 331.49, 60: 388.68, 70: 445.34, 80: 481.21, 90: 541.38, 100: 568.01, 120: 677.18, 150:  767.89},
-                12	: {4: 35.81, 8: 67.84, 12: 101.74, 16: 127.06, 20: 166.52, 24: 197.60, 30: 220.23, 40: 280.82, 50: 340.95, 60: 402.27, 70: 460.14, 80: 500.43, 90: 563.00, 100: 594.84, 120: 709.75, 150:  787.74},
-                13	: {4: 36.15, 8: 68.78, 12: 102.81, 16: 128.25, 20: 168.09, 24: 199.51, 30: 222.46, 40: 286.59, 50: 349.96, 60: 413.77, 70: 472.66, 80: 516.69, 90: 581.30, 100: 617.55, 120: 737.30, 150:  828.46},
-                14	: {4: 36.43, 8: 69.59, 12: 103.74, 16: 129.26, 20: 169.43, 24: 201.15, 30: 224.37, 40: 291.54, 50: 361.84, 60: 423.62, 70: 483.40, 80: 530.63, 90: 596.99, 100: 637.00, 120: 760.91, 150:  863.36},
-                15	: {4: 36.68, 8: 70.28, 12: 104.54, 16: 130.14, 20: 170.59, 24: 202.58, 30: 226.55, 40: 295.83, 50: 372.13, 60: 432.16, 70: 492.70, 80: 542.71, 90: 610.58, 100: 653.87, 120: 781.38, 150:  893.61},
-                16	: {4: 36.89, 8: 70.89, 12: 105.24, 16: 130.91, 20: 171.61, 24: 203.82, 30: 231.30, 40: 300.83, 50: 381.13, 60: 439.63, 70: 500.84, 80: 553.27, 90: 622.47, 100: 668.62, 120: 799.29, 150:  920.08},
-                17	: {4: 37.08, 8: 71.43, 12: 106.05, 16: 131.59, 20: 172.51, 24: 204.92, 30: 235.49, 40: 307.73, 50: 389.08, 60: 446.22, 70: 508.02, 80: 562.60, 90: 632.97, 100: 681.64, 120: 815.09, 150:  943.43},
-                18	: {4: 37.25, 8: 71.91, 12: 107.58, 16: 132.19, 20: 173.31, 24: 205.90, 30: 239.22, 40: 313.87, 50: 396.14, 60: 455.10, 70: 514.96, 80: 570.89, 90: 642.30, 100: 693.22, 120: 829.14, 150:  964.19},
-                19	: {4: 37.40, 8: 72.34, 12: 108.95, 16: 133.12, 20: 174.02, 24: 206.77, 30: 242.55, 40: 319.36, 50: 402.46, 60: 463.94, 70: 525.56, 80: 578.31, 90: 650.64, 100: 703.57, 120: 841.70, 150:  982.76},
-                20	: {4: 37.54, 8: 72.73, 12: 110.17, 16: 134.70, 20: 175.30, 24: 207.55, 30: 245.55, 40: 324.30, 50: 408.15, 60: 471.89, 70: 535.10, 80: 584.98, 90: 658.16, 100: 712.89, 120: 853.01, 150:  999.48},
-                22	: {4: 37.77, 8: 73.39, 12: 112.30, 16: 137.43, 20: 178.78, 24: 209.95, 30: 250.73, 40: 332.84, 50: 417.97, 60: 485.62, 70: 551.57, 80: 598.76, 90: 673.71, 100: 728.99, 120: 872.55, 150: 1035.31},
-                24	: {4: 37.97, 8: 73.95, 12: 114.06, 16: 139.70, 20: 181.68, 24: 213.22, 30: 255.05, 40: 339.95, 50: 426.16, 60: 497.06, 70: 565.30, 80: 617.09, 90: 694.32, 100: 747.68, 120: 899.20, 150: 1075.11},
-                26	: {4: 38.13, 8: 74.42, 12: 115.56, 16: 141.62, 20: 184.13, 24: 215.99, 30: 258.70, 40: 345.97, 50: 433.08, 60: 506.74, 70: 576.92, 80: 632.59, 90: 711.76, 100: 768.90, 120: 924.50, 150: 1108.78},
-                28	: {4: 38.28, 8: 74.82, 12: 116.84, 16: 143.27, 20: 186.23, 24: 218.36, 30: 261.83, 40: 351.13, 50: 439.02, 60: 515.04, 70: 586.88, 80: 645.88, 90: 726.71, 100: 787.08, 120: 946.19, 150: 1137.65},
-                30	: {4: 38.40, 8: 75.17, 12: 117.95, 16: 144.70, 20: 188.06, 24: 220.41, 30: 264.55, 40: 355.60, 50: 444.17, 60: 522.24, 70: 595.51, 80: 657.40, 90: 739.67, 100: 802.84, 120: 964.98, 150: 1162.66},
-                35	: {4: 39.02, 8: 76.04, 12: 120.18, 16: 147.56, 20: 191.70, 24: 224.52, 30: 269.97, 40: 364.55, 50: 454.46, 60: 536.62, 70: 612.77, 80: 680.43, 90: 765.58, 100: 834.36, 120: 002.57, 150: 1212.70},
-                40	: {4: 43.40, 8: 83.19, 12: 122.89, 16: 150.75, 20: 195.83, 24: 229.35, 30: 276.14, 40: 371.25, 50: 462.18, 60: 547.41, 70: 625.71, 80: 697.71, 90: 785.02, 100: 858.00, 120: 030.77, 150: 1250.22},
-                45	: {4: 47.49, 8: 91.74, 12: 132.80, 16: 162.75, 20: 211.54, 24: 248.01, 30: 297.66, 40: 389.59, 50: 486.92, 60: 570.81, 70: 651.95, 80: 720.95, 90: 811.17, 100: 881.88, 120: 059.29, 150: 1280.49},
-                50	: {4: 50.77, 8: 98.57, 12: 145.74, 16: 178.81, 20: 232.37, 24: 272.32, 30: 326.95, 40: 424.57, 50: 530.34, 60: 611.84, 70: 698.10, 80: 760.47, 90: 855.64, 100: 931.17, 120: 118.33, 150: 1351.23},
-                55	: {4: 53.45, 8: 04.17, 12: 156.76, 16: 192.51, 20: 250.08, 24: 292.87, 30: 352.24, 40: 461.99, 50: 575.96, 60: 666.32, 70: 760.74, 80: 825.97, 90: 929.33, 100: 998.91, 120: 200.40, 150: 1428.78},
-                60	: {4: 55.68, 8: 08.83, 12: 165.95, 16: 203.91, 20: 264.83, 24: 309.99, 30: 373.31, 40: 493.19, 50: 614.00, 60: 714.62, 70: 816.73, 80: 893.58, 90: 005.39, 100: 082.42, 120: 300.46, 150: 1545.18},
-                65	: {4: 57.57, 8: 12.77, 12: 173.73, 16: 213.57, 20: 277.32, 24: 324.48, 30: 391.14, 40: 519.59, 50: 646.18, 60: 755.48, 70: 864.11, 80: 950.79, 90: 069.76, 100: 156.62, 120: 389.37, 150: 1659.07},
-                70	: {4: 59.67, 8: 16.33, 12: 180.39, 16: 221.84, 20: 288.02, 24: 336.90, 30: 406.42, 40: 542.22, 50: 673.77, 60: 790.51, 70: 904.72, 80: 999.82, 90: 124.93, 100: 220.21, 120: 465.57, 150: 1756.69},
-                75	: {4: 63.48, 8: 22.96, 12: 186.17, 16: 229.02, 20: 297.29, 24: 347.66, 30: 419.66, 40: 561.83, 50: 697.68, 60: 820.87, 70: 939.92, 80: 042.32, 90: 172.74, 100: 275.33, 120: 531.62, 150: 1841.30},
-                80	: {4: 67.03, 8: 30.28, 12: 192.32, 16: 236.40, 20: 306.89, 24: 358.93, 30: 433.46, 40: 578.99, 50: 718.60, 60: 847.43, 70: 970.71, 80: 079.51, 90: 214.58, 100: 323.55, 120: 589.40, 150: 1915.33},
-                85	: {4: 70.17, 8: 36.74, 12: 202.97, 16: 249.54, 20: 324.02, 24: 379.10, 30: 457.04, 40: 600.70, 50: 746.44, 60: 874.82, 70: 002.14, 80: 112.32, 90: 251.49, 100: 366.11, 120: 640.39, 150: 1980.65},
-                90	: {4: 72.96, 8: 42.49, 12: 213.95, 16: 263.13, 20: 341.61, 24: 399.57, 30: 482.07, 40: 630.97, 50: 784.05, 60: 910.54, 70: 042.53, 80: 153.69, 90: 298.04, 100: 411.92, 120: 695.30, 150: 2039.79},
-                95	: {4: 75.45, 8: 47.63, 12: 223.77, 16: 275.29, 20: 357.35, 24: 417.88, 30: 504.47, 40: 663.61, 50: 824.08, 60: 957.62, 70: 096.43, 80: 202.44, 90: 352.90, 100: 464.10, 120: 758.37, 150: 2117.20},
-                100	: {4: 77.70, 8: 52.25, 12: 232.61, 16: 286.23, 20: 371.52, 24: 434.36, 30: 524.63, 40: 693.16, 50: 860.31, 60: 003.18, 70: 149.06, 80: 262.37, 90: 420.33, 100: 533.29, 120: 841.31, 150: 2197.83}
-            },
-            'mlc_tracked' : {
-                1	: {4:  9.73, 8:  17.99, 12:  19.48,	16:  25.98, 20:  32.47, 24:  38.97, 30:  39.86, 40:  48.64, 50:  56.19, 60:   62.52, 70:   68.16, 80:   72.95, 90:   77.32, 100:   81.05, 120:   87.53, 150:   91.19},
-                1.5	: {4: 14.59, 8:  26.98, 12:  29.22,	16:  38.96, 20:  48.71, 24:  58.46, 30:  59.78, 40:  72.95, 50:  84.28, 60:   93.79, 70:  102.23, 80:  109.43, 90:  115.97, 100:  121.58, 120:  131.30, 150:  136.78},	
-                2	: {4: 19.32, 8:  35.97, 12:  38.95,	16:  51.95, 20:  64.95, 24:  77.94, 30:  79.71, 40:  97.27, 50: 112.37, 60:  125.05, 70:  136.31, 80:  145.90, 90:  154.63, 100:  162.11, 120:  175.07, 150:  182.37},	
-                2.5	: {4: 22.58, 8:  43.02, 12:  48.69,	16:  64.94, 20:  81.18, 24:  97.43, 30:  99.64, 40: 121.59, 50: 140.46, 60:  156.31, 70:  170.39, 80:  182.38, 90:  193.29, 100:  202.63, 120:  218.84, 150:  227.96},	
-                3	: {4: 24.75, 8:  47.72, 12:  57.99,	16:  77.34, 20:  96.69, 24: 116.04, 30: 119.57, 40: 145.90, 50: 168.55, 60:  187.57, 70:  204.46, 80:  218.86, 90:  231.95, 100:  243.16, 120:  262.60, 150:  273.55},	
-                3.5	: {4: 26.30, 8:  51.08, 12:  64.96,	16:  86.63, 20: 108.30, 24: 129.97, 30: 139.24, 40: 170.22, 50: 196.65, 60:  218.84, 70:  238.54, 80:  255.33, 90:  270.60, 100:  283.69, 120:  306.37, 150:  319.15},	
-                4	: {4: 27.46, 8:  53.59, 12:  70.18,	16:  93.59, 20: 117.00, 24: 140.42, 30: 155.21, 40: 193.13, 50: 224.72, 60:  250.10, 70:  272.62, 80:  291.81, 90:  309.26, 100:  324.21, 120:  350.14, 150:  364.74},	
-                4.5	: {4: 28.37, 8:  55.55, 12:  74.24,	16:  99.01, 20: 123.78, 24: 148.55, 30: 167.63, 40: 211.23, 50: 249.19, 60:  280.63, 70:  306.70, 80:  328.28, 90:  347.92, 100:  364.74, 120:  393.90, 150:  410.33},	
-                5	: {4: 29.09, 8:  57.12, 12:  77.49,	16: 103.34, 20: 129.19, 24: 155.05, 30: 177.57, 40: 225.71, 50: 268.77, 60:  305.96, 70:  338.25, 80:  364.55, 90:  386.58, 100:  405.27, 120:  437.67, 150:  455.92},	
-                5.5	: {4: 29.69, 8:  58.40, 12:  80.15,	16: 106.89, 20: 133.63, 24: 160.37, 30: 185.71, 40: 237.55, 50: 284.79, 60:  326.69, 70:  364.13, 80:  396.14, 90:  423.80, 100:  445.79, 120:  481.44, 150:  501.52},	
-                6	: {4: 30.18, 8:  59.47, 12:  82.36,	16: 109.84, 20: 137.32, 24: 164.80, 30: 192.48, 40: 247.42, 50: 298.14, 60:  343.96, 70:  385.70, 80:  422.46, 90:  455.23, 100:  482.81, 120:  525.21, 150:  547.11},	
-                7	: {4: 30.96, 8:  61.15, 12:  85.84,	16: 114.49, 20: 143.13, 24: 171.77, 30: 203.13, 40: 262.94, 50: 319.12, 60:  371.10, 70:  419.59, 80:  463.82, 90:  504.62, 100:  540.97, 120:  602.61, 150:  638.29},	
-                8	: {4: 31.54, 8:  62.41, 12:  88.46,	16: 117.97, 20: 147.48, 24: 176.99, 30: 211.12, 40: 274.57, 50: 334.85, 60:  391.46, 70:  445.01, 80:  494.85, 90:  541.67, 100:  584.60, 120:  660.77, 150:  724.21},	
-                9	: {4: 31.99, 8:  63.39, 12:  90.49,	16: 120.68, 20: 150.87, 24: 181.06, 30: 217.33, 40: 283.62, 50: 347.09, 60:  407.29, 70:  464.78, 80:  518.98, 90:  570.48, 100:  618.52, 120:  706.01, 150:  792.07},	
-                10	: {4: 32.35, 8:  64.17, 12:  92.11,	16: 122.84, 20: 153.57, 24: 184.31, 30: 222.30, 40: 290.86, 50: 356.88, 60:  419.96, 70:  480.59, 80:  538.28, 90:  593.53, 100:  645.67, 120:  742.20, 150:  846.36},	
-                11	: {4: 32.65, 8:  64.81, 12:  93.44,	16: 124.62, 20: 155.79, 24: 186.97, 30: 226.37, 40: 296.78, 50: 364.89, 60:  430.32, 70:  493.53, 80:  554.07, 90:  612.39, 100:  667.88, 120:  771.81, 150:  890.77},	
-                12	: {4: 32.90, 8:  65.35, 12:  94.55,	16: 126.09, 20: 157.64, 24: 189.18, 30: 229.76, 40: 301.71, 50: 371.56, 60:  438.96, 70:  504.32, 80:  567.23, 90:  628.11, 100:  686.38, 120:  796.49, 150:  927.79},	
-                13	: {4: 33.10, 8:  65.80, 12:  95.49,	16: 127.34, 20: 159.20, 24: 191.06, 30: 232.62, 40: 305.89, 50: 377.21, 60:  446.27, 70:  513.44, 80:  578.37, 90:  641.41, 100:  702.04, 120:  817.37, 150:  959.11},	
-                14	: {4: 33.28, 8:  66.18, 12:  96.29,	16: 128.41, 20: 160.54, 24: 192.67, 30: 235.08, 40: 309.47, 50: 382.05, 60:  452.53, 70:  521.26, 80:  587.92, 90:  652.80, 100:  715.47, 120:  835.26, 150:  985.95},	
-                15	: {4: 33.44, 8:  66.52, 12:  96.99,	16: 129.34, 20: 161.70, 24: 194.06, 30: 237.21, 40: 312.57, 50: 386.24, 60:  457.96, 70:  528.04, 80:  596.19, 90:  662.68, 100:  727.10, 120:  850.77, 150: 1009.22},	
-                16	: {4: 33.57, 8:  66.81, 12:  97.59,	16: 130.16, 20: 162.72, 24: 195.28, 30: 239.07, 40: 315.29, 50: 389.92, 60:  462.71, 70:  533.97, 80:  603.43, 90:  671.33, 100:  737.28, 120:  864.35, 150: 1029.58},	
-                17	: {4: 33.69, 8:  67.07, 12:  98.13,	16: 130.87, 20: 163.61, 24: 196.35, 30: 240.72, 40: 317.68, 50: 393.15, 60:  466.90, 70:  539.21, 80:  609.82, 90:  678.95, 100:  746.26, 120:  876.32, 150: 1047.54},	
-                18	: {4: 33.80, 8:  67.30, 12:  98.61,	16: 131.51, 20: 164.41, 24: 197.31, 30: 242.18, 40: 319.81, 50: 396.03, 60:  470.63, 70:  543.86, 80:  615.49, 90:  685.73, 100:  754.24, 120:  886.96, 150: 1063.51},	
-                19	: {4: 33.90, 8:  67.51, 12:  99.04,	16: 132.08, 20: 165.12, 24: 198.17, 30: 243.49, 40: 321.72, 50: 398.61, 60:  473.96, 70:  548.02, 80:  620.57, 90:  691.80, 100:  761.39, 120:  896.49, 150: 1077.79},	
-                20	: {4: 33.98, 8:  67.70, 12:  99.42,	16: 132.59, 20: 165.76, 24: 198.94, 30: 244.67, 40: 323.43, 50: 400.93, 60:  476.96, 70:  551.77, 80:  625.15, 90:  697.26, 100:  767.82, 120:  905.06, 150: 1090.65},	
-                22	: {4: 34.13, 8:  68.02, 12: 100.09,	16: 133.48, 20: 166.87, 24: 200.26, 30: 246.70, 40: 326.39, 50: 404.93, 60:  482.14, 70:  558.24, 80:  633.04, 90:  706.69, 100:  778.92, 120:  919.87, 150: 1112.86},	
-                24	: {4: 34.25, 8:  68.28, 12: 100.64,	16: 134.22, 20: 167.80, 24: 201.37, 30: 248.39, 40: 328.86, 50: 408.27, 60:  486.46, 70:  563.63, 80:  639.62, 90:  714.55, 100:  788.17, 120:  932.20, 150: 1131.37},	
-                26	: {4: 34.36, 8:  68.51, 12: 101.11,	16: 134.84, 20: 168.58, 24: 202.31, 30: 249.83, 40: 330.95, 50: 411.10, 60:  490.11, 70:  568.19, 80:  645.19, 90:  721.20, 100:  796.00, 120:  942.64, 150: 1147.03},	
-                28	: {4: 34.45, 8:  68.70, 12: 101.51,	16: 135.38, 20: 169.25, 24: 203.11, 30: 251.05, 40: 332.74, 50: 413.52, 60:  493.24, 70:  572.10, 80:  649.96, 90:  726.90, 100:  802.72, 120:  951.59, 150: 1160.45},	
-                30	: {4: 34.52, 8:  68.87, 12: 101.86,	16: 135.84, 20: 169.83, 24: 203.81, 30: 252.12, 40: 334.29, 50: 415.61, 60:  495.96, 70:  575.49, 80:  654.10, 90:  731.84, 100:  808.53, 120:  959.35, 150: 1172.08},	
-                35	: {4: 36.47, 8:  72.32, 12: 104.28,	16: 139.07, 20: 173.86, 24: 208.65, 30: 255.76, 40: 338.37, 50: 420.28, 60:  501.48, 70:  582.27, 80:  662.37, 90:  741.71, 100:  820.17, 120:  974.86, 150: 1195.35},	
-                40	: {4: 40.81, 8:  81.09, 12: 117.46,	16: 156.65, 20: 195.84, 24: 235.03, 30: 285.72, 40: 375.41, 50: 462.56, 60:  546.77, 70:  628.54, 80:  707.51, 90:  785.20, 100:  861.47, 120: 1011.79, 150: 1223.63},	
-                45	: {4: 44.19, 8:  87.90, 12: 128.13,	16: 170.88, 20: 213.62, 24: 256.37, 30: 313.31, 40: 412.81, 50: 510.05, 60:  604.68, 70:  697.13, 80:  787.01, 90:  874.68, 100:  959.58, 120: 1122.50, 150: 1330.83},	
-                50	: {4: 46.89, 8:  93.36, 12: 136.66,	16: 182.26, 20: 227.85, 24: 273.45, 30: 335.39, 40: 442.73, 50: 548.04, 60:  651.00, 70:  752.01, 80:  850.71, 90:  947.41, 100: 1041.61, 120: 1223.83, 150: 1464.70},	
-                55	: {4: 49.10, 8:  97.82, 12: 143.64,	16: 191.57, 20: 239.49, 24: 287.42, 30: 353.45, 40: 467.21, 50: 579.12, 60:  688.90, 70:  796.90, 80:  902.83, 90: 1006.91, 100: 1108.73, 120: 1306.74, 150: 1574.26},	
-                60	: {4: 50.95, 8: 101.54, 12: 149.46,	16: 199.33, 20: 249.19, 24: 299.06, 30: 368.50, 40: 487.61, 50: 605.03, 60:  720.49, 70:  834.32, 80:  946.26, 90: 1056.50, 100: 1164.67, 120: 1375.83, 150: 1665.57},	
-                65	: {4: 52.52, 8: 104.68, 12: 154.39,	16: 205.89, 20: 257.40, 24: 308.91, 30: 381.23, 40: 504.87, 50: 626.95, 60:  747.21, 70:  865.98, 80:  983.01, 90: 1098.46, 100: 1211.99, 120: 1434.29, 150: 1742.82},	
-                70	: {4: 56.09, 8: 111.50, 12: 161.88,	16: 215.89, 20: 269.90, 24: 323.92, 30: 395.16, 40: 521.63, 50: 646.67, 60:  770.31, 70:  893.11, 80: 1014.51, 90: 1134.43, 100: 1252.56, 120: 1484.40, 150: 1809.04},	
-                75	: {4: 59.48, 8: 118.31, 12: 172.44,	16: 229.97, 20: 287.50, 24: 345.03, 30: 421.64, 40: 555.51, 50: 686.34, 60:  813.65, 70:  938.02, 80: 1059.30, 90: 1179.25, 100: 1297.57, 120: 1531.62, 150: 1866.43},	
-                80	: {4: 62.44, 8: 124.27, 12: 181.67,	16: 242.29, 20: 302.90, 24: 363.51, 30: 445.35, 40: 587.54, 50: 726.88, 60:  862.91, 70:  996.19, 80: 1126.22, 90: 1253.44, 100: 1377.16, 120: 1615.89, 150: 1938.32},	
-                85	: {4: 65.05, 8: 129.53, 12: 189.82,	16: 253.15, 20: 316.49, 24: 379.82, 30: 466.28, 40: 615.81, 50: 762.65, 60:  906.38, 70: 1047.52, 80: 1185.62, 90: 1321.06, 100: 1453.21, 120: 1709.30, 150: 2050.48},	
-                90	: {4: 67.37, 8: 134.20, 12: 197.06,	16: 262.81, 20: 328.56, 24: 394.31, 30: 484.88, 40: 640.93, 50: 794.44, 60:  945.02, 70: 1093.15, 80: 1238.42, 90: 1381.17, 100: 1520.80, 120: 1792.32, 150: 2159.05},	
-                95	: {4: 69.45, 8: 138.39, 12: 203.55,	16: 271.46, 20: 339.37, 24: 407.28, 30: 501.52, 40: 663.41, 50: 822.89, 60:  979.59, 70: 1133.97, 80: 1285.67, 90: 1434.95, 100: 1581.28, 120: 1866.61, 150: 2256.20},	
-                100	: {4: 72.06, 8: 143.27, 12: 209.39,	16: 279.26, 20: 349.12, 24: 418.98, 30: 516.50, 40: 683.64, 50: 848.49, 60: 1010.70, 70: 1170.71, 80: 1328.18, 90: 1483.35, 100: 1635.71, 120: 1933.46, 150: 2343.63}	
-
-            }
-        }
-
-        wheeled = load_data['mlc_wheeled'][span][loadclass]
-        tracked = load_data['mlc_tracked'][span][loadclass]
+        wheeled = SHEAR_MLC['mlc_wheeled'].get(span, loadclass)
+        tracked = SHEAR_MLC['mlc_tracked'].get(span, loadclass)
         return np.array(([wheeled , tracked]), dtype=float)
 
     def get_unit_moment_lm1(self, span):
@@ -384,55 +457,7 @@ class Load(object):
 
         return: np.array([x,y], dtype=float)   ; x = MLC wheeled , y = MLC tracked
         """
-        load_data  = {
-            'lm1' : {
-                1	: 108.08,
-                1.5	: 111.50,
-                2	: 114.92,
-                2.5	: 122.39,
-                3	: 142.00,
-                3.5	: 156.99,
-                4	: 169.09,
-                4.5	: 179.25,
-                5	: 188.07,
-                5.5	: 195.91,
-                6	: 203.01,
-                7	: 215.63,
-                8	: 226.80,
-                9	: 237.01,
-                10	: 246.54,
-                11	: 255.59,
-                12	: 264.26,
-                13	: 272.65,
-                14	: 280.82,
-                15	: 288.82,
-                16	: 296.66,
-                17	: 304.39,
-                18	: 312.02,
-                19	: 319.56,
-                20	: 327.04,
-                22	: 341.81,
-                24	: 356.40,
-                26	: 370.85,
-                28	: 385.18,
-                30	: 399.43,
-                35	: 434.76,
-                40	: 469.80,
-                45	: 504.65,
-                50	: 539.36,
-                55	: 573.97,
-                60	: 608.51,
-                65	: 643.00,
-                70	: 677.43,
-                75	: 711.84,
-                80	: 746.21,
-                85	: 780.56,
-                90	: 814.89,
-                95	: 849.21,
-                100	: 883.51
-            }
-        }
-        return load_data['lm1'][span]
+        return UNIT_MOMENT_LM1.get(span, 1)
 
     def get_shear_lm1(self, span):
         """
@@ -452,4 +477,62 @@ class Load(object):
         return: np.array([x,y], dtype=float)   ; x = MLC wheeled , y = MLC tracked
         """
         # TODO fix output
-        return 0
\ No newline at end of file
+        return 0
+
+    def interpolate_unit_moment_mlc(self, loadclass, span, conservative=False):
+        """
+        Returns the unit moment of a certain load class by STANAG 2021 for 
+        arbitrary spans by interpolating the tabulated spans.
+
+        Attributes
+        ----------
+        loadclass : int
+            unique load class of STANAG
+        span : float or array_like
+            Span(s) of the elements [m].
+        conservative : bool
+            Use the value of the next larger tabulated span instead of the linear interpolation.
+
+        Example
+        -------
+        interpolate_unit_moment_mlc(loadclass=40, span=[3.27, 5.8])
+
+        return: np.array([x,y], dtype=float)   ; x = MLC wheeled , y = MLC tracked
+        """
+        wheeled = UNIT_MOMENT_MLC['mlc_wheeled'].interpolate(span, loadclass, conservative)
+        tracked = UNIT_MOMENT_MLC['mlc_tracked'].interpolate(span, loadclass, conservative)
+        return np.array(([wheeled , tracked]), dtype=float)
+
+    def interpolate_shear_mlc(self, loadclass, span, conservative=False):
+        """
+        Returns the unit shear force of a certain load class by STANAG 2021 for 
+        arbitrary spans by interpolating the tabulated spans.
+
+        Attributes
+        ----------
+        loadclass : int
+            unique load class of STANAG
+        span : float or array_like
+            Span(s) of the elements [m].
+        conservative : bool
+            Use the value of the next larger tabulated span instead of the linear interpolation.
+
+        return: np.array([x,y], dtype=float)   ; x = MLC wheeled , y = MLC tracked
+        """
+        wheeled = SHEAR_MLC['mlc_wheeled'].interpolate(span, loadclass, conservative)
+        tracked = SHEAR_MLC['mlc_tracked'].interpolate(span, loadclass, conservative)
+        return np.array(([wheeled , tracked]), dtype=float)
+
+    def interpolate_unit_moment_lm1(self, span, conservative=False):
+        """
+        Returns the unit moment of LM 1 by EUROCODE for arbitrary spans 
+        by interpolating the tabulated spans.
+
+        Attributes
+        ----------
+        span : float or array_like
+            Span(s) of the elements [m].
+        conservative : bool
+            Use the value of the next larger tabulated span instead of the linear interpolation.
+        """
+        return UNIT_MOMENT_LM1.interpolate(span, 1, conservative)
@@ -0,0 +1,97 @@
+"""
+This modul only contains the LoadTable class
+
+Author: Lukas Rauch
+"""
+
+import numpy as np
+
+class LoadTable(object):
+    """
+    Dense, read only lookup table of span dependent load values.
+
+    The table is built once from a nested dictionary {span: {loadclass: value}}
+    and stores the values as a float64 array with sorted span and load class axes.
+
+    Attributes
+    ---------
+    spans : ndarray
+        Sorted span axis [m].
+    loadclasses : ndarray
+        Sorted load class axis.
+    values : ndarray
+        Table values with shape (len(spans), len(loadclasses)).
+    """
+
+    def __init__(self, data):
+        """
+        Create a new table from a nested dictionary.
+        """
+        spans = sorted(data)
+        loadclasses = sorted(data[spans[0]])
+
+        for span in spans:
+            if sorted(data[span]) != loadclasses:
+                raise RuntimeError('The load classes of span {} do not match the table axis!' .format(span))
+
+        self.spans = np.array(spans, dtype=float)
+        self.loadclasses = np.array(loadclasses, dtype=float)
+        self.values = np.array([[data[s][c] for c in loadclasses] for s in spans], dtype=float)
+
+        self.spans.flags.writeable = False
+        self.loadclasses.flags.writeable = False
+        self.values.flags.writeable = False
+
+        self._span_index = {span: i for i, span in enumerate(spans)}
+        self._loadclass_index = {loadclass: i for i, loadclass in enumerate(loadclasses)}
+
+    def get(self, span, loadclass):
+        """
+        Returns the table value of an exact span and load class.
+        Raises a KeyError if the span or the load class is not part of the table.
+        """
+        return self.values[self._span_index[span], self._loadclass_index[loadclass]]
+
+    def interpolate(self, span, loadclass, conservative=False):
+        """
+        Returns the table values of arbitrary spans within the table range.
+
+        Parameters
+        ----------
+        span : float or array_like
+            Span(s) of the elements [m].
+        loadclass : int or array_like
+            Load class(es) of the table axis. Load classes are not interpolated.
+        conservative : bool
+            If True the value of the next larger tabulated span is returned,
+            otherwise the values are linearly interpolated.
+
+        Returns
+        -------
+        values : ndarray
+            Array with the shape of span. If an array of load classes is passed in,
+            the load classes are stacked along the first axis.
+        """
+        span = np.asarray(span, dtype=float)
+        if np.any(span < self.spans[0]) or np.any(span > self.spans[-1]):
+            raise RuntimeError('The span is not within the table range of {} - {} m!' .format(self.spans[0], self.spans[-1]))
+
+        if np.ndim(loadclass) == 0:
+            columns = self._loadclass_index[loadclass]
+        else:
+            columns = [self._loadclass_index[c] for c in loadclass]
+
+        if conservative:
+            upper = np.searchsorted(self.spans, span, side='left')
+            values = self.values[upper][..., columns]
+        else:
+            upper = np.clip(np.searchsorted(self.spans, span, side='right'), 1, len(self.spans) - 1)
+            lower = upper - 1
+            t = (span - self.spans[lower]) / (self.spans[upper] - self.spans[lower])
+            if np.ndim(loadclass) != 0:
+                t = t[..., np.newaxis]
+            values = (1 - t) * self.values[lower][..., columns] + t * self.values[upper][..., columns]
+
+        if np.ndim(loadclass) != 0:
+            values = np.moveaxis(values, -1, 0)
+        return values
@@ -1,9 +1,54 @@
 """
-This modul only contains the Material class
+This modul contains the Material class and the database of material grades.
 
 Author: Lukas Rauch
 """
 
+from .gradetable import GradeTable
+
+# Database of material data. Strengths [N/mm^2], moduli [kN/mm^2], densities [kg/m^3].
+# Steel: the yield strength fy is used as 'fkm', 'fvk' and the other strengths.
+MATERIAL_GRADES = GradeTable({
+    'c14' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 14, 'ft0k':  8, 'ft90k': 0.4, 'fc0k': 16, 'fc90k': 2.0, 'fvk': 3.0, 'e0mean': 7,    'e005': 4.7,  'e90mean': 0.23, 'gmean': 0.44, 'rok': 290, 'romean': 350},
+    'c16' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 16, 'ft0k': 10, 'ft90k': 0.4, 'fc0k': 17, 'fc90k': 2.2, 'fvk': 3.2, 'e0mean': 8,    'e005': 5.4,  'e90mean': 0.27, 'gmean': 0.50, 'rok': 310, 'romean': 370},
+    'c18' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 18, 'ft0k': 11, 'ft90k': 0.4, 'fc0k': 18, 'fc90k': 2.2, 'fvk': 3.4, 'e0mean': 9,    'e005': 6.0,  'e90mean': 0.30, 'gmean': 0.56, 'rok': 320, 'romean': 380},
+    'c20' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 20, 'ft0k': 12, 'ft90k': 0.4, 'fc0k': 19, 'fc90k': 2.3, 'fvk': 3.6, 'e0mean': 9.5,  'e005': 6.4,  'e90mean': 0.32, 'gmean': 0.59, 'rok': 330, 'romean': 390},
+    'c22' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 22, 'ft0k': 13, 'ft90k': 0.4, 'fc0k': 20, 'fc90k': 2.4, 'fvk': 3.8, 'e0mean': 10,   'e005': 6.7,  'e90mean': 0.33, 'gmean': 0.63, 'rok': 340, 'romean': 410},
+    'c24' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 24, 'ft0k': 14, 'ft90k': 0.4, 'fc0k': 21, 'fc90k': 2.5, 'fvk': 4.0, 'e0mean': 11,   'e005': 7.4,  'e90mean': 0.37, 'gmean': 0.69, 'rok': 350, 'romean': 420},
+    'c27' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 27, 'ft0k': 16, 'ft90k': 0.4, 'fc0k': 22, 'fc90k': 2.6, 'fvk': 4.0, 'e0mean': 11.5, 'e005': 7.7,  'e90mean': 0.38, 'gmean': 0.72, 'rok': 370, 'romean': 450},
+    'c30' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 30, 'ft0k': 18, 'ft90k': 0.4, 'fc0k': 23, 'fc90k': 2.7, 'fvk': 4.0, 'e0mean': 12,   'e005': 8.0,  'e90mean': 0.40, 'gmean': 0.75, 'rok': 380, 'romean': 460},
+    'c35' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 35, 'ft0k': 21, 'ft90k': 0.4, 'fc0k': 25, 'fc90k': 2.8, 'fvk': 4.0, 'e0mean': 13,   'e005': 8.7,  'e90mean': 0.43, 'gmean': 0.81, 'rok': 400, 'romean': 480},
+    'c40' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 40, 'ft0k': 24, 'ft90k': 0.4, 'fc0k': 26, 'fc90k': 2.9, 'fvk': 4.0, 'e0mean': 14,   'e005': 9.4,  'e90mean': 0.47, 'gmean': 0.88, 'rok': 420, 'romean': 500},
+    'c45' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 45, 'ft0k': 27, 'ft90k': 0.4, 'fc0k': 27, 'fc90k': 3.1, 'fvk': 4.0, 'e0mean': 15,   'e005': 10.0, 'e90mean': 0.50, 'gmean': 0.94, 'rok': 440, 'romean': 520},
+    'c50' :{'materialtype': 'wood', 'woodentype': 'vh', 'fkm': 50, 'ft0k': 30, 'ft90k': 0.4, 'fc0k': 29, 'fc90k': 3.2, 'fvk': 4.0, 'e0mean': 16,   'e005': 10.7, 'e90mean': 0.53, 'gmean': 1.00, 'rok': 460, 'romean': 550},
+    'gl24h' :{'materialtype': 'wood', 'woodentype': 'bsh', 'fkm': 24, 'ft0k': 19.2, 'ft90k': 0.5, 'fc0k': 24, 'fc90k': 2.5, 'fvk': 3.5, 'e0mean': 11.5, 'e005': 9.6,  'e90mean': 0.30, 'gmean': 0.65, 'rok': 385, 'romean': 420},
+    'gl28h' :{'materialtype': 'wood', 'woodentype': 'bsh', 'fkm': 28, 'ft0k': 22.3, 'ft90k': 0.5, 'fc0k': 28, 'fc90k': 2.5, 'fvk': 3.5, 'e0mean': 12.6, 'e005': 10.5, 'e90mean': 0.30, 'gmean': 0.65, 'rok': 425, 'romean': 460},
+    'gl30h' :{'materialtype': 'wood', 'woodentype': 'bsh', 'fkm': 30, 'ft0k': 24.0, 'ft90k': 0.5, 'fc0k': 30, 'fc90k': 2.5, 'fvk': 3.5, 'e0mean': 13.6, 'e005': 11.3, 'e90mean': 0.30, 'gmean': 0.65, 'rok': 430, 'romean': 480},
+    'gl32h' :{'materialtype': 'wood', 'woodentype': 'bsh', 'fkm': 32, 'ft0k': 25.6, 'ft90k': 0.5, 'fc0k': 32, 'fc90k': 2.5, 'fvk': 3.5, 'e0mean': 14.2, 'e005': 11.8, 'e90mean': 0.30, 'gmean': 0.65, 'rok': 440, 'romean': 490},
+    's235' :{'materialtype': 'steal', 'woodentype': '', 'fkm': 235, 'ft0k': 235, 'ft90k': 235, 'fc0k': 235, 'fc90k': 235, 'fvk': 235, 'e0mean': 210, 'e005': 210, 'e90mean': 210, 'gmean': 81, 'rok': 7850, 'romean': 7850},
+    's355' :{'materialtype': 'steal', 'woodentype': '', 'fkm': 355, 'ft0k': 355, 'ft90k': 355, 'fc0k': 355, 'fc90k': 355, 'fvk': 355, 'e0mean': 210, 'e005': 210, 'e90mean': 210, 'gmean': 81, 'rok': 7850, 'romean': 7850}
+})
+
+# k_mod by "Nutzungsklasse" NKL and KLED
+KMOD = {
+    1 : {'staendig': 0.6, 'lang': 0.7,  'mittel': 0.8,  'kurz': 0.9, 'k_sk': 1.0, 'sehr_kurz': 1.1},
+    2 : {'staendig': 0.6, 'lang': 0.7,  'mittel': 0.8,  'kurz': 0.9, 'k_sk': 1.0, 'sehr_kurz': 1.1},
+    3 : {'staendig': 0.5, 'lang': 0.55, 'mittel': 0.65, 'kurz': 0.7, 'k_sk': 0.8, 'sehr_kurz': 0.9}
+}
+
+
+def material_from_grade(id, grade):
+    """
+    Returns a new Material with the values of a grade of MATERIAL_GRADES
+    (e.g. 'c24', 'gl28h', 's355'). The Young's modulus is converted to [N/mm^2].
+    """
+    values = MATERIAL_GRADES.record(grade)
+
+    return Material(id, values['materialtype'], density=values['romean'], youngs_modulus=1000*values['e0mean'],
+        fmk=values['fkm'], fvk=values['fvk'], ft0k=values['ft0k'], ft90k=values['ft90k'],
+        fc0k=values['fc0k'], fc90k=values['fc90k'], woodentype=values['woodentype'] or 'vh')
+
+
 class Material(object):
     """
     Material data of a local cross section.
@@ -26,12 +71,14 @@ class Material(object):
         Compression stiffness parallel to material fiber.
     fc90k : float
         Compression stiffness vertical to material fiber.
+    woodentype : str
+        Vollholz = 'vh' or Brettschichtholz = 'bsh', used for kcr.
 
     """
 
     def __init__(self, id, materialtype='wood',
         density=0, youngs_modulus=0, fmk=0, fvk=0, 
-        ft0k=0, ft90k=0, fc0k=0, fc90k=0):
+        ft0k=0, ft90k=0, fc0k=0, fc90k=0, woodentype='vh'):
         """
         Create a new material.
         """
@@ -45,6 +92,7 @@ class Material(object):
         self.ft90k = ft90k
         self.fc0k = fc0k
         self.fc90k = fc90k
+        self.woodentype = woodentype
 
     def get_actual_location(self):
         """
@@ -62,44 +110,33 @@ class Material(object):
 
     def get_material_wood(self, materialclass):
         """
-        Database of material data: wood
+        Database of material data: wood (see MATERIAL_GRADES)
         """
-        materialdata = {
-            'c14' :{'fkm': 14, 'ft0k':  8, 'ft90k': 0.4, 'fc0k': 16, 'fc90k': 2.0, 'fvk': 3.0, 'e0mean': 7,    'e005': 4.7,  'e90mean': 0.23, 'gmean': 0.44, 'rok': 290, 'romean': 350},
-            'c16' :{'fkm': 16, 'ft0k': 10, 'ft90k': 0.4, 'fc0k': 17, 'fc90k': 2.2, 'fvk': 3.2, 'e0mean': 8,    'e005': 5.4,  'e90mean': 0.27, 'gmean': 0.50, 'rok': 310, 'romean': 370},
-            'c18' :{'fkm': 18, 'ft0k': 11, 'ft90k': 0.4, 'fc0k': 18, 'fc90k': 2.2, 'fvk': 3.4, 'e0mean': 9,    'e005': 6.0,  'e90mean': 0.30, 'gmean': 0.56, 'rok': 320, 'romean': 380},
-            'c20' :{'fkm': 20, 'ft0k': 12, 'ft90k': 0.4, 'fc0k': 19, 'fc90k': 2.3, 'fvk': 3.6, 'e0mean': 9.5,  'e005': 6.4,  'e90mean': 0.32, 'gmean': 0.59, 'rok': 330, 'romean': 390},
-            'c22' :{'fkm': 22, 'ft0k': 13, 'ft90k': 0.4, 'fc0k': 20, 'fc90k': 2.4, 'fvk': 3.8, 'e0mean': 10,   'e005': 6.7,  'e90mean': 0.33, 'gmean': 0.63, 'rok': 340, 'romean': 410},
-            'c24' :{'fkm': 24, 'ft0k': 14, 'ft90k': 0.4, 'fc0k': 21, 'fc90k': 2.5, 'fvk': 4.0, 'e0mean': 11,   'e005': 7.4,  'e90mean': 0.37, 'gmean': 0.69, 'rok': 350, 'romean': 420},
-            'c27' :{'fkm': 27, 'ft0k': 16, 'ft90k': 0.4, 'fc0k': 22, 'fc90k': 2.6, 'fvk': 4.0, 'e0mean': 11.5, 'e005': 7.7,  'e90mean': 0.38, 'gmean': 0.72, 'rok': 370, 'romean': 450},
-            'c30' :{'fkm': 30, 'ft0k': 18, 'ft90k': 0.4, 'fc0k': 23, 'fc90k': 2.7, 'fvk': 4.0, 'e0mean': 12,   'e005': 8.0,  'e90mean': 0.40, 'gmean': 0.75, 'rok': 380, 'romean': 460},
-            'c35' :{'fkm': 35, 'ft0k': 21, 'ft90k': 0.4, 'fc0k': 25, 'fc90k': 2.8, 'fvk': 4.0, 'e0mean': 13,   'e005': 8.7,  'e90mean': 0.43, 'gmean': 0.81, 'rok': 400, 'romean': 480},
-            'c40' :{'fkm': 40, 'ft0k': 24, 'ft90k': 0.4, 'fc0k': 26, 'fc90k': 2.9, 'fvk': 4.0, 'e0mean': 14,   'e005': 9.4,  'e90mean': 0.47, 'gmean': 0.88, 'rok': 420, 'romean': 500},
-            'c45' :{'fkm': 45, 'ft0k': 27, 'ft90k': 0.4, 'fc0k': 27, 'fc90k': 3.1, 'fvk': 4.0, 'e0mean': 15,   'e005': 10.0, 'e90mean': 0.50, 'gmean': 0.94, 'rok': 440, 'romean': 520},
-            'c50' :{'fkm': 50, 'ft0k': 30, 'ft90k': 0.4, 'fc0k': 29, 'fc90k': 3.2, 'fvk': 4.0, 'e0mean': 16,   'e005': 10.7, 'e90mean': 0.53, 'gmean': 1.00, 'rok': 460, 'romean': 550}
-        }
-
-        return materialdata[materialclass]
+        if MATERIAL_GRADES.get(materialclass, 'materialtype') != 'wood':
+            raise RuntimeError('The material grade {} is not a wood grade!' .format(materialclass))
+
+        record = MATERIAL_GRADES.record(materialclass)
+        del record['materialtype'], record['woodentype']
+
+        return record
 
     def get_kmod(self, nkl, kled):
         """
         returns k_mod factor depending on the "Nutzungsklasse" NKL and KLED.
         Function only valid for "Vollholz" VH and "Brettschichtholz" BSH.
         """
-        kmod_data = {
-            1 : {'staendig': 0.6, 'lang': 0.7,  'mittel': 0.8,  'kurz': 0.9, 'k_sk': 1.0, 'sehr_kurz': 1.1},
-            2 : {'staendig': 0.6, 'lang': 0.7,  'mittel': 0.8,  'kurz': 0.9, 'k_sk': 1.0, 'sehr_kurz': 1.1},
-            3 : {'staendig': 0.5, 'lang': 0.55, 'mittel': 0.65, 'kurz': 0.7, 'k_sk': 0.8, 'sehr_kurz': 0.9}
-        }
+        return KMOD[nkl][kled]
 
-        return kmod_data[nkl][kled]
-
-    def get_kcr(self, woodentype='vh'):
+    def get_kcr(self, woodentype=None):
         """
         Returns the factor kcr depending on the wooden class 
         (Vollholz = 'vh', Brettschichtholz='bsh' and the characteristic s
         hear resistance value of the material.)
+        If no woodentype is passed in, the woodentype of the material is used.
         """
+        if woodentype is None:
+            woodentype = self.woodentype
+
         if woodentype == 'vh':
             kcr = 2.0/self.fvk
         elif woodentype == 'bsh':
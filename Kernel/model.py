@@ -6,17 +6,29 @@ Authors: Lukas Rauch
 import numpy as np
 import numpy.linalg as la
 import operator 
-from .node import Node
-from .element import Element
-from .material import Material
-from .crosssection import Crosssection
-from .load import Load
-from .eurocode import Eurocode
+from .node import Node, NodeStore
+from .element import Element, ElementStore
+from .material import Material, material_from_grade
+from .crosssection import Crosssection, rectangle_properties
+from .load import Load, MLC_LOADCLASSES
+from .eurocode import Eurocode, _admissible
 from .substructure import Substructure
-from .graphic import Graphic
+from .forcecache import FORCE_CACHE
+from .fem import FemSolver
+from .influence import InfluenceLines
+from .profiler import Profiler
+from .reliability import MonteCarlo
 
 #FIXIT import module node
 
+# number of catalogue sections checked at once per element by optimize_sections
+SEARCH_WINDOW = 32
+
+# fields of the element result records of solve_all_elements and iter_solve
+ELEMENT_RESULTS = [('id', object), ('moment', float), ('shear', float),
+    ('nu_mk', float), ('nu_qk', float), ('nu_md', float), ('nu_qd', float),
+    ('nu_vmk', float), ('nu_vmd', float)]
+
 class Model(object):
     """A Model contains all the objects that build the element model.
         Nodes, elements, loads, conditions..
@@ -44,6 +56,11 @@ class Model(object):
         self._elements = dict()
         # self._element_keys = list()
 
+        # columnar storage of the node and element data, the Node and
+        # Element objects are views on the rows of the stores
+        self._node_store = NodeStore()
+        self._element_store = ElementStore()
+
         self._materials = dict()
         # self._material_keys = list()
 
@@ -59,8 +76,41 @@ class Model(object):
         self._loadclasses = dict()
 
         self.ec = Eurocode()
+
+        # memoization of the element forces, shared by all models of the process by default
+        self.force_cache = FORCE_CACHE
+
+        # state of the incremental solve: results and change snapshot per (load_id, lm1),
+        # load case of the forces stored on the elements and substructures to update
+        self._solve_state = dict()
+        self._forces_key = None
+        self._dirty_supports = set()
+
+        # support incidence matrix with the structure key it belongs to
+        self._support_incidence = None
+
+        # FE solver and influence lines with the structure signature they belong to
+        self._fem_solver = None
+        self._influence_lines = None
         pass
 
+    def __getstate__(self):
+        """
+        The process wide force cache is not pickled. A model that is loaded in
+        another process (e.g. a worker of the BatchRunner) uses the cache of 
+        that process.
+        """
+        state = self.__dict__.copy()
+        if state['force_cache'] is FORCE_CACHE:
+            state['force_cache'] = None
+            state['_shared_force_cache'] = True
+        return state
+
+    def __setstate__(self, state):
+        if state.pop('_shared_force_cache', False):
+            state['force_cache'] = FORCE_CACHE
+        self.__dict__.update(state)
+
 
 # === get model information
     @property
@@ -200,7 +250,7 @@ class Model(object):
         if id in self._nodes:
             raise RuntimeError('The model already contains a node with id: {}' .format(id))
 
-        self._nodes[id] = Node(id, x, y)
+        self._nodes[id] = Node(id, x, y, store=self._node_store)
 
     def add_element(self, id, node_a, node_b, crosssection, material):
         """
@@ -228,7 +278,8 @@ class Model(object):
             raise RuntimeError('The model does not contain a node with id {}'.format(node_b))
 
         self._elements[id] = Element(
-            id, self._nodes[node_a], self._nodes[node_b], self._materials[material], self._crosssections[crosssection])
+            id, self._nodes[node_a], self._nodes[node_b], self._materials[material], self._crosssections[crosssection],
+            store=self._element_store)
 
         self._nodes[node_a].update_element_list(element_id=id) 
         self._nodes[node_b].update_element_list(element_id=id) 
@@ -263,6 +314,22 @@ class Model(object):
         self._materials[id] = Material(
             id, materialtype, density, youngs_modulus, fmk, fvk, ft0k, ft90k, fc0k, fc90k)
         
+    def add_material_from_grade(self, id, grade=None):
+        """Add a new material with the values of a material grade to the model.
+
+        Parameters 
+        ---------
+        id : int or str
+            Unique matrial ID.
+        grade : str
+            Grade of MATERIAL_GRADES, e.g. 'c24', 'gl28h' or 's355'. 
+            If None, the id is used as grade.
+        """
+        if id in self._materials:
+            raise RuntimeError('The model already contains a material with id: {}' .format(id))
+
+        self._materials[id] = material_from_grade(id, id if grade is None else grade)
+
     def add_crosssection(self, id, hight, width):
         """
         Add a new local element cross section to the model
@@ -295,7 +362,7 @@ class Model(object):
 
 # === solving
 
-    def calc_forces(self, element_id, load_id, lm1=False):
+    def calc_forces(self, element_id, load_id, lm1=False, conservative=False):
         """
         Calculates the bending moment and the shearforces of the passed in element
         
@@ -304,90 +371,120 @@ class Model(object):
 
         id : str
             Unique ID of an existing element.
+        conservative : bool
+            Use the next larger tabulated span instead of interpolating the load tables.
         """
         span = self._elements[element_id].get_actual_length()
-        loadclass = self._loadclasses[load_id].loadclass
-
-        mlc_unit_m = self._loadclasses[load_id].get_unit_moment_mlc(loadclass, span)
-        mlc_q = self._loadclasses[load_id].get_shear_mlc(loadclass, span)
-        unit_m_max = mlc_unit_m[np.argmax(mlc_unit_m)]
-        q_max = mlc_q[np.argmax(mlc_q)]
+        load = self._loadclasses[load_id]
 
-        if lm1:
-            lm1_unit_m = self._loadclasses[load_id].get_unit_moment_lm1(span)
-            lm1_q = self._loadclasses[load_id].get_shear_lm1(span)
-
-            unit_m_max = max(unit_m_max, lm1_unit_m)
-            q_max = max(q_max, lm1_q)
-
-        m_max = span * unit_m_max
+        m_max, q_max = self._calc_forces_arrays(load, np.array([span]), load.loadclass, lm1, conservative)
+        m_max = m_max[0]
+        q_max = q_max[0]
 
         self._elements[element_id].forces['moment'] = m_max
         self._elements[element_id].forces['q_a'] = q_max
         self._elements[element_id].forces['q_e'] = q_max
+        self._forces_key = None
 
         return  [m_max, q_max]
 
-    def design_crosssection(self, element_id, load_id, lm1=False):
+    def calc_forces_all(self, load_id, lm1=False, conservative=False):
         """
-        Tool for designing a given cross section by the passed in load.
-        distinguishes by the material type
+        Calculates the bending moment and the shearforces of all elements 
+        in one vectorized pass over the load tables.
+
+        Returns
+        -------
+        forces : list
+            [m_max, q_max] arrays in the order of the model elements.
         """
+        span = self.get_element_lengths()
+        load = self._loadclasses[load_id]
 
-        Gg = self.ec.Gg
-        Gq = self.ec.Gq
+        m_max, q_max = self._calc_forces_arrays(load, span, load.loadclass, lm1, conservative)
+        self._store_forces(m_max, q_max)
 
-        materialtype = self._elements[element_id].material.materialtype 
-        material = self._elements[element_id].material
-        crosssection = self._elements[element_id].crosssection
-        
-        Wy = crosssection.Wy
-        mk_max , qk_max =  self.calc_forces(element_id, load_id, lm1=False)
+        return [m_max, q_max]
 
-        if materialtype == 'wood':
-            kcr = self._materials[material.id].get_kcr()
-            kmod = self._materials[material.id].get_kmod(nkl=1, kled='kurz')
-            
-            kh = (150/crosssection.hight*1000)**0.2  # TODO fix problem with variable units. kh has to be [mm] !
-            if kh >= 1.3:
-                kh = 1.3
-            if kh <= 1.0:
-                kh = 1.0
+    def _store_forces(self, m_max, q_max, index=None, key=None):
+        """
+        Stores the force arrays in the order of the model elements on the elements.
+        If an index array is passed in, only these elements are updated. The key 
+        marks the load case of the stored forces for the incremental solve.
+        """
+        if index is None:
+            index = slice(0, self._element_store.size)
 
-            fmk = material.fmk
-            fvk = material.fvk
+        self._element_store.moment[index] = m_max
+        self._element_store.q_a[index] = q_max
+        self._element_store.q_e[index] = q_max
+        self._forces_key = key
 
-            Gm = self.ec.Gm_w
-            fmd = fmk/Gm
-            fvd = fvk/Gm
+    def _calc_forces_arrays(self, load, span, loadclass, lm1=False, conservative=False):
+        """
+        Maximum moments and shear forces for an array of spans. If an array of load classes 
+        is passed in, the results are stacked with one row per load class.
 
-            nu_mk = mk_max/(1000*Wy*fmk)                                # fix Teislicherheitsbeiwerte
-            nu_qk = 1.5*qk_max/(1000*kcr*crosssection.area*fvk)      # fix Teislicherheitsbeiwerte 
-            
-            nu_md = Gq*mk_max/(1000*Wy*fmd)                             # fix Teislicherheitsbeiwerte
-            nu_qd = 1.5*Gq*qk_max/(1000*kcr*crosssection.area*fvd)     # fix Teislicherheitsbeiwerte 
+        For a single load class the results of every distinct span are looked up in
+        and stored to the force cache of the model.
+        """
+        cache = self.force_cache
+        if cache is None or np.ndim(loadclass) != 0:
+            return self._calc_forces_tables(load, span, loadclass, lm1, conservative)
+
+        unique, inverse = np.unique(span, return_inverse=True)
+        if len(unique) > cache.maxsize:
+            return self._calc_forces_tables(load, span, loadclass, lm1, conservative)
+
+        m_unique = np.empty(len(unique), dtype=float)
+        q_unique = np.empty(len(unique), dtype=float)
+        keys = [(s, loadclass, load.loadtype, lm1, conservative) for s in unique.tolist()]
+        missing = []
+        for i, key in enumerate(keys):
+            value = cache.get(key)
+            if value is None:
+                missing.append(i)
+            else:
+                m_unique[i], q_unique[i] = value
+
+        if missing:
+            m_missing, q_missing = self._calc_forces_tables(load, unique[missing], loadclass, lm1, conservative)
+            m_unique[missing] = m_missing
+            q_unique[missing] = q_missing
+            for i, m, q in zip(missing, m_missing.tolist(), q_missing.tolist()):
+                cache.put(keys[i], (m, q))
+
+        inverse = inverse.reshape(np.shape(span))
+        return [m_unique[inverse], q_unique[inverse]]
+
+    def _calc_forces_tables(self, load, span, loadclass, lm1=False, conservative=False):
+        """
+        Maximum moments and shear forces of the load tables without cache.
+        """
+        unit_m_max = np.max(load.interpolate_unit_moment_mlc(loadclass, span, conservative), axis=0)
+        q_max = np.max(load.interpolate_shear_mlc(loadclass, span, conservative), axis=0)
+
+        if lm1:
+            unit_m_max = np.maximum(unit_m_max, load.interpolate_unit_moment_lm1(span, conservative))
+            q_max = np.maximum(q_max, load.get_shear_lm1(span))
 
-        elif materialtype == 'steal':
-            Gm = self.ec.Gm_s0
+        return [span * unit_m_max, q_max]
 
-            fyk = material.fmk
-            fyd = fyk/Gm
-            av = 0.4*crosssection.area      # TODO fix correct crosssection area web - 0.4 is only approximation 
+    def design_crosssection(self, element_id, load_id, lm1=False):
+        """
+        Tool for designing a given cross section by the passed in load.
+        distinguishes by the material type (see Eurocode.design_check)
+        """
+        material = self._elements[element_id].material
+        crosssection = self._elements[element_id].crosssection
+        kcr = self._materials[material.id].get_kcr() if material.materialtype == 'wood' else np.nan
 
-            nu_mk = mk_max/(1000*Wy*fyk)
-            nu_qk = np.sqrt(3)*qk_max/(1000*av*fyk)
+        mk_max , qk_max =  self.calc_forces(element_id, load_id, lm1=False)
 
-            nu_vmk =  nu_mk**2 + 3*nu_qk**2
-            
-            nu_md = Gq*mk_max/(1000*Wy*fyd)
-            nu_qd = np.sqrt(3)*Gq*qk_max/(1000*av*fyd)    
-            
-            nu_vmd =  nu_md**2 + 3*nu_qd**2
+        nu = self.ec.design_check(mk_max, qk_max, crosssection.Wy, crosssection.area, 
+            material.fmk, material.fvk, kcr, material.materialtype)
 
-        else:
-            raise RuntimeError('Material with type "{}" is not part of the library. Solving the system is not possible!' .format(id))
-        
-        return {'nu_mk': nu_mk, 'nu_qk': nu_qk, 'nu_md': nu_md, 'nu_qd': nu_qd}
+        return {name: value[()] for name, value in nu.items()}
 
     def solve_element(self, element_id, load_id, lm1=False, design=True):
         """
@@ -414,17 +511,641 @@ class Model(object):
     def solve(self, load_id, design=True):
         """
         Function that solves all elements for one certain load case.
+
+        After a first solve only the elements changed since the last solve of
+        the load case and the support forces of their nodes are recalculated
+        (see solve_all_elements).
         """
+        results, changed = self._solve_incremental(load_id=load_id)
 
-        out = np.empty((0,2), float)
-        for i, id in enumerate(self._elements.keys()):
-            element = self._elements[id]
-            temp = self.solve_element(element_id=id, load_id=load_id, design=design)
+        if changed is None:
+            self.calc_supportforce_auto()
+        else:
+            node_ids = set(self._dirty_supports)
+            for id in results['id'][changed]:
+                node_ids.add(self._elements[id].node_a.id)
+                node_ids.add(self._elements[id].node_b.id)
+            self.calc_supportforce_auto(node_ids)
 
-            out = np.append(out, temp, axis=0)
+        if design:
+            return np.column_stack((results['nu_md'], results['nu_qd']))
+        else:
+            return np.column_stack((results['nu_mk'], results['nu_qk']))
+
+    def get_fem_solver(self, supports=None):
+        """
+        Returns the FE solver of the model (see FemSolver). The solver and its
+        factorisation are kept until the nodes, elements, youngs moduli, cross 
+        sections or supports change.
+        """
+        key = (None if supports is None else tuple(supports), self._structure_signature())
+        if self._fem_solver is None or self._fem_solver[0] != key:
+            self._fem_solver = (key, FemSolver.from_model(self, supports))
+
+        return self._fem_solver[1]
+
+    def _fem_loads(self, solver, nodal_loads=None, element_loads=None, index=None):
+        """
+        Load vector and line loads of the FE solver from loads by node and element IDs.
+        """
+        if index is None:
+            index = {id: i for i, id in enumerate(solver.node_ids)}
+
+        if nodal_loads is not None:
+            for id in nodal_loads:
+                if id not in index:
+                    raise RuntimeError('The model does not contain a node with id {}'.format(id))
+            nodal_loads = {index[id]: values for id, values in nodal_loads.items()}
+
+        if isinstance(element_loads, dict):
+            loads = np.zeros(len(solver.element_ids), dtype=float)
+            for i, id in enumerate(solver.element_ids):
+                loads[i] = element_loads.get(id, 0)
+            element_loads = loads
+
+        return solver.load_vector(nodal_loads, element_loads), solver._line_loads(element_loads)
+
+    def solve_fem(self, nodal_loads=None, element_loads=None, supports=None):
+        """
+        Solves the model as continuous beam structure with the FE solver.
+        The internal forces are stored on the elements and the vertical 
+        reactions on the supported nodes.
+
+        Parameters
+        ----------
+        nodal_loads : dict
+            node_id : [Fx, Fy, M] in global directions [kN, kNm].
+        element_loads : dict or float
+            element_id : line load [kN/m] perpendicular to the element axis,
+            positive downwards. A float is applied to all elements.
+        supports : list
+            IDs of the supported nodes. Defaults to the substructure nodes.
+
+        Returns
+        -------
+        results : dict
+            Results of FemSolver.solve.
+        """
+        solver = self.get_fem_solver(supports)
+        load, q = self._fem_loads(solver, nodal_loads, element_loads)
+        results = solver._results(load, q)
+
+        # end forces with the sign convention of _store_forces: the forces the element
+        # puts on its end nodes, positive downwards
+        forces = results['element_forces']
+        moment = np.max(np.abs([forces['moment_a'], forces['moment_b'], forces['moment_field']]), axis=0)
+        self._store_forces(moment, forces['shear_a'])
+        self._element_store.q_e[:self._element_store.size] = -forces['shear_b']
+
+        for i in solver.supports:
+            self._nodes[solver.node_ids[i]].support_y = results['reactions'][i, 1]
+
+        return results
+
+    def solve_fem_cases(self, cases, supports=None):
+        """
+        Solves many load cases of the model with one factorisation of the
+        stiffness matrix as one block. Nothing is stored on the elements.
+
+        Parameters
+        ----------
+        cases : list
+            Load cases as tuples (nodal_loads, element_loads), see solve_fem.
+        supports : list
+            IDs of the supported nodes. Defaults to the substructure nodes.
+
+        Returns
+        -------
+        results : dict
+            Results of FemSolver.solve_block with one column per load case.
+        """
+        solver = self.get_fem_solver(supports)
+        index = {id: i for i, id in enumerate(solver.node_ids)}
+        loads = [self._fem_loads(solver, nodal_loads, element_loads, index) for nodal_loads, element_loads in cases]
+
+        load = np.column_stack([load for load, q in loads])
+        q = np.column_stack([q for load, q in loads])
+
+        return solver._results(load, q)
+
+    def _structure_signature(self):
+        """
+        Key of the current structure: number and moves of the nodes, changes of the 
+        elements, stiffness of the materials and cross sections and the supports.
+        """
+        nodes = self._node_store
+        store = self._element_store
+        n = store.size
+
+        return (nodes.size, nodes.revision, n, int(store.revision[:n].sum()),
+                tuple(m.youngs_modulus for m in store.materials),
+                tuple((c.Iy, c.area) for c in store.crosssections),
+                tuple(self._substructures))
+
+    def get_influence_lines(self, step=0.1):
+        """
+        Returns the influence lines of the element forces (see InfluenceLines).
+        The influence lines are kept until the structure changes.
+        """
+        key = (step, self._structure_signature())
+        if self._influence_lines is None or self._influence_lines[0] != key:
+            self._influence_lines = (key, InfluenceLines(self, step))
 
-        self.calc_supportforce_auto()
-        return out
+        return self._influence_lines[1]
+
+    def solve_moving_load(self, load_id, step=0.1):
+        """
+        Calculates the envelope of the element forces of the vehicle of a load 
+        class crossing the bridge in both directions with the influence lines of
+        the FE model. The maximum absolute moments and shear forces are stored 
+        on the elements.
+
+        Returns
+        -------
+        envelope : ndarray
+            Structured array of InfluenceLines.envelope.
+        """
+        load = self._loadclasses[load_id]
+        envelope = self.get_influence_lines(step).envelope(load.loadtype, load.loadclass)
+
+        moment = np.maximum(envelope['moment_max'], -envelope['moment_min'])
+        self._store_forces(moment, envelope['shear'])
+
+        return envelope
+
+    def solve_reliability(self, load_id, samples=1000000, seed=None, lm1=False, **options):
+        """
+        Monte Carlo estimate of the failure probability and the reliability
+        index of all elements for one load class (see MonteCarlo).
+
+        Returns
+        -------
+        results : ndarray
+            Structured array with the fields 'id', 'failures', 'pf', 'beta', 'cov_pf'.
+        """
+        return MonteCarlo(samples, seed, **options).run(self, load_id, lm1)
+
+    def get_element_vectors(self):
+        """
+        Returns the 2D orientation vectors of all elements as array 
+        with shape (number of elements, 2) in the order of the model elements.
+        The geometry is cached and only recalculated for moved nodes.
+        """
+        store = self._element_store
+        store.update_geometry(self._node_store)
+
+        return np.column_stack((store.dx[:store.size], store.dy[:store.size]))
+
+    def get_element_lengths(self):
+        """
+        Returns the lengths of all elements in the order of the model elements.
+        The geometry is cached and only recalculated for moved nodes.
+        """
+        store = self._element_store
+        store.update_geometry(self._node_store)
+
+        return store.length[:store.size].copy()
+
+    def get_element_arrays(self, index=None):
+        """
+        Gathers the span, cross section and material data of all elements 
+        in contiguous arrays in the order of the model elements.
+        If an index array or a slice is passed in, only these elements are gathered.
+
+        Returns
+        -------
+        data : dict
+            Dictionary of arrays: 'id', 'span', 'hight', 'Wy', 'area', 'fmk', 'fvk', 'kcr', 'materialtype'
+        """
+        store = self._element_store
+        materials = store.materials
+        crosssections = store.crosssections
+        material = store.material[:store.size]
+        crosssection = store.crosssection[:store.size]
+        ids = store.id[:store.size]
+        store.update_geometry(self._node_store)
+        span = store.length[:store.size]
+
+        if index is not None:
+            material = material[index]
+            crosssection = crosssection[index]
+            ids = ids[index]
+            span = span[index]
+        span = span.copy()
+
+        kcr = [m.get_kcr() if m.materialtype == 'wood' else np.nan for m in materials]
+
+        data = {
+            'id': ids.copy(),
+            'span': span,
+            'hight': np.array([c.hight for c in crosssections], dtype=float)[crosssection],
+            'Wy': np.array([c.Wy for c in crosssections], dtype=float)[crosssection],
+            'area': np.array([c.area for c in crosssections], dtype=float)[crosssection],
+            'fmk': np.array([m.fmk for m in materials], dtype=float)[material],
+            'fvk': np.array([m.fvk for m in materials], dtype=float)[material],
+            'kcr': np.array(kcr, dtype=float)[material],
+            'materialtype': np.array([m.materialtype for m in materials], dtype=object)[material]
+        }
+
+        return data
+
+    def _design_arrays(self, data, mk_max, qk_max):
+        """
+        Design check (Eurocode.design_check) of the arrays of get_element_arrays.
+        """
+        return self.ec.design_check(mk_max, qk_max, data['Wy'], data['area'], data['fmk'], data['fvk'],
+            data['kcr'], data['materialtype'])
+
+    def solve_all_elements(self, load_id, lm1=False):
+        """
+        Solves all elements for one certain load case in one vectorized pass.
+
+        The results of every load case are kept. A following solve of the same
+        load case only recalculates the elements whose nodes were moved or whose
+        nodes, material or cross section were replaced or whose material or 
+        cross section values were changed since then. Changes of the load class
+        recalculate all elements.
+
+        Returns
+        -------
+        results : ndarray
+            Structured array with one row per element and the fields 
+            'id', 'moment', 'shear', 'nu_mk', 'nu_qk', 'nu_md', 'nu_qd', 'nu_vmk', 'nu_vmd'.
+            The von Mises utilisations 'nu_vmk', 'nu_vmd' are NaN for wood.
+        """
+        results, changed = self._solve_incremental(load_id, lm1)
+        return results.copy()
+
+    def _property_snapshot(self):
+        """
+        Design relevant values of the material and the cross section of every
+        element, so changes made directly to the attributes of a Material or 
+        Crosssection object are detected by the incremental solve.
+        """
+        store = self._element_store
+        types = {'wood': 0, 'steal': 1}
+
+        materials = np.array([(m.fmk, m.fvk, m.get_kcr() if m.materialtype == 'wood' else 0.0, types.get(m.materialtype, -1))
+            for m in store.materials], dtype=float).reshape(-1, 4)
+        crosssections = np.array([(c.hight, c.Wy, c.area) for c in store.crosssections], dtype=float).reshape(-1, 3)
+
+        return np.column_stack((materials[store.material[:store.size]], crosssections[store.crosssection[:store.size]]))
+
+    def _solve_incremental(self, load_id, lm1=False):
+        """
+        Solves the changed elements of a load case.
+
+        Returns
+        -------
+        results : ndarray
+            Cached result array of the load case (not to be modified).
+        changed : ndarray
+            Indices of the recalculated elements, None if the forces of 
+            all elements were stored on the elements.
+        """
+        store = self._element_store
+        n = store.size
+        load = self._loadclasses[load_id]
+        key = (load_id, lm1)
+        state = self._solve_state.get(key)
+
+        a = store.node_a[:n]
+        b = store.node_b[:n]
+        snapshot = np.column_stack((self._node_store.version[a], self._node_store.version[b], store.revision[:n],
+            self._property_snapshot()))
+
+        if state is None or state['load'] != (load.loadtype, load.loadclass):
+            index = None
+            results = np.empty(n, dtype=ELEMENT_RESULTS)
+        else:
+            results = state['results']
+            m = len(results)
+            dirty = np.ones(n, dtype=bool)
+            dirty[:m] = np.any(state['snapshot'] != snapshot[:m], axis=1)
+            index = np.flatnonzero(dirty)
+            if m < n:
+                results = np.concatenate((results, np.empty(n - m, dtype=results.dtype)))
+
+        if index is None or len(index):
+            data = self.get_element_arrays(index)
+            mk_max, qk_max = self._calc_forces_arrays(load, data['span'], load.loadclass, lm1)
+            nu = self._design_arrays(data, mk_max, qk_max)
+
+            rows = slice(None) if index is None else index
+            results['id'][rows] = data['id']
+            results['moment'][rows] = mk_max
+            results['shear'][rows] = qk_max
+            for name in nu:
+                results[name][rows] = nu[name]
+
+        self._solve_state[key] = {'load': (load.loadtype, load.loadclass), 'snapshot': snapshot, 'results': results}
+
+        if index is not None and self._forces_key == key:
+            self._store_forces(results['moment'][index], results['shear'][index], index, key)
+            return results, index
+
+        self._store_forces(results['moment'], results['shear'], key=key)
+        return results, None
+
+    def iter_solve(self, load_id, lm1=False, chunksize=65536):
+        """
+        Solves the elements for one certain load case in chunks of `chunksize`
+        elements. Nothing is stored on the elements or in the model, so the 
+        memory needed does not depend on the number of elements.
+
+        Returns
+        -------
+        results : generator
+            Structured arrays of at most `chunksize` element result records
+            with the fields of solve_all_elements.
+        """
+        load = self._loadclasses[load_id]
+        n = self._element_store.size
+
+        for start in range(0, n, chunksize):
+            data = self.get_element_arrays(slice(start, min(start + chunksize, n)))
+            mk_max, qk_max = self._calc_forces_arrays(load, data['span'], load.loadclass, lm1)
+            nu = self._design_arrays(data, mk_max, qk_max)
+
+            results = np.empty(len(data['id']), dtype=ELEMENT_RESULTS)
+            results['id'] = data['id']
+            results['moment'] = mk_max
+            results['shear'] = qk_max
+            for name in nu:
+                results[name] = nu[name]
+
+            yield results
+
+    def iter_design(self, load_id, lm1=False, design=True, chunksize=65536):
+        """
+        Generator of the utilisation of the elements for one certain load case.
+
+        Returns
+        -------
+        results : generator
+            Tuples (element_id, nu_m, nu_q) in the order of the model elements.
+        """
+        m, q = ('nu_md', 'nu_qd') if design else ('nu_mk', 'nu_qk')
+
+        for results in self.iter_solve(load_id, lm1, chunksize):
+            for record in zip(results['id'].tolist(), results[m].tolist(), results[q].tolist()):
+                yield record
+
+    def solve_loadclasses(self, load_ids=None, lm1=False, design=True):
+        """
+        Solves all elements for several load cases in one pass. The element 
+        geometry and material data is gathered only once for all load cases.
+
+        Parameters
+        ----------
+        load_ids : list
+            IDs of existing load classes. If None, all MLC classes of MLC_LOADCLASSES 
+            are evaluated (envelope of wheeled and tracked like calc_forces).
+
+        Returns
+        -------
+        utilisation : ndarray
+            Maximum utilisation (bending, shear and von Mises for steel) with the 
+            shape (number of load cases, number of elements).
+        """
+        data = self.get_element_arrays()
+
+        if load_ids is None:
+            loads = [Load(None, 'mlc_wheeled', MLC_LOADCLASSES)]
+        else:
+            loads = [self._loadclasses[id] for id in load_ids]
+
+        rows = []
+        for load in loads:
+            mk_max, qk_max = self._calc_forces_arrays(load, data['span'], load.loadclass, lm1)
+            rows.append(_admissible(self._design_arrays(data, mk_max, qk_max), design))
+
+        return np.vstack(rows).reshape(-1, len(data['id']))
+
+    def get_max_loadclass(self, lm1=False, design=True):
+        """
+        Maximum admissible MLC of every element and of the whole bridge. A load class 
+        is admissible if the element passes the design for it and all lower classes.
+
+        Returns
+        -------
+        max_loadclass : dict
+            Dictionary that stores element_id : maximum MLC (0 if no class is admissible)
+        bridge_loadclass : int
+            Maximum admissible MLC of the bridge.
+        """
+        utilisation = self.solve_loadclasses(lm1=lm1, design=design)
+        admissible = np.cumprod(utilisation <= 1.0, axis=0)
+        count = admissible.sum(axis=0)
+
+        loadclasses = np.concatenate(([0], MLC_LOADCLASSES))[count]
+        max_loadclass = dict(zip(self._elements.keys(), loadclasses.tolist()))
+        bridge_loadclass = int(loadclasses.min()) if len(loadclasses) else 0
+
+        return max_loadclass, bridge_loadclass
+
+    def explore_crosssections(self, element_id, load_id, hights, widths, grades=None, lm1=False, design=True):
+        """
+        Evaluates all combinations of cross section hights, widths and wood grades 
+        for the span of an element in one broadcasted pass and returns the 
+        Pareto set of the lightest sections with a utilisation <= 1.
+
+        Parameters
+        ----------
+        element_id : int or str
+            ID of the element that gives the span and the default material.
+        load_id : int or str
+            ID of the load class.
+        hights, widths : array_like
+            Candidate hights and widths [m].
+        grades : list
+            Grades of MATERIAL_GRADES ('c14' ... 'c50', 'gl24h' ... 'gl32h', 's235', 's355'). 
+            If None, the material of the element is used.
+
+        Returns
+        -------
+        sections : ndarray
+            Structured array with the fields 'hight', 'width', 'grade', 'weight' [kg/m] 
+            and 'utilisation', sorted by weight. Every section is lighter than 
+            the following ones and has a higher utilisation.
+        """
+        element = self._elements[element_id]
+        load = self._loadclasses[load_id]
+        span = element.get_actual_length()
+
+        if grades is None:
+            materials = [element.material]
+            grades = [element.material.id]
+        else:
+            materials = [material_from_grade(grade, grade) for grade in grades]
+
+        hight = np.asarray(hights, dtype=float)[:, np.newaxis, np.newaxis]
+        width = np.asarray(widths, dtype=float)[np.newaxis, :, np.newaxis]
+        properties = rectangle_properties(hight, width)
+
+        materialtype = np.array([m.materialtype for m in materials], dtype=object)
+        fvk = np.array([m.fvk for m in materials], dtype=float)
+        data = {
+            'hight': hight,
+            'Wy': properties['Wy'],
+            'area': properties['area'],
+            'fmk': np.array([m.fmk for m in materials], dtype=float),
+            'fvk': fvk,
+            'kcr': np.array([m.get_kcr() if m.materialtype == 'wood' else np.nan for m in materials], dtype=float),
+            'materialtype': materialtype
+        }
+
+        mk_max, qk_max = self._calc_forces_arrays(load, span, load.loadclass, lm1)
+        utilisation = _admissible(self._design_arrays(data, mk_max, qk_max), design)
+
+        density = np.array([m.density for m in materials], dtype=float)
+        weight = properties['area'] * density
+
+        shape = np.broadcast(hight, width, density).shape
+        utilisation = np.broadcast_to(utilisation, shape).ravel()
+        weight = np.broadcast_to(weight, shape).ravel()
+        i_hight, i_width, i_grade = np.unravel_index(np.arange(utilisation.size), shape)
+
+        # Pareto set: feasible sections sorted by weight, that are less utilised than all lighter ones
+        feasible = np.flatnonzero(utilisation <= 1.0)
+        feasible = feasible[np.lexsort((utilisation[feasible], weight[feasible]))]
+        running_min = np.minimum.accumulate(utilisation[feasible])
+        pareto = np.ones(len(feasible), dtype=bool)
+        pareto[1:] = utilisation[feasible][1:] < running_min[:-1]
+        pareto = feasible[pareto]
+
+        sections = np.empty(len(pareto), dtype=[
+            ('hight', float), ('width', float), ('grade', object), ('weight', float), ('utilisation', float)])
+        sections['hight'] = hight.ravel()[i_hight[pareto]]
+        sections['width'] = width.ravel()[i_width[pareto]]
+        sections['grade'] = np.array(grades, dtype=object)[i_grade[pareto]]
+        sections['weight'] = weight[pareto]
+        sections['utilisation'] = utilisation[pareto]
+
+        return sections
+
+    def optimize_sections(self, load_id, catalogue, lm1=False, design=True):
+        """
+        Finds the lightest section of a catalogue for every element that passes 
+        all checks of design_crosssection (including von Mises for steel).
+
+        The utilisations are linear in the element forces, so every section is 
+        described by its utilisation for a unit moment and a unit shear force.
+        The catalogue is sorted by weight once. The running minimum of these unit 
+        utilisations gives the lightest section that can carry the moment resp. 
+        the shear force of an element by bisection (lower bound). From there the 
+        following sections are checked in vectorized rounds over all unresolved 
+        elements, SEARCH_WINDOW sections per round.
+
+        Parameters
+        ----------
+        load_id : int or str
+            ID of the load class.
+        catalogue : list or ndarray
+            Available sections as (hight, width, grade) tuples or as structured 
+            array with the fields 'hight', 'width' and 'grade' (e.g. the result of 
+            explore_crosssections). Grades of MATERIAL_GRADES.
+
+        Returns
+        -------
+        sections : ndarray
+            Structured array with one row per element and the fields 'id', 'section' 
+            (index in the catalogue, -1 if no section passes), 'hight', 'width', 
+            'grade', 'weight' [kg/m] and 'utilisation'.
+        """
+        load = self._loadclasses[load_id]
+
+        if isinstance(catalogue, np.ndarray) and catalogue.dtype.names:
+            hight, width, grades = catalogue['hight'], catalogue['width'], catalogue['grade']
+        elif len(catalogue):
+            hight, width, grades = zip(*catalogue)
+        else:
+            raise RuntimeError('The catalogue does not contain any sections!')
+        hight = np.asarray(hight, dtype=float)
+        width = np.asarray(width, dtype=float)
+        grades = np.asarray(grades, dtype=object)
+
+        # === unit utilisations of the sections, sorted by weight
+        names = list(dict.fromkeys(grades.tolist()))
+        materials = [material_from_grade(grade, grade) for grade in names]
+        row = np.array([names.index(grade) for grade in grades.tolist()], dtype=np.int64)
+
+        properties = rectangle_properties(hight, width)
+        materialtype = np.array([m.materialtype for m in materials], dtype=object)[row]
+        fmk = np.array([m.fmk for m in materials], dtype=float)[row]
+        fvk = np.array([m.fvk for m in materials], dtype=float)[row]
+        kcr = np.array([m.get_kcr() if m.materialtype == 'wood' else np.nan for m in materials], dtype=float)[row]
+        density = np.array([m.density for m in materials], dtype=float)[row]
+
+        nu = self.ec.design_check(1.0, 1.0, properties['Wy'], properties['area'], fmk, fvk, kcr, materialtype)
+        unit_m, unit_q = (nu['nu_md'], nu['nu_qd']) if design else (nu['nu_mk'], nu['nu_qk'])
+        m, q, vm = ('nu_md', 'nu_qd', 'nu_vmd') if design else ('nu_mk', 'nu_qk', 'nu_vmk')
+        weight = properties['area'] * density
+
+        order = np.lexsort((np.maximum(unit_m, unit_q), weight))
+        unit_m, unit_q, weight = unit_m[order], unit_q[order], weight[order]
+        steel = (materialtype == 'steal')[order]
+        n_sections = len(order)
+
+        # === demand of the elements, elements with the same forces are solved once
+        data = self.get_element_arrays()
+        n = len(data['id'])
+        mk_max, qk_max = self._calc_forces_arrays(load, data['span'], load.loadclass, lm1)
+        forces = np.column_stack(np.broadcast_arrays(np.asarray(mk_max, dtype=float), np.asarray(qk_max, dtype=float)))
+        forces, inverse = np.unique(forces.reshape(-1, 2), axis=0, return_inverse=True)
+        mk_max, qk_max = forces[:, 0], forces[:, 1]
+
+        def utilisation(mk, qk, sections):
+            nu_m = mk * unit_m[sections]
+            nu_q = qk * unit_q[sections]
+            nu_vm = np.where(steel[sections], np.sqrt(nu_m**2 + nu_q**2), np.nan)
+            return _admissible({m: nu_m, q: nu_q, vm: nu_vm}, design)
+
+        # lower bound: first section whose running minimum of the unit utilisation carries the force
+        with np.errstate(divide='ignore'):
+            lower_m = np.searchsorted(-np.minimum.accumulate(unit_m), -1 / mk_max, side='left')
+            lower_q = np.searchsorted(-np.minimum.accumulate(unit_q), -1 / qk_max, side='left')
+        position = np.maximum(lower_m, lower_q)
+
+        # check windows of the following sections until the first one passes
+        window = np.arange(min(SEARCH_WINDOW, n_sections))
+        unresolved = np.flatnonzero(position < n_sections)
+        while len(unresolved):
+            candidates = position[unresolved, np.newaxis] + window
+            valid = candidates < n_sections
+            demands = unresolved[:, np.newaxis]
+            passed = valid & (utilisation(mk_max[demands], qk_max[demands], np.minimum(candidates, n_sections - 1)) <= 1.0)
+            first = np.argmax(passed, axis=1)
+            done = passed[np.arange(len(unresolved)), first]
+
+            position[unresolved] += np.where(done, first, len(window))
+            unresolved = unresolved[~done]
+            unresolved = unresolved[position[unresolved] < n_sections]
+
+        inverse = inverse.ravel()
+        position = position[inverse]
+
+        found = position < n_sections
+        best = np.where(found, position, 0)
+        sections = np.empty(n, dtype=[('id', object), ('section', np.int64), ('hight', float), ('width', float),
+            ('grade', object), ('weight', float), ('utilisation', float)])
+        sections['id'] = data['id']
+        sections['section'] = -1
+        sections['hight'] = np.nan
+        sections['width'] = np.nan
+        sections['grade'] = None
+        sections['weight'] = np.nan
+        sections['utilisation'] = np.nan
+
+        index = order[best[found]]
+        sections['section'][found] = index
+        sections['hight'][found] = hight[index]
+        sections['width'][found] = width[index]
+        sections['grade'][found] = grades[index]
+        sections['weight'][found] = weight[best[found]]
+        sections['utilisation'][found] = utilisation(mk_max[inverse[found]], qk_max[inverse[found]], best[found])
+
+        return sections
 
     # == Substructure
     def add_substructure(self, id):
@@ -436,6 +1157,7 @@ class Model(object):
                 raise RuntimeError('The model already contains an substructure with id {}'.format(i))
 
             self._substructures[i] = Substructure(i)
+            self._dirty_supports.add(i)
 
     def update_substructure(self, id, hight=None, structuretype=None, load=None, marerial_id=None): 
         """
@@ -452,6 +1174,7 @@ class Model(object):
                 self._substructures[id].load = load
             if marerial_id is not self.update_substructure.__defaults__[0]:
                 self._substructures[id].marerial_id = marerial_id
+            self._dirty_supports.add(id)
 
             
     def add_substructure_auto(self, id, structuretype, load, material_id): 
@@ -463,20 +1186,99 @@ class Model(object):
 
         self._substructures[id] = Substructure(
             id, structuretype, load, material_id)
+        self._dirty_supports.add(id)
         
-    def calc_supportforce_auto(self):
+    def get_support_incidence(self):
+        """
+        Sparse incidence matrix of the supports and the element ends in CSR form. 
+        The matrix is built once and cached until elements or substructures change.
+
+        The columns are the start forces q_a (at node_a) of all elements followed by
+        the end forces q_e (at node_b), so the support forces are the product of the 
+        matrix with the vector of the element end forces.
+
+        Returns
+        -------
+        supports : list
+            Node IDs of the substructures in the order of the matrix rows.
+        indptr, columns : ndarray
+            Row pointers and column indices of the nonzero entries (all 1).
         """
-        Calculates though all substructure elements.
+        store = self._element_store
+        n = store.size
+        key = (self._node_store.size, n, len(self._substructures))
+        cached = self._support_incidence
+
+        # moved nodes keep the incidence, replaced nodes of elements do not
+        if (cached is None or cached['key'] != key or not np.array_equal(cached['node_a'], store.node_a[:n])
+                or not np.array_equal(cached['node_b'], store.node_b[:n])):
+            supports = [id for id in self._substructures if id in self._nodes]
+            row = np.full(self._node_store.size, -1, dtype=np.int64)
+            row[[self._nodes[id]._index for id in supports]] = np.arange(len(supports))
+
+            ends = np.concatenate((row[store.node_a[:n]], row[store.node_b[:n]]))
+            columns = np.flatnonzero(ends >= 0)
+            columns = columns[np.argsort(ends[columns], kind='stable')]
+            indptr = np.searchsorted(ends[columns], np.arange(len(supports) + 1))
+
+            self._support_incidence = {
+                'key': key,
+                'supports': supports,
+                'rows': {id: i for i, id in enumerate(supports)},
+                'indptr': indptr,
+                'columns': columns,
+                'node_a': store.node_a[:n].copy(),
+                'node_b': store.node_b[:n].copy()
+            }
+
+        cached = self._support_incidence
+        return cached['supports'], cached['indptr'], cached['columns']
+
+    def calc_supportforce_auto(self, node_ids=None):
         """
-        supportforce = 0
+        Calculates the support forces of all substructure elements as product of 
+        the support incidence matrix with the end forces q_a and q_e of the elements.
+        If node IDs are passed in, only their substructures are updated, unless 
+        elements were connected to other nodes since the last call.
+        """
+        cached = self._support_incidence
+        supports, indptr, columns = self.get_support_incidence()
+        store = self._element_store
+        end_forces = np.concatenate((store.q_a[:store.size], store.q_e[:store.size]))
+
+        if node_ids is None or self._support_incidence is not cached:
+            rows = np.arange(len(supports))
+        else:
+            index = self._support_incidence['rows']
+            rows = np.array([index[id] for id in node_ids if id in index], dtype=np.int64)
+
+        # rows of the CSR matrix times the force vector, numpy only as scipy is optional
+        counts = indptr[rows + 1] - indptr[rows]
+        entries = np.repeat(indptr[rows] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        supportforce = np.bincount(np.repeat(np.arange(len(rows)), counts), weights=end_forces[columns[entries]], minlength=len(rows))
+
+        for i, value in zip(rows.tolist(), supportforce):
+            self._nodes[supports[i]].support_y = value
+
+        self._dirty_supports.difference_update(supports[i] for i in rows.tolist())
+
 
-        for id in self._substructures:
-            for i in self._nodes[id].elementlist:
-                supportforce = supportforce + self._elements[i].forces['q_a']
 
-            self._nodes[id].support_y = supportforce
-            supportforce = 0
+# == Profiling
 
+    def profile(self, stages=None, memory=False, cprofile=False):
+        """
+        Returns a Profiler that records the wall time, the number of calls and 
+        optionally the allocations of the solve stages while it is active.
+        Without an active profiler the model runs without instrumentation.
+
+        Example
+        -------
+        with model.profile(memory=True) as profiler:
+            model.solve(1)
+        print(profiler.report())
+        """
+        return Profiler(self, stages, memory, cprofile)
 
 
 # == Visualization
@@ -485,7 +1287,18 @@ class Model(object):
         """
         Visualize the system.
         """
+        # matplotlib is only imported when the model is plotted
+        from .graphic import Graphic
         Graphic(self)
 
+    def save_graphic(self, filename, **options):
+        """
+        Writes the system, the support forces and the moment diagram to a 
+        .png, .svg or .pdf file without opening a window.
+        The options are passed to the Renderer (figsize, dpi, moment_scale, points, labels).
+        """
+        from .visualization.renderer import render_model
+        render_model(self, filename, **options)
+
         
 
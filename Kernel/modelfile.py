@@ -0,0 +1,335 @@
+"""
+This modul contains the reader and writer of the model file formats.
+
+A model is stored either as text (.json / .toml) with one record per object
+or as binary NumPy archive (.npz) with one array per attribute. Both forms
+contain nodes, materials, cross sections, elements, load classes,
+substructures and optionally the results of the last solve.
+
+Author: Lukas Rauch
+"""
+
+import json
+import numpy as np
+from .model import Model
+from .node import Node
+from .element import Element
+from .material import Material
+from .crosssection import Crosssection
+from .load import Load
+from .substructure import Substructure
+
+# table name : attributes of the records
+FIELDS = {
+    'nodes': ['id', 'x', 'y'],
+    'materials': ['id', 'materialtype', 'density', 'youngs_modulus', 'fmk', 'fvk', 'ft0k', 'ft90k', 'fc0k', 'fc90k', 'woodentype'],
+    'crosssections': ['id', 'hight', 'width'],
+    'elements': ['id', 'node_a', 'node_b', 'crosssection', 'material'],
+    'loadclasses': ['id', 'loadtype', 'loadclass'],
+    'substructures': ['id', 'structuretype', 'load', 'material_id', 'hight', 'crosssection_id']
+}
+
+# default values of optional attributes
+DEFAULTS = {
+    'materialtype': 'wood', 'density': 0, 'youngs_modulus': 0, 'fmk': 0, 'fvk': 0,
+    'ft0k': 0, 'ft90k': 0, 'fc0k': 0, 'fc90k': 0, 'woodentype': 'vh',
+    'structuretype': None, 'load': None, 'material_id': None, 'hight': None, 'crosssection_id': None
+}
+
+
+def _plain(value):
+    """
+    Converts numpy scalars to plain python values.
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+# === model <-> tables
+
+def model_to_tables(model, results=False):
+    """
+    Returns the model as dictionary of columns: table name : {attribute : list}.
+    """
+    tables = {
+        'nodes': {
+            'id': [node.id for node in model._nodes.values()],
+            'x': [node.x for node in model._nodes.values()],
+            'y': [node.y for node in model._nodes.values()]
+        },
+        'materials': {key: [getattr(material, key) for material in model._materials.values()]
+            for key in FIELDS['materials']},
+        'crosssections': {key: [getattr(crosssection, key) for crosssection in model._crosssections.values()]
+            for key in FIELDS['crosssections']},
+        'elements': {
+            'id': [element.id for element in model._elements.values()],
+            'node_a': [element.node_a.id for element in model._elements.values()],
+            'node_b': [element.node_b.id for element in model._elements.values()],
+            'crosssection': [element.crosssection.id for element in model._elements.values()],
+            'material': [element.material.id for element in model._elements.values()]
+        },
+        'loadclasses': {key: [getattr(load, key) for load in model._loadclasses.values()]
+            for key in FIELDS['loadclasses']},
+        'substructures': {
+            'id': [substructure.id for substructure in model._substructures.values()],
+            'structuretype': [substructure.structuretype for substructure in model._substructures.values()],
+            'load': [substructure.load for substructure in model._substructures.values()],
+            'material_id': [substructure.marerial_id for substructure in model._substructures.values()],
+            'hight': [substructure.hight for substructure in model._substructures.values()],
+            'crosssection_id': [substructure.crosssection_id for substructure in model._substructures.values()]
+        }
+    }
+
+    if results:
+        tables['element_results'] = {
+            'id': tables['elements']['id'],
+            'moment': [element.forces['moment'] for element in model._elements.values()],
+            'q_a': [element.forces['q_a'] for element in model._elements.values()],
+            'q_e': [element.forces['q_e'] for element in model._elements.values()]
+        }
+        tables['node_results'] = {
+            'id': tables['nodes']['id'],
+            'support_y': [node.support_y for node in model._nodes.values()]
+        }
+
+    return tables
+
+
+def validate_tables(tables):
+    """
+    Checks the tables of a model in one pass: unique IDs in every table
+    and existing nodes, materials and cross sections of all elements.
+    Raises a RuntimeError for invalid tables.
+    """
+    for name in FIELDS:
+        ids = tables[name]['id']
+        if len(set(ids)) != len(ids):
+            raise RuntimeError('The {} of the model file contain duplicate ids!' .format(name))
+
+    elements = tables['elements']
+    for key, table in (('node_a', 'nodes'), ('node_b', 'nodes'),
+            ('crosssection', 'crosssections'), ('material', 'materials')):
+        missing = set(elements[key]).difference(tables[table]['id'])
+        if missing:
+            raise RuntimeError('The model file does not contain {} with id: {}' .format(table, sorted(missing, key=str)))
+
+
+def model_from_tables(name, tables, validate=True):
+    """
+    Builds a model from a dictionary of columns without the per call checks
+    of the add_* functions. The tables are validated in one pass instead.
+    """
+    if validate:
+        validate_tables(tables)
+
+    model = Model(name)
+
+    nodes = tables['nodes']
+    for id, x, y in zip(nodes['id'], nodes['x'], nodes['y']):
+        model._nodes[id] = Node(id, x, y, store=model._node_store)
+
+    # optional columns missing in older files get their default values
+    materials = tables['materials']
+    for values in zip(*[materials[key] if key in materials else [DEFAULTS[key]] * len(materials['id'])
+            for key in FIELDS['materials']]):
+        model._materials[values[0]] = Material(*values)
+
+    crosssections = tables['crosssections']
+    for id, hight, width in zip(crosssections['id'], crosssections['hight'], crosssections['width']):
+        model._crosssections[id] = Crosssection(id, hight, width)
+
+    elements = tables['elements']
+    for id, node_a, node_b, crosssection, material in zip(*[elements[key] for key in FIELDS['elements']]):
+        model._elements[id] = Element(id, model._nodes[node_a], model._nodes[node_b],
+            model._materials[material], model._crosssections[crosssection], store=model._element_store)
+        model._nodes[node_a].update_element_list(element_id=id)
+        model._nodes[node_b].update_element_list(element_id=id)
+
+    loadclasses = tables['loadclasses']
+    for id, loadtype, loadclass in zip(loadclasses['id'], loadclasses['loadtype'], loadclasses['loadclass']):
+        model._loadclasses[id] = Load(id, loadtype, loadclass)
+
+    substructures = tables['substructures']
+    for id, structuretype, load, material_id, hight, crosssection_id in zip(
+            *[substructures[key] for key in FIELDS['substructures']]):
+        substructure = Substructure(id, structuretype, load, material_id)
+        substructure.hight = hight
+        substructure.crosssection_id = crosssection_id
+        model._substructures[id] = substructure
+
+    if 'element_results' in tables:
+        results = tables['element_results']
+        for id, moment, q_a, q_e in zip(results['id'], results['moment'], results['q_a'], results['q_e']):
+            model._elements[id].forces.update({'moment': moment, 'q_a': q_a, 'q_e': q_e})
+
+    if 'node_results' in tables:
+        results = tables['node_results']
+        for id, support_y in zip(results['id'], results['support_y']):
+            model._nodes[id].support_y = support_y
+
+    return model
+
+
+# === text form
+
+def model_to_dict(model, results=False):
+    """
+    Returns the model as dictionary with one list of records per table.
+    Attributes that are None are omitted.
+    """
+    tables = model_to_tables(model, results)
+
+    data = {'name': model.name}
+    for name, columns in tables.items():
+        keys = list(columns.keys())
+        data[name] = [{key: _plain(value) for key, value in zip(keys, row) if value is not None}
+            for row in zip(*[columns[key] for key in keys])]
+
+    return data
+
+
+def model_from_dict(data, validate=True):
+    """
+    Builds a model from a dictionary of model_to_dict.
+    """
+    tables = {}
+    for name, keys in FIELDS.items():
+        records = data.get(name, [])
+        tables[name] = {key: [record[key] if key not in DEFAULTS else record.get(key, DEFAULTS[key])
+            for record in records] for key in keys}
+
+    if 'element_results' in data:
+        tables['element_results'] = {key: [record[key] for record in data['element_results']]
+            for key in ['id', 'moment', 'q_a', 'q_e']}
+    if 'node_results' in data:
+        tables['node_results'] = {key: [record.get(key) for record in data['node_results']]
+            for key in ['id', 'support_y']}
+
+    return model_from_tables(data.get('name', 'model'), tables, validate)
+
+
+# === binary form
+
+# numeric columns of the binary form, stored as one 2D array per table
+ARRAYS = {
+    'nodes': ['x', 'y'],
+    'materials': ['density', 'youngs_modulus', 'fmk', 'fvk', 'ft0k', 'ft90k', 'fc0k', 'fc90k'],
+    'crosssections': ['hight', 'width'],
+    'elements': ['node_a', 'node_b', 'crosssection', 'material'],
+    'element_results': ['moment', 'q_a', 'q_e'],
+    'node_results': ['support_y']
+}
+
+# tables referenced by the element index columns
+REFERENCES = {'node_a': 'nodes', 'node_b': 'nodes', 'crosssection': 'crosssections', 'material': 'materials'}
+
+
+def write_npz(model, filename, results=False):
+    """
+    Writes the model as binary NumPy archive. The numeric columns of a table 
+    are stored as one 2D array, the references of the elements as index arrays
+    into the node, material and cross section tables. IDs and text columns 
+    are stored in a single json header.
+    """
+    tables = model_to_tables(model, results)
+    index = {table: {id: i for i, id in enumerate(tables[table]['id'])} for table in set(REFERENCES.values())}
+
+    header = {'name': model.name, 'columns': {}}
+    arrays = {}
+
+    for name, columns in tables.items():
+        numeric = ARRAYS.get(name, [])
+        if name == 'elements':
+            arrays[name] = np.array([[index[REFERENCES[key]][id] for id in columns[key]]
+                for key in numeric], dtype=np.int64).T.reshape(-1, len(numeric))
+        elif numeric:
+            arrays[name] = np.array([[np.nan if v is None else v for v in row]
+                for row in zip(*[columns[key] for key in numeric])], dtype=float).reshape(-1, len(numeric))
+
+        header['columns'][name] = {key: [_plain(value) for value in values]
+            for key, values in columns.items() if key not in numeric}
+
+    arrays['header'] = np.array(json.dumps(header))
+
+    with open(filename, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def read_npz(filename, validate=True):
+    """
+    Reads a model of a binary NumPy archive. No python code is executed
+    (the archive is loaded without pickle).
+    """
+    with np.load(filename, allow_pickle=False) as archive:
+        header = json.loads(str(archive['header']))
+        arrays = {name: archive[name] for name in archive.files if name != 'header'}
+
+    tables = header['columns']
+    for name, array in arrays.items():
+        for key, column in zip(ARRAYS[name], array.T):
+            tables[name][key] = column.tolist()
+
+    elements = tables['elements']
+    for key, table in REFERENCES.items():
+        ids = tables[table]['id']
+        elements[key] = [ids[i] for i in elements[key]]
+
+    if 'node_results' in tables:
+        tables['node_results']['support_y'] = [None if np.isnan(v) else v for v in tables['node_results']['support_y']]
+
+    return model_from_tables(header['name'], tables, validate)
+
+
+# === files
+
+def write_model(model, filename, results=False):
+    """
+    Writes the model to a .json, .toml or .npz file depending on the file extension.
+    """
+    if filename.endswith('.npz'):
+        write_npz(model, filename, results)
+
+    elif filename.endswith('.json'):
+        with open(filename, 'w') as f:
+            json.dump(model_to_dict(model, results), f, indent=1)
+
+    elif filename.endswith('.toml'):
+        try:
+            import tomli_w as toml_writer
+        except ImportError:
+            try:
+                import toml as toml_writer
+            except ImportError:
+                raise RuntimeError('Writing .toml files requires the package "tomli_w" or "toml"!')
+        with open(filename, 'w') as f:
+            f.write(toml_writer.dumps(model_to_dict(model, results)))
+
+    else:
+        raise RuntimeError('The file format of {} is not supported!' .format(filename))
+
+
+def read_model(filename, validate=True):
+    """
+    Reads a model of a .json, .toml or .npz file depending on the file extension.
+    """
+    if filename.endswith('.npz'):
+        return read_npz(filename, validate)
+
+    elif filename.endswith('.json'):
+        with open(filename) as f:
+            return model_from_dict(json.load(f), validate)
+
+    elif filename.endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise RuntimeError('Reading .toml files requires python 3.11 or the package "tomli"!')
+        with open(filename, 'rb') as f:
+            return model_from_dict(tomllib.load(f), validate)
+
+    else:
+        raise RuntimeError('The file format of {} is not supported!' .format(filename))
@@ -1,10 +1,76 @@
 """
-This modul only contains the Node class.
+This modul contains the Node class and the columnar NodeStore.
 
 Author: Lukas Rauch
 """
 import numpy as np
 
+class NodeStore(object):
+    """
+    Columnar storage of the node coordinates of a model. The nodes
+    are lightweight views on one row of the store.
+
+    Attributes
+    ---------
+    size : int
+        Number of stored nodes.
+    id : ndarray
+        Node IDs.
+    x, y : ndarray
+        Actual coordinates. Only the first `size` entries are valid.
+    reference_x, reference_y : ndarray
+        Reference coordinates.
+    version : ndarray
+        Number of moves of every node, used to invalidate cached element geometry.
+    revision : int
+        Total number of node moves in the store.
+    """
+
+    COLUMNS = {'id': object, 'x': float, 'y': float, 'reference_x': float, 'reference_y': float, 'version': np.int64}
+
+    def __init__(self, capacity=16):
+        """
+        Create an empty node store.
+        """
+        self.size = 0
+        self.revision = 0
+        for key, dtype in self.COLUMNS.items():
+            setattr(self, key, np.zeros(capacity, dtype=dtype))
+
+    def append(self, id, x, y):
+        """
+        Adds the coordinates of a new node and returns its row index.
+        """
+        if self.size == len(self.x):
+            self._grow()
+
+        index = self.size
+        self.id[index] = id
+        self.x[index] = x
+        self.y[index] = y
+        self.reference_x[index] = x
+        self.reference_y[index] = y
+        self.size += 1
+        return index
+
+    def move(self, index):
+        """
+        Marks the node of a row as moved.
+        """
+        self.version[index] += 1
+        self.revision += 1
+
+    def _grow(self):
+        """
+        Doubles the capacity of all columns.
+        """
+        capacity = max(2 * len(self.x), 1)
+        for key, dtype in self.COLUMNS.items():
+            column = np.zeros(capacity, dtype=dtype)
+            column[:self.size] = getattr(self, key)[:self.size]
+            setattr(self, key, column)
+
+
 class Node(object):
     """
     Two dimensional Node providing Dofs and unique position in 2D space
@@ -29,18 +95,56 @@ class Node(object):
         Displacement in y direction
     """
 
-    def __init__(self, id, x, y):
+    __slots__ = ('id', 'elementlist', 'support_y', '_store', '_index')
+
+    def __init__(self, id, x, y, store=None):
         """
-        Create a nwe node.
+        Create a nwe node. The coordinates are kept in the passed in NodeStore
+        (a private store is created for a node without model).
         """
+        if store is None:
+            store = NodeStore(capacity=1)
+
         self.id = id
-        self.x = x
-        self.y = y
-        self.reference_x = x
-        self.reference_y = y
+        self._store = store
+        self._index = store.append(id, x, y)
         self.elementlist = []
         self.support_y = None
 
+    @property
+    def x(self):
+        return self._store.x[self._index]
+
+    @x.setter
+    def x(self, value):
+        self._store.x[self._index] = value
+        self._store.move(self._index)
+
+    @property
+    def y(self):
+        return self._store.y[self._index]
+
+    @y.setter
+    def y(self, value):
+        self._store.y[self._index] = value
+        self._store.move(self._index)
+
+    @property
+    def reference_x(self):
+        return self._store.reference_x[self._index]
+
+    @reference_x.setter
+    def reference_x(self, value):
+        self._store.reference_x[self._index] = value
+
+    @property
+    def reference_y(self):
+        return self._store.reference_y[self._index]
+
+    @reference_y.setter
+    def reference_y(self, value):
+        self._store.reference_y[self._index] = value
+
     def get_actual_location(self):
         """
         Location of the node in the actual configuration.
@@ -61,7 +165,3 @@ class Node(object):
         """
         self.elementlist.append(element_id)
         pass
-
-
-    
-
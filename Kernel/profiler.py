@@ -0,0 +1,235 @@
+"""
+This modul only contains the Profiler class
+
+Author: Lukas Rauch
+"""
+
+import cProfile
+import json
+import time
+import tracemalloc
+from functools import wraps
+
+# functions of the solve pipeline that are timed by default. Dotted names are
+# functions of the model attributes, e.g. the element store.
+STAGES = [
+    'calc_forces', 'calc_forces_all', '_calc_forces_arrays', '_calc_forces_tables',
+    'design_crosssection', '_design_arrays', 'solve_element', 'solve', 'solve_all_elements',
+    '_solve_incremental', 'get_element_arrays', 'calc_supportforce_auto', 'get_support_incidence',
+    '_element_store.update_geometry'
+]
+
+
+class Profiler(object):
+    """
+    Opt-in instrumentation of the solve pipeline of a model.
+
+    While the profiler is active, the stage functions of the model are replaced
+    by timed wrappers on the model instance. On stop the wrappers are removed,
+    so a model without an active profiler runs without any overhead.
+
+        with model.profile(memory=True) as profiler:
+            model.solve(1)
+        profiler.write_json('profile.json')
+
+    Attributes
+    ---------
+    stages : list
+        Names of the timed functions.
+    memory : bool
+        Trace the allocations of every stage with tracemalloc.
+    stats : dict
+        stage : {'calls', 'total', 'self', 'allocated', 'peak'}. Times in [s],
+        memory in [bytes]. 'total' includes the nested stages, 'self' does not.
+    stacks : dict
+        Self time of every stack of nested stages, 'solve;_solve_incremental' : time.
+    """
+
+    def __init__(self, model, stages=None, memory=False, cprofile=False):
+        """
+        Create a new profiler of a model.
+        """
+        self.model = model
+        self.stages = list(STAGES if stages is None else stages)
+        self.memory = memory
+        self.stats = dict()
+        self.stacks = dict()
+        self.wall = 0.0
+
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._stack = []
+        self._patched = []
+        self._tracing = False
+        self._memory_offset = 0
+        self._start = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        """
+        Replaces the stage functions by timed wrappers.
+        """
+        if self._patched:
+            raise RuntimeError('The profiler is already active!')
+
+        for stage in self.stages:
+            owner = self.model
+            *path, name = stage.split('.')
+            for attribute in path:
+                owner = getattr(owner, attribute)
+            if not callable(getattr(owner, name, None)):
+                raise RuntimeError('The model has no function {}!' .format(stage))
+
+            setattr(owner, name, self._wrap(stage, getattr(owner, name)))
+            self._patched.append((owner, name))
+            self.stats.setdefault(stage, {'calls': 0, 'total': 0.0, 'self': 0.0, 'allocated': 0, 'peak': 0})
+
+        self._memory_offset = 0
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        self._start = time.perf_counter()
+
+    def stop(self):
+        """
+        Removes the wrappers and restores the original functions.
+        """
+        if not self._patched:
+            return
+
+        self.wall += time.perf_counter() - self._start
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+        for owner, name in self._patched:
+            delattr(owner, name)
+        self._patched = []
+
+    def _traced_memory(self):
+        """
+        Current and peak traced memory [bytes], the peak since the last reset.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        return current + self._memory_offset, peak + self._memory_offset
+
+    def _reset_peak(self):
+        """
+        Resets the peak of the traced memory. tracemalloc.reset_peak requires
+        Python 3.9. On older versions the tracing is restarted and the memory
+        traced so far is kept as offset; memory allocated before the restart
+        and released after it is then not subtracted.
+        """
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        else:
+            self._memory_offset += tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            tracemalloc.start()
+
+    def _wrap(self, stage, function):
+        """
+        Returns the timed wrapper of a stage function.
+        """
+        stack = self._stack
+        memory = self.memory
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            # frame: [stage, start time, time of nested stages, memory at start, peak memory]
+            frame = [stage, 0.0, 0.0, 0, 0]
+            if memory:
+                current, peak = self._traced_memory()
+                if stack:
+                    stack[-1][4] = max(stack[-1][4], peak)
+                self._reset_peak()
+                frame[3] = frame[4] = current
+
+            stack.append(frame)
+            frame[1] = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - frame[1]
+                key = ';'.join(f[0] for f in stack)
+                stack.pop()
+
+                stats = self.stats[stage]
+                stats['calls'] += 1
+                stats['total'] += elapsed
+                stats['self'] += elapsed - frame[2]
+                self.stacks[key] = self.stacks.get(key, 0.0) + elapsed - frame[2]
+                if stack:
+                    stack[-1][2] += elapsed
+
+                if memory:
+                    current, peak = self._traced_memory()
+                    peak = max(frame[4], peak)
+                    stats['allocated'] += current - frame[3]
+                    stats['peak'] = max(stats['peak'], peak - frame[3])
+                    if stack:
+                        stack[-1][4] = max(stack[-1][4], peak)
+                    self._reset_peak()
+
+        return wrapper
+
+    def to_dict(self):
+        """
+        Returns the recorded data as dictionary.
+        """
+        return {
+            'model': self.model.name,
+            'wall': self.wall,
+            'memory': self.memory,
+            'stages': {stage: dict(stats) for stage, stats in self.stats.items() if stats['calls']},
+            'stacks': dict(self.stacks)
+        }
+
+    def write_json(self, filename):
+        """
+        Writes the recorded data as JSON file.
+        """
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    def write_collapsed(self, filename):
+        """
+        Writes the self times of the stage stacks in the collapsed stack format
+        ('solve;_solve_incremental 1234' in [us]) of flamegraph.pl and speedscope.
+        """
+        with open(filename, 'w') as f:
+            for key, value in sorted(self.stacks.items()):
+                f.write('{} {}\n' .format(key, int(round(value * 1e6))))
+
+    def write_pstats(self, filename):
+        """
+        Writes the cProfile statistics of the profiled block (requires cprofile=True).
+        The file can be read by pstats, snakeviz or flameprof.
+        """
+        if self._cprofile is None:
+            raise RuntimeError('The profiler was created without cprofile=True!')
+        self._cprofile.dump_stats(filename)
+
+    def report(self):
+        """
+        Returns the stage statistics as text table, sorted by the total time.
+        """
+        lines = ['{:<40} {:>8} {:>12} {:>12} {:>12} {:>12}' .format(
+            'stage', 'calls', 'total [s]', 'self [s]', 'alloc [MB]', 'peak [MB]')]
+
+        for stage, stats in sorted(self.stats.items(), key=lambda item: -item[1]['total']):
+            if stats['calls']:
+                lines.append('{:<40} {:>8} {:>12.6f} {:>12.6f} {:>12.3f} {:>12.3f}' .format(
+                    stage, stats['calls'], stats['total'], stats['self'], stats['allocated'] / 1e6, stats['peak'] / 1e6))
+        lines.append('wall time [s]: {:.6f}' .format(self.wall))
+
+        return '\n'.join(lines)
@@ -0,0 +1,207 @@
+"""
+This modul contains the MonteCarlo class for the reliability analysis of
+the elements of a model.
+
+The strengths, the cross section dimensions and the vehicle weight are
+sampled from distributions and the bending and shear limit states of all
+elements are evaluated in blocks of samples. Every block has its own seed
+spawned from one SeedSequence, so the results only depend on the seed and
+the block size and not on the number of worker processes.
+
+Author: Lukas Rauch
+"""
+
+import os
+import numpy as np
+
+# coefficients of variation of the strengths by material type
+COV_STRENGTH = {'wood': 0.25, 'steal': 0.07}
+
+# fractile of the characteristic strengths
+FRACTILE = 0.05
+
+
+def _inv_cdf(p):
+    """
+    Inverse of the standard normal distribution function.
+    """
+    try:
+        from statistics import NormalDist
+    except ImportError:
+        raise RuntimeError('The reliability analysis requires at least Python 3.8!')
+
+    return NormalDist().inv_cdf(p)
+
+
+def lognormal_parameters(characteristic, cov, fractile=FRACTILE):
+    """
+    Parameters of a lognormal distribution with the characteristic value
+    as `fractile` and the coefficient of variation `cov`.
+
+    Returns
+    -------
+    mu, sigma : ndarray
+        Mean and standard deviation of the logarithm.
+    """
+    sigma = np.sqrt(np.log(1 + np.asarray(cov, dtype=float)**2))
+    mu = np.log(characteristic) - _inv_cdf(fractile) * sigma
+
+    return mu, sigma
+
+
+def _simulate_block(job):
+    """
+    Number of failures of every element in one block of samples. Runs in the
+    worker processes.
+    """
+    arrays, options, seed, samples = job
+    rng = np.random.default_rng(seed)
+    shape = (samples, len(arrays['mk']))
+
+    # vehicle weight: one factor per sample for all elements
+    weight = options['weight_mean'] * (1 + options['cov_weight'] * rng.standard_normal((samples, 1)))
+    np.maximum(weight, 0, out=weight)
+
+    hight = arrays['hight'] * (1 + options['cov_dimension'] * rng.standard_normal(shape))
+    width = arrays['width'] * (1 + options['cov_dimension'] * rng.standard_normal(shape))
+
+    # bending limit state, steel: yield strength
+    fm = np.exp(arrays['mu_m'] + arrays['sigma_m'] * rng.standard_normal(shape))
+    failed = 1000 * fm * width * hight**2 / 6 < weight * arrays['mk']
+
+    # shear limit state, steel: the same yield strength
+    fv = np.exp(arrays['mu_v'] + arrays['sigma_v'] * rng.standard_normal(shape))
+    fv = np.where(arrays['steel'], fm, fv)
+    failed |= 1000 * fv * arrays['av'] * width * hight / arrays['qf'] < weight * arrays['qk']
+
+    return failed.sum(axis=0)
+
+
+class MonteCarlo(object):
+    """
+    Monte Carlo simulation of the failure probability of the elements of
+    a model for one load class.
+
+    The strengths are lognormal with the characteristic values of the materials
+    as 5% fractile, the hight and width of the cross sections are normal around
+    the nominal values. The vehicle weight is normal around the load class
+    weight and the same for all elements of one sample. An element fails if
+    the moment or the shear force exceeds its resistance.
+
+    Attributes
+    ---------
+    samples : int
+        Number of samples.
+    seed : int
+        Seed of the SeedSequence, None for a random seed.
+    block_values : int
+        Maximum number of values (samples x elements) of a block, bounds the memory.
+    max_workers : int
+        Number of worker processes, with 1 the blocks are evaluated in the calling process.
+    cov_strength : dict
+        Coefficients of variation of the strengths by material type.
+    cov_dimension : float
+        Coefficient of variation of the cross section hight and width.
+    cov_weight : float
+        Coefficient of variation of the vehicle weight.
+    weight_mean : float
+        Mean vehicle weight relative to the load class.
+    """
+
+    def __init__(self, samples=1000000, seed=None, block_values=2**21, max_workers=1,
+                 cov_strength=None, cov_dimension=0.02, cov_weight=0.1, weight_mean=1.0):
+        """
+        Create a new Monte Carlo simulation.
+        """
+        self.samples = int(samples)
+        self.seed = seed
+        self.block_values = block_values
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cov_strength = dict(COV_STRENGTH if cov_strength is None else cov_strength)
+        self.cov_dimension = cov_dimension
+        self.cov_weight = cov_weight
+        self.weight_mean = weight_mean
+
+    def _arrays(self, model, load_id, lm1=False):
+        """
+        Element arrays of the simulation: characteristic forces, nominal dimensions
+        and the parameters of the strength distributions.
+        """
+        load = model._loadclasses[load_id]
+        data = model.get_element_arrays()
+        mk_max, qk_max = model._calc_forces_arrays(load, data['span'], load.loadclass, lm1)
+
+        materialtype = data['materialtype']
+        wood = materialtype == 'wood'
+        steel = materialtype == 'steal'
+        unknown = ~(wood | steel)
+        if np.any(unknown):
+            raise RuntimeError('Material with type "{}" is not part of the library. Solving the system is not possible!' .format(materialtype[unknown][0]))
+
+        cov = np.array([self.cov_strength[type] for type in materialtype.tolist()], dtype=float)
+        mu_m, sigma_m = lognormal_parameters(data['fmk'], cov)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mu_v, sigma_v = lognormal_parameters(np.where(wood, data['fvk'], data['fmk']), cov)
+
+        # shear area factor and shear stress factor like Eurocode.design_check
+        av = np.where(wood, data['kcr'], 0.4)
+        qf = np.where(wood, 1.5, np.sqrt(3))
+
+        arrays = {
+            'mk': np.broadcast_to(mk_max, data['span'].shape).astype(float),
+            'qk': np.broadcast_to(qk_max, data['span'].shape).astype(float),
+            'hight': data['hight'],
+            'width': data['area'] / data['hight'],
+            'mu_m': mu_m, 'sigma_m': sigma_m,
+            'mu_v': mu_v, 'sigma_v': sigma_v,
+            'av': av, 'qf': qf,
+            'steel': steel
+        }
+
+        return data['id'], arrays
+
+    def run(self, model, load_id, lm1=False):
+        """
+        Simulates the failures of all elements of a model for one load class.
+
+        Returns
+        -------
+        results : ndarray
+            Structured array with one row per element and the fields 'id',
+            'failures', 'pf' (failure probability), 'beta' (reliability index)
+            and 'cov_pf' (coefficient of variation of the estimated pf).
+            Without failures beta is inf.
+        """
+        ids, arrays = self._arrays(model, load_id, lm1)
+        n = len(ids)
+
+        options = {'cov_dimension': self.cov_dimension, 'cov_weight': self.cov_weight, 'weight_mean': self.weight_mean}
+        block = max(1, self.block_values // max(n, 1))
+        sizes = [min(block, self.samples - start) for start in range(0, self.samples, block)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        jobs = [(arrays, options, seed, size) for seed, size in zip(seeds, sizes)]
+
+        failures = np.zeros(n, dtype=np.int64)
+        if self.max_workers == 1 or len(jobs) == 1:
+            for job in jobs:
+                failures += _simulate_block(job)
+        else:
+            # the batch module imports the model, which imports this module
+            from .batch import quiet_process_pool
+            with quiet_process_pool(self.max_workers) as executor:
+                for count in executor.map(_simulate_block, jobs, chunksize=max(1, len(jobs) // (4 * self.max_workers))):
+                    failures += count
+
+        pf = failures / self.samples
+        with np.errstate(divide='ignore'):
+            cov_pf = np.sqrt((1 - pf) / (self.samples * pf))
+        beta = [np.inf if p == 0 else -np.inf if p == 1 else -_inv_cdf(p) for p in pf.tolist()]
+
+        results = np.empty(n, dtype=[('id', object), ('failures', np.int64), ('pf', float), ('beta', float), ('cov_pf', float)])
+        results['id'] = ids
+        results['failures'] = failures
+        results['pf'] = pf
+        results['beta'] = beta
+        results['cov_pf'] = cov_pf
+
+        return results
@@ -0,0 +1,238 @@
+"""
+This modul contains the streaming evaluation of model catalogues and the
+sinks that write element result records to CSV, NPY or Parquet files.
+
+The models are built, solved in chunks and released one after another, so
+the memory needed is bounded by the largest model and the chunk size.
+
+Author: Lukas Rauch
+"""
+
+import csv
+import struct
+import numpy as np
+from .batch import build_model
+
+
+def iter_catalogue(definitions, load_ids=None, lm1=False, chunksize=65536):
+    """
+    Solves the models of a catalogue one after another.
+
+    Parameters
+    ----------
+    definitions : iterable
+        Model objects, model files (.json, .toml, .npz) or functions without
+        arguments that build a model. Generators are consumed lazily.
+    load_ids : list
+        IDs of the load classes to solve. If None, all load classes of each model are solved.
+    lm1 : bool
+        Consider LM1 in the forces.
+    chunksize : int
+        Maximum number of element records per chunk.
+
+    Returns
+    -------
+    results : generator
+        Tuples (model name, load_id, records) with the record chunks of Model.iter_solve.
+    """
+    for definition in definitions:
+        model = build_model(definition)
+        ids = list(model._loadclasses.keys()) if load_ids is None else load_ids
+
+        for load_id in ids:
+            for records in model.iter_solve(load_id, lm1, chunksize):
+                yield model.name, load_id, records
+
+
+def write_catalogue(definitions, sink, load_ids=None, lm1=False, chunksize=65536):
+    """
+    Solves the models of a catalogue and writes all element records to a sink
+    with the additional columns 'model' and 'load_id'.
+
+    Returns
+    -------
+    rows : int
+        Number of written records.
+    """
+    rows = 0
+    for name, load_id, records in iter_catalogue(definitions, load_ids, lm1, chunksize):
+        rows += sink.write(records, model=name, load_id=load_id)
+
+    return rows
+
+
+class Sink(object):
+    """
+    Base class of the record sinks. A sink is opened on creation and
+    closed by close() or at the end of a with statement.
+
+    The sink selects the columns of every chunk and counts the records, the
+    subclasses write the columns in _write(columns, size) and keep the opened 
+    output file in _file, which is closed by close().
+
+    Attributes
+    ---------
+    filename : str
+        Output file.
+    fields : list
+        Record fields to write. If None, all fields are written.
+    rows : int
+        Number of written records.
+    """
+
+    def __init__(self, filename, fields=None):
+        """
+        Create a new sink.
+        """
+        self.filename = filename
+        self.fields = fields
+        self.rows = 0
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _columns(self, records, constants):
+        """
+        List of (name, array) of the constant columns and the selected record fields.
+        """
+        fields = records.dtype.names if self.fields is None else self.fields
+        columns = [(key, np.full(len(records), value)) for key, value in constants.items()]
+        columns += [(key, records[key]) for key in fields]
+
+        return columns
+
+    def write(self, records, **constants):
+        """
+        Writes a structured array of records. Keyword arguments are written
+        as additional constant columns in front of the record fields.
+        Returns the number of written records.
+        """
+        self._write(self._columns(records, constants), len(records))
+        self.rows += len(records)
+        return len(records)
+
+    def close(self):
+        """
+        Completes and closes the output file.
+        """
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+
+
+class CsvSink(Sink):
+    """
+    Writes the records as comma separated text with a header line.
+    """
+
+    def __init__(self, filename, fields=None):
+        Sink.__init__(self, filename, fields)
+        self._file = open(filename, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._header = False
+
+    def _write(self, columns, size):
+        if not self._header:
+            self._writer.writerow([key for key, column in columns])
+            self._header = True
+
+        self._writer.writerows(zip(*[column.tolist() for key, column in columns]))
+
+
+class NpySink(Sink):
+    """
+    Writes the records as one structured NumPy array (.npy) that can be read
+    with numpy.load (also memory mapped). The data is written first, the header
+    with the final number of records on close. Text columns are stored as
+    unicode strings of at most `text_length` characters.
+    """
+
+    # reserved bytes of the header, a multiple of 64
+    HEADER_SIZE = 4096
+
+    def __init__(self, filename, fields=None, text_length=32):
+        Sink.__init__(self, filename, fields)
+        self.text_length = text_length
+        self._file = open(filename, 'wb')
+        self._file.write(b' ' * self.HEADER_SIZE)
+        self._dtype = None
+
+    def _write(self, columns, size):
+        if self._dtype is None:
+            text = 'U{}'.format(self.text_length)
+            self._dtype = np.dtype([(key, text if column.dtype.kind in 'OUS' else column.dtype)
+                for key, column in columns])
+
+        data = np.empty(size, dtype=self._dtype)
+        for key, column in columns:
+            if self._dtype[key].kind == 'U':
+                column = column.astype(str)
+                if len(column) and max(len(value) for value in column.tolist()) > self.text_length:
+                    raise RuntimeError('The column {} contains text longer than {} characters!' .format(key, self.text_length))
+            data[key] = column
+
+        self._file.write(data.tobytes())
+
+    def close(self):
+        if self._file.closed:
+            return
+
+        if self._dtype is None:
+            self._dtype = np.dtype([])
+        header = "{{'descr': {!r}, 'fortran_order': False, 'shape': ({},), }}".format(
+            np.lib.format.dtype_to_descr(self._dtype), self.rows)
+
+        # magic string, version 1.0, header length, header
+        size = self.HEADER_SIZE - 10
+        if len(header) + 1 > size:
+            raise RuntimeError('The record fields do not fit into the .npy header!')
+        self._file.seek(0)
+        self._file.write(b'\x93NUMPY\x01\x00' + struct.pack('<H', size) + (header.ljust(size - 1) + '\n').encode('latin1'))
+        Sink.close(self)
+
+
+class ParquetSink(Sink):
+    """
+    Writes the records as Parquet file with one row group per chunk.
+    Requires the package "pyarrow".
+    """
+
+    def __init__(self, filename, fields=None):
+        Sink.__init__(self, filename, fields)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError('Writing .parquet files requires the package "pyarrow"!')
+        self._pyarrow = pyarrow
+        self._writer = None
+
+    def _write(self, columns, size):
+        table = self._pyarrow.table({key: column.tolist() if column.dtype.kind == 'O' else column
+            for key, column in columns})
+
+        if self._writer is None:
+            self._writer = self._pyarrow.parquet.ParquetWriter(self.filename, table.schema)
+        self._writer.write_table(table.cast(self._writer.schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def open_sink(filename, fields=None):
+    """
+    Returns the sink of a .csv, .npy or .parquet file depending on the file extension.
+    """
+    if filename.endswith('.csv'):
+        return CsvSink(filename, fields)
+    elif filename.endswith('.npy'):
+        return NpySink(filename, fields)
+    elif filename.endswith('.parquet'):
+        return ParquetSink(filename, fields)
+
+    raise RuntimeError('The file format of {} is not supported!' .format(filename))
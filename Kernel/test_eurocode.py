@@ -0,0 +1,52 @@
+"""
+Tests of the design check of the Eurocode class against hand calculations.
+
+Author: Lukas Rauch
+"""
+
+import unittest
+import numpy as np
+from .eurocode import Eurocode, _admissible
+
+
+class TestDesignCheck(unittest.TestCase):
+
+    def setUp(self):
+        self.ec = Eurocode()
+
+    def test_steel_von_mises(self):
+        # S235, Wy = 1000 cm^3, A = 100 cm^2, web area 0.4 A = 40 cm^2
+        fy, Wy, area = 235.0, 1.0e-3, 1.0e-2
+        mk, qk = 117.5, 300.0
+        nu = self.ec.design_check(mk, qk, Wy, area, fy, fy, np.nan, 'steal')
+
+        sigma = mk / (1000 * Wy)            # 117.5 N/mm^2
+        tau = qk / (1000 * 0.4 * area)      # 75.0 N/mm^2
+        von_mises = np.sqrt(sigma**2 + 3 * tau**2) / fy
+
+        self.assertAlmostEqual(float(nu['nu_mk']), 0.5)
+        self.assertAlmostEqual(float(nu['nu_qk']), np.sqrt(3) * 75.0 / 235.0)
+        self.assertAlmostEqual(float(nu['nu_vmk']), von_mises)
+        self.assertAlmostEqual(float(nu['nu_vmk']), 0.7454, places=4)
+        # Gq = 1.5, Gm_s0 = 1.0
+        self.assertAlmostEqual(float(nu['nu_vmd']), 1.5 * von_mises)
+        self.assertAlmostEqual(float(_admissible(nu)), 1.5 * von_mises)
+
+    def test_steel_pure_shear(self):
+        # without moment the von Mises utilisation equals the shear utilisation
+        qk = 0.4 * 1000 * 1.0e-2 * 235.0 / np.sqrt(3) * 0.4
+        nu = self.ec.design_check(0.0, qk, 1.0e-3, 1.0e-2, 235.0, 235.0, np.nan, 'steal')
+
+        self.assertAlmostEqual(float(nu['nu_qd']), 0.6)
+        self.assertAlmostEqual(float(nu['nu_vmd']), 0.6)
+        self.assertAlmostEqual(float(_admissible(nu)), 0.6)
+
+    def test_wood_without_von_mises(self):
+        nu = self.ec.design_check(10.0, 20.0, 1.0e-3, 1.0e-2, 24.0, 4.0, 0.5, 'wood')
+
+        self.assertTrue(np.isnan(nu['nu_vmd']))
+        self.assertAlmostEqual(float(_admissible(nu)), max(float(nu['nu_md']), float(nu['nu_qd'])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests of the FE solver against closed form solutions of continuous beams.
+
+Author: Lukas Rauch
+"""
+
+import unittest
+import numpy as np
+from .testing import girder
+
+
+class TestFem(unittest.TestCase):
+
+    def test_two_spans_line_load(self):
+        q, l = 10.0, 5.0
+        model = girder([l, l])
+        results = model.solve_fem(element_loads=q)
+
+        np.testing.assert_allclose(results['reactions'][:, 1], [3/8*q*l, 10/8*q*l, 3/8*q*l])
+
+        forces = results['element_forces']
+        np.testing.assert_allclose(forces['moment_b'][0], -q*l**2/8)
+        np.testing.assert_allclose(forces['moment_a'][1], -q*l**2/8)
+        np.testing.assert_allclose(forces['moment_field'], 9/128*q*l**2)
+
+    def test_three_spans_line_load(self):
+        q, l = 8.0, 4.0
+        model = girder([l, l, l])
+        results = model.solve_fem(element_loads=q)
+
+        np.testing.assert_allclose(results['reactions'][:, 1], [0.4*q*l, 1.1*q*l, 1.1*q*l, 0.4*q*l])
+        np.testing.assert_allclose(results['element_forces']['moment_b'][:2], -0.1*q*l**2)
+
+    def test_single_span_point_load(self):
+        p, l = 100.0, 6.0
+        model = girder([l/2, l/2], supports=[0, 2])
+        results = model.solve_fem(nodal_loads={1: [0, -p, 0]})
+
+        np.testing.assert_allclose(results['reactions'][[0, 2], 1], [p/2, p/2])
+        np.testing.assert_allclose(results['element_forces']['moment_b'][0], p*l/4)
+
+    def test_support_forces_match_reactions(self):
+        model = girder([5.0, 5.0])
+        results = model.solve_fem(element_loads=10.0)
+
+        model.calc_supportforce_auto()
+        support_y = [model.get_node(id).support_y for id in [0, 1, 2]]
+
+        np.testing.assert_allclose(support_y, results['reactions'][:, 1])
+        np.testing.assert_allclose(support_y, [18.75, 62.5, 18.75])
+
+    def test_support_forces_unequal_spans(self):
+        # support moment -q (l1^3 + l2^3) / (8 (l1 + l2)) = -35 kNm, end shears of span 1: 11.25 and 28.75 kN
+        model = girder([4.0, 6.0])
+        results = model.solve_fem(element_loads=10.0)
+
+        model.calc_supportforce_auto()
+        support_y = [model.get_node(id).support_y for id in [0, 1, 2]]
+
+        np.testing.assert_allclose(support_y, results['reactions'][:, 1])
+        np.testing.assert_allclose(support_y, [11.25, 28.75 + 35.8333333333, 24.1666666667])
+
+    def test_support_forces_end_shears(self):
+        # q_a acts on node_a and q_e on node_b, also for unequal end shears
+        model = girder([4.0, 6.0])
+        model.get_element(0).forces = {'moment': 0, 'q_a': 1.0, 'q_e': 2.0}
+        model.get_element(1).forces = {'moment': 0, 'q_a': 4.0, 'q_e': 8.0}
+
+        model.calc_supportforce_auto()
+        np.testing.assert_allclose([model.get_node(id).support_y for id in [0, 1, 2]], [1.0, 6.0, 8.0])
+
+        model.get_element(1).forces['q_e'] = 16.0
+        model.calc_supportforce_auto([2])
+        self.assertAlmostEqual(model.get_node(2).support_y, 16.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""
+Tests of the force cache shared by the models of a process.
+
+Author: Lukas Rauch
+"""
+
+import pickle
+import unittest
+from .forcecache import ForceCache, FORCE_CACHE
+from .testing import girder
+
+
+class TestForceCache(unittest.TestCase):
+
+    def test_pickle_without_shared_cache(self):
+        model = girder([6.0])
+        model.solve(1)
+        self.assertGreater(len(FORCE_CACHE), 0)
+
+        data = pickle.dumps(model)
+        self.assertNotIn(b'ForceCache', data)
+
+        loaded = pickle.loads(data)
+        self.assertIs(loaded.force_cache, FORCE_CACHE)
+        self.assertEqual(loaded.solve(1).tolist(), model.solve(1).tolist())
+
+    def test_pickle_own_cache(self):
+        model = girder([6.0])
+        model.force_cache = ForceCache(16)
+        model.solve(1)
+
+        loaded = pickle.loads(pickle.dumps(model))
+        self.assertIsNot(loaded.force_cache, FORCE_CACHE)
+        self.assertEqual(len(loaded.force_cache), len(model.force_cache))
+
+    def test_pickle_disabled_cache(self):
+        model = girder([6.0])
+        model.force_cache = None
+
+        self.assertIsNone(pickle.loads(pickle.dumps(model)).force_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Tests of the package import in a fresh interpreter.
+
+Author: Lukas Rauch
+"""
+
+import os
+import sys
+import subprocess
+import unittest
+from . import QUIET_VARIABLE, BANNER
+from benchmarks.bench_import import HEAVY_MODULES, measure_import
+from benchmarks.run import IMPORT_BUDGET
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the budget of the benchmarks with a margin for slow or busy test machines
+TEST_IMPORT_BUDGET = 4 * IMPORT_BUDGET
+
+# solve of a small model with the base solver, that does not need the optional packages
+SOLVE = """
+import sys
+from Kernel.testing import girder
+girder([6.0]).solve(1)
+print([m for m in {heavy!r} if m in sys.modules])
+"""
+
+
+def run_import(quiet, code='import Kernel'):
+    """
+    Imports the package in a new interpreter and returns its output.
+    """
+    env = dict(os.environ)
+    env.pop(QUIET_VARIABLE, None)
+    if quiet is not None:
+        env[QUIET_VARIABLE] = quiet
+
+    return subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, env=env, universal_newlines=True)
+
+
+class TestImport(unittest.TestCase):
+
+    def test_no_heavy_modules(self):
+        output = run_import('1', 'import sys, Kernel; print([m for m in ("matplotlib", "scipy") if m in sys.modules])')
+        self.assertEqual(output.strip(), '[]')
+
+    def test_solve_without_heavy_modules(self):
+        output = run_import('1', SOLVE.format(heavy=HEAVY_MODULES))
+        self.assertEqual(output.strip().splitlines()[-1], '[]')
+
+    def test_import_budget(self):
+        measurements = [measure_import('Kernel') for i in range(3)]
+        seconds = min(m[0] for m in measurements)
+
+        self.assertLess(seconds, TEST_IMPORT_BUDGET)
+        self.assertEqual(measurements[0][1], [])
+
+    def test_quiet(self):
+        self.assertEqual(run_import('1'), '')
+
+    def test_banner(self):
+        self.assertIn(BANNER.strip(), run_import(None))
+        self.assertIn(BANNER.strip(), run_import('0'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests of the span interpolation of the load tables.
+
+Author: Lukas Rauch
+"""
+
+import unittest
+import numpy as np
+from .loadtable import LoadTable
+from .load import Load, UNIT_MOMENT_MLC, SHEAR_MLC, UNIT_MOMENT_LM1
+
+
+class TestLoadTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = LoadTable({
+            1.0: {4: 1.0, 8: 2.0},
+            2.0: {4: 3.0, 8: 6.0},
+            4.0: {4: 4.0, 8: 10.0}
+        })
+
+    def test_exact_spans(self):
+        for table in [UNIT_MOMENT_MLC['mlc_wheeled'], UNIT_MOMENT_MLC['mlc_tracked'], SHEAR_MLC['mlc_wheeled'],
+                      SHEAR_MLC['mlc_tracked'], UNIT_MOMENT_LM1]:
+            for loadclass in table.loadclasses.tolist():
+                loadclass = int(loadclass)
+                expected = [table.get(span, loadclass) for span in table.spans.tolist()]
+                np.testing.assert_allclose(table.interpolate(table.spans, loadclass), expected)
+                np.testing.assert_allclose(table.interpolate(table.spans, loadclass, conservative=True), expected)
+
+    def test_exact_spans_load(self):
+        load = Load(1, 'mlc_wheeled', 40)
+        for span in [1, 3.5, 8, 26, 100]:
+            np.testing.assert_allclose(load.interpolate_unit_moment_mlc(40, span), load.get_unit_moment_mlc(40, span))
+            np.testing.assert_allclose(load.interpolate_shear_mlc(40, span), load.get_shear_mlc(40, span))
+            self.assertAlmostEqual(float(load.interpolate_unit_moment_lm1(span)), load.get_unit_moment_lm1(span))
+
+    def test_mid_span(self):
+        self.assertAlmostEqual(float(self.table.interpolate(1.5, 4)), 2.0)
+        self.assertAlmostEqual(float(self.table.interpolate(3.0, 8)), 8.0)
+        np.testing.assert_allclose(self.table.interpolate([1.25, 3.5], 4), [1.5, 3.75])
+
+    def test_conservative(self):
+        np.testing.assert_allclose(self.table.interpolate([1.1, 1.9, 2.0, 2.01], 8, conservative=True), [6.0, 6.0, 6.0, 10.0])
+
+    def test_loadclasses(self):
+        values = self.table.interpolate([1.5, 3.0], [4, 8])
+        np.testing.assert_allclose(values, [[2.0, 3.5], [4.0, 8.0]])
+
+    def test_out_of_range(self):
+        for span in [0.5, 4.5, [1.0, 5.0]]:
+            with self.assertRaises(RuntimeError):
+                self.table.interpolate(span, 4)
+            with self.assertRaises(RuntimeError):
+                self.table.interpolate(span, 4, conservative=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
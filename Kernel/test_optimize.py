@@ -0,0 +1,71 @@
+"""
+Tests of Model.optimize_sections against a brute force search of the catalogue.
+
+Author: Lukas Rauch
+"""
+
+import unittest
+import numpy as np
+from .material import material_from_grade
+from .crosssection import rectangle_properties
+from .testing import girder
+
+
+CATALOGUE = [(hight, width, grade) for hight in np.arange(0.2, 1.01, 0.1) for width in np.arange(0.1, 0.41, 0.05)
+    for grade in ['c24', 'gl28h', 's235', 's355']]
+
+
+def wood_girder(spans, loadclass=16):
+    return girder(spans, loadclasses=[('mlc_wheeled', loadclass)])
+
+
+def brute_force(model, load_id, catalogue):
+    """
+    Lightest passing section of every element, found by checking every section of the catalogue.
+    """
+    weights = []
+    for id in model._elements:
+        mk, qk = model.calc_forces(id, load_id)
+        best = np.nan
+        for hight, width, grade in catalogue:
+            material = material_from_grade(grade, grade)
+            properties = rectangle_properties(hight, width)
+            nu = model.ec.design_check(mk, qk, properties['Wy'], properties['area'], material.fmk, material.fvk,
+                material.get_kcr() if material.materialtype == 'wood' else np.nan, material.materialtype)
+            utilisation = max(nu['nu_md'], nu['nu_qd'], nu['nu_vmd'] if material.materialtype == 'steal' else 0)
+            weight = properties['area'] * material.density
+            if utilisation <= 1.0 and not weight >= best:
+                best = weight
+        weights.append(best)
+
+    return np.array(weights)
+
+
+class TestOptimizeSections(unittest.TestCase):
+
+    def test_brute_force(self):
+        model = wood_girder([2.0, 4.5, 7.0, 9.5, 12.0, 4.5])
+        sections = model.optimize_sections(1, CATALOGUE)
+
+        np.testing.assert_allclose(sections['weight'], brute_force(model, 1, CATALOGUE))
+        self.assertTrue(np.all(sections['utilisation'] <= 1.0))
+
+    def test_steel(self):
+        model = wood_girder([1.0, 3.0, 8.0, 15.0], loadclass=40)
+        catalogue = [section for section in CATALOGUE if section[2] in ('s235', 's355')]
+        sections = model.optimize_sections(1, catalogue)
+
+        np.testing.assert_allclose(sections['weight'], brute_force(model, 1, catalogue))
+
+    def test_no_section_passes(self):
+        model = wood_girder([4.0, 30.0], loadclass=8)
+        catalogue = [(0.6, 0.2, 'c24'), (0.8, 0.2, 'c24')]
+        sections = model.optimize_sections(1, catalogue)
+
+        expected = brute_force(model, 1, catalogue)
+        np.testing.assert_array_equal(sections['section'] < 0, np.isnan(expected))
+        np.testing.assert_allclose(sections['weight'], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests of the incremental solve against a fresh solve of the same model.
+
+Author: Lukas Rauch
+"""
+
+import unittest
+import numpy as np
+from .modelfile import model_to_dict, model_from_dict
+from .testing import girder
+
+
+def mixed_girder(n=6):
+    """
+    Girder of n elements with alternating spans, materials and cross sections.
+    """
+    spans = [[4.0, 6.0, 7.5][i % 3] for i in range(n)]
+    return girder(spans, materials=('C24', 'C24', 'S235'), crosssections=((0.4, 0.2), (0.6, 0.3)))
+
+
+class TestIncrementalSolve(unittest.TestCase):
+
+    def assert_fresh(self, model):
+        """
+        The incremental solve equals the solve of a copy of the model without solve state.
+        """
+        results = model.solve(1)
+        support_y = [node.support_y for node in model.node]
+
+        fresh = model_from_dict(model_to_dict(model))
+        np.testing.assert_allclose(results, fresh.solve(1))
+        np.testing.assert_allclose(support_y, [node.support_y for node in fresh.node])
+
+        for i, id in enumerate(model._elements):
+            design = model.design_crosssection(id, 1)
+            np.testing.assert_allclose(results[i], [design['nu_md'], design['nu_qd']])
+
+    def test_first_solve(self):
+        self.assert_fresh(mixed_girder())
+
+    def test_move_node(self):
+        model = mixed_girder()
+        model.solve(1)
+        model.get_node(3).x += 0.5
+        self.assert_fresh(model)
+
+    def test_replace_node_and_material(self):
+        model = mixed_girder()
+        model.solve(1)
+        model.add_node(50, model.get_node(2).x + 1.0, 0)
+        model.add_substructure([50])
+        model.get_element(1).node_b = model.get_node(50)
+        model.get_element(2).node_a = model.get_node(50)
+        model.get_element(4).material = model.get_material('S235')
+        model.get_element(5).crosssection = model.get_crosssection(2)
+        self.assert_fresh(model)
+
+    def test_add_element(self):
+        model = mixed_girder()
+        model.solve(1)
+        model.add_node(99, 60.0, 0)
+        model.add_element(99, 6, 99, crosssection=1, material='C24')
+        model.add_substructure([99])
+        self.assert_fresh(model)
+
+    def test_edit_material_in_place(self):
+        model = mixed_girder()
+        before = model.solve(1)
+        model.get_material('C24').fmk = 2.4
+        after = model.solve(1)
+
+        wood = [i for i, element in enumerate(model.elements) if element.material.id == 'C24']
+        np.testing.assert_allclose(after[wood, 0], 10 * before[wood, 0])
+        self.assert_fresh(model)
+
+    def test_edit_crosssection_in_place(self):
+        model = mixed_girder()
+        before = model.solve(1)
+        crosssection = model.get_crosssection(1)
+        crosssection.Wy = 2 * crosssection.Wy
+        after = model.solve(1)
+
+        elements = [i for i, element in enumerate(model.elements) if element.crosssection is crosssection]
+        np.testing.assert_allclose(after[elements, 0], before[elements, 0] / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
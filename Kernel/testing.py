@@ -0,0 +1,55 @@
+"""
+This modul contains the girder builder of the tests and the benchmarks.
+
+Author: Lukas Rauch
+"""
+
+from .model import Model
+
+# materials of the girders by ID
+MATERIALS = {
+    'C24': {'materialtype': 'wood', 'density': 420, 'youngs_modulus': 11000, 'fmk': 24, 'fvk': 4},
+    'S235': {'materialtype': 'steal', 'density': 7850, 'youngs_modulus': 210000, 'fmk': 235, 'fvk': 235}
+}
+
+
+def girder(spans, materials=('C24',), crosssections=((0.4, 0.2),), loadclasses=(('mlc_wheeled', 40),),
+           supports=None, name='girder'):
+    """
+    Builds a girder along the x axis from x = 0 with a node at the end of
+    every span and one element per span.
+
+    Parameters
+    ----------
+    spans : list
+        Spans of the elements [m].
+    materials : list
+        IDs of MATERIALS, used by the elements in turn.
+    crosssections : list
+        (hight, width) of the cross sections with the IDs 1, 2, ..., used by
+        the elements in turn.
+    loadclasses : list
+        (loadtype, loadclass) of the load classes with the IDs 1, 2, ...
+    supports : list
+        Node IDs of the substructures, the nodes are numbered from 0.
+        If None, every node is supported.
+    """
+    model = Model(name)
+
+    for id in dict.fromkeys(materials):
+        model.add_material(id=id, **MATERIALS[id])
+    for i, (hight, width) in enumerate(crosssections):
+        model.add_crosssection(id=i + 1, hight=hight, width=width)
+    for i, (loadtype, loadclass) in enumerate(loadclasses):
+        model.add_loadclass(id=i + 1, loadtype=loadtype, loadclass=loadclass)
+
+    x = 0.0
+    model.add_node(0, x, 0)
+    for i, span in enumerate(spans):
+        x += span
+        model.add_node(i + 1, x, 0)
+        model.add_element(i, i, i + 1, crosssection=i % len(crosssections) + 1, material=materials[i % len(materials)])
+
+    model.add_substructure(list(range(len(spans) + 1)) if supports is None else supports)
+
+    return model
@@ -0,0 +1,173 @@
+"""
+This modul only contains the Renderer class, a headless renderer of
+model figures for reports.
+
+The figures are drawn on the Agg canvas without pyplot, so no window is
+opened and no global state is shared between the figures.
+
+Author: Lukas Rauch
+"""
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+
+
+class Renderer(object):
+    """
+    Draws the system, the support forces and the moment diagram of a model
+    and writes it to .png, .svg or .pdf files.
+
+    Attributes
+    ---------
+    figsize : tuple
+        Size of the figure [inch].
+    dpi : int
+        Resolution of raster images.
+    moment_scale : float
+        Height of the largest moment ordinate relative to the bridge length.
+    points : int
+        Number of points of the moment parabola of every element.
+    labels : bool
+        Write the values of the support forces and moments.
+    axis : bool
+        Draw the coordinate axes. Drawing the ticks is the most expensive part
+        of small figures, so they are off by default.
+    figure, axes : Figure, Axes
+        Figure and axes reused for all models.
+    """
+
+    def __init__(self, figsize=(12, 4), dpi=100, moment_scale=0.1, points=21, labels=False, axis=False):
+        """
+        Create a new renderer.
+        """
+        self.figsize = figsize
+        self.dpi = dpi
+        self.moment_scale = moment_scale
+        self.points = points
+        self.labels = labels
+        self.axis = axis
+
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot(1, 1, 1)
+
+    def _geometry(self, model):
+        """
+        Node coordinates, element end points and forces as arrays.
+        """
+        nodes = model._node_store
+        store = model._element_store
+        n = store.size
+
+        x = nodes.x[:nodes.size]
+        y = nodes.y[:nodes.size]
+        a = store.node_a[:n]
+        b = store.node_b[:n]
+        start = np.column_stack((x[a], y[a]))
+        end = np.column_stack((x[b], y[b]))
+
+        return x, y, start, end, store.moment[:n]
+
+    def moment_lines(self, start, end, moment, scale):
+        """
+        Parabolic moment diagrams of all elements with the maximum moment at
+        midspan, drawn perpendicular to the element axis.
+
+        Returns
+        -------
+        lines : ndarray
+            Polylines with shape (number of elements, points, 2).
+        """
+        xi = np.linspace(0, 1, self.points)
+        axis = end - start
+        length = np.hypot(axis[:, 0], axis[:, 1])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normal = np.where(length[:, np.newaxis] > 0, np.column_stack((-axis[:, 1], axis[:, 0])) / length[:, np.newaxis], 0)
+
+        # sagging moments are drawn below the axis
+        ordinate = -scale * moment[:, np.newaxis] * 4 * xi * (1 - xi)
+        return start[:, np.newaxis, :] + xi[:, np.newaxis] * axis[:, np.newaxis, :] + ordinate[..., np.newaxis] * normal[:, np.newaxis, :]
+
+    def draw(self, model, title=None):
+        """
+        Draws a model on the figure of the renderer and returns the figure.
+        """
+        ax = self.axes
+        self.clear()
+
+        x, y, start, end, moment = self._geometry(model)
+        width = max(np.ptp(x) if len(x) else 0, np.ptp(y) if len(y) else 0, 1.0)
+
+        # system
+        ax.add_collection(LineCollection(np.stack((start, end), axis=1), colors='black', linewidths=1.5))
+        ax.plot(x, y, linestyle='none', marker='o', markersize=3, color='black')
+
+        # supports and support forces
+        supports = [model._nodes[id] for id in model._substructures if id in model._nodes]
+        if supports:
+            sx = np.array([node.x for node in supports], dtype=float)
+            sy = np.array([node.y for node in supports], dtype=float)
+            force = np.array([node.support_y or 0 for node in supports], dtype=float)
+            ax.plot(sx, sy, linestyle='none', marker='^', markersize=8, color='green')
+            if np.any(force):
+                length = 0.05 * width * force / np.max(np.abs(force))
+                ax.quiver(sx, sy - length, np.zeros_like(length), length, angles='xy', scale_units='xy', scale=1,
+                          color='green', width=0.002)
+            if self.labels:
+                for i in range(len(sx)):
+                    ax.annotate('{:.1f}'.format(force[i]), (sx[i], sy[i]), textcoords='offset points', xytext=(0, -24),
+                                ha='center', color='green', fontsize=7)
+
+        # moment diagram
+        if len(moment) and np.any(moment):
+            scale = self.moment_scale * width / np.max(np.abs(moment))
+            lines = self.moment_lines(start, end, moment, scale)
+            ax.add_collection(LineCollection(lines, colors='blue', linewidths=1))
+            if self.labels:
+                middle = lines[:, self.points // 2]
+                for i in range(len(middle)):
+                    ax.annotate('{:.1f}'.format(moment[i]), middle[i], textcoords='offset points', xytext=(0, -10),
+                                ha='center', color='blue', fontsize=7)
+
+        ax.set_title(model.name if title is None else title)
+        if self.axis:
+            ax.set_axis_on()
+        else:
+            ax.set_axis_off()
+        ax.autoscale_view()
+        ax.margins(0.05, 0.3)
+
+        return self.figure
+
+    def clear(self):
+        """
+        Removes the drawn model. The axes are kept, creating new axes
+        is slower than drawing a small model.
+        """
+        ax = self.axes
+        for artist in list(ax.lines) + list(ax.collections) + list(ax.texts):
+            artist.remove()
+        ax.ignore_existing_data_limits = True
+
+    def save(self, model, filename, title=None):
+        """
+        Draws a model and writes it to a file. The format is taken from the
+        file extension (.png, .svg, .pdf).
+        """
+        self.draw(model, title).savefig(filename, dpi=self.dpi)
+
+    def save_many(self, models, filenames):
+        """
+        Draws many models one after another on the same figure.
+        """
+        for model, filename in zip(models, filenames):
+            self.save(model, filename)
+
+
+def render_model(model, filename, **options):
+    """
+    Writes the figure of a model to a .png, .svg or .pdf file (see Renderer).
+    """
+    Renderer(**options).save(model, filename)
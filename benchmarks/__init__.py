@@ -0,0 +1,15 @@
+"""
+Benchmark suite of the BB Tool.
+
+The benchmarks are written in the style of airspeed velocity (asv): classes
+with `params`, `setup` and `time_*` methods. Run them with
+
+    python -m benchmarks.run --output report.json
+
+from the root of the repository. The import time budget of the package is
+checked with
+
+    python -m benchmarks.run --check-import
+
+Author: Lukas Rauch
+"""
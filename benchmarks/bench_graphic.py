@@ -0,0 +1,58 @@
+"""
+Benchmarks of the visualization.
+
+Author: Lukas Rauch
+"""
+
+import os
+import tempfile
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from .bridges import make_bridge
+from Kernel.graphic import Graphic
+from Kernel.visualization.renderer import Renderer
+
+
+class Rendering(object):
+    """
+    Rendering of a solved bridge without a window.
+    """
+    params = [10, 100, 1000]
+    param_names = ['elements']
+
+    def setup(self, n):
+        self.model = make_bridge(n)
+        self.model.solve(1)
+
+    def teardown(self, n):
+        plt.close('all')
+
+    def items(self, n):
+        return n
+
+    def time_graphic(self, n):
+        Graphic(self.model)
+        plt.gcf().canvas.draw()
+
+
+class HeadlessRendering(object):
+    """
+    Rendering of a solved bridge with the headless renderer to a PNG file.
+    """
+    params = [10, 1000, 100000]
+    param_names = ['elements']
+
+    def setup(self, n):
+        self.model = make_bridge(n)
+        self.model.solve(1)
+        self.renderer = Renderer()
+        self.filename = os.path.join(tempfile.gettempdir(), 'bbtool_benchmark.png')
+
+    def items(self, n):
+        return n
+
+    def time_save_png(self, n):
+        self.renderer.save(self.model, self.filename)
@@ -0,0 +1,47 @@
+"""
+Benchmarks of the package import.
+
+Author: Lukas Rauch
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules that must not be loaded by importing the package
+HEAVY_MODULES = ['matplotlib', 'scipy', 'pyarrow']
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'modules': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module='Kernel'):
+    """
+    Imports a module in a fresh quiet interpreter and returns the import time [s]
+    and the heavy modules loaded by the import.
+    """
+    env = dict(os.environ, BBTOOL_QUIET='1')
+    output = subprocess.check_output(
+        [sys.executable, '-c', _SCRIPT.format(module=module, heavy=HEAVY_MODULES)], cwd=ROOT, env=env)
+
+    result = json.loads(output.decode().strip().splitlines()[-1])
+    return result['seconds'], result['modules']
+
+
+class Import(object):
+    """
+    Import of the package in a new process.
+    """
+    params = ['Kernel', 'Kernel.model', 'Kernel.batch']
+    param_names = ['module']
+
+    def time_import(self, module):
+        measure_import(module)
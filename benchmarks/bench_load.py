@@ -0,0 +1,38 @@
+"""
+Benchmarks of the load class database.
+
+Author: Lukas Rauch
+"""
+
+import numpy as np
+from .bridges import SPANS
+from Kernel.load import Load, MLC_LOADCLASSES, UNIT_MOMENT_MLC
+
+
+class LoadLookup(object):
+    """
+    Table lookups of the Load class.
+    """
+    number = 10000
+
+    def setup(self):
+        self.load = Load(1, 'mlc_wheeled', 40)
+        self.spans = np.resize(np.array(SPANS), self.number)
+        self.table_spans = np.resize(UNIT_MOMENT_MLC['mlc_wheeled'].spans, self.number).tolist()
+
+    def items(self):
+        return self.number
+
+    def time_get_unit_moment_mlc(self):
+        for span in self.table_spans:
+            self.load.get_unit_moment_mlc(40, span)
+
+    def time_get_shear_mlc(self):
+        for span in self.table_spans:
+            self.load.get_shear_mlc(40, span)
+
+    def time_interpolate_unit_moment_mlc(self):
+        self.load.interpolate_unit_moment_mlc(40, self.spans)
+
+    def time_interpolate_all_loadclasses(self):
+        self.load.interpolate_unit_moment_mlc(MLC_LOADCLASSES, self.spans)
@@ -0,0 +1,157 @@
+"""
+Benchmarks of the per element design and the model solve.
+
+Author: Lukas Rauch
+"""
+
+import numpy as np
+from .bridges import make_bridge
+from Kernel.forcecache import FORCE_CACHE
+
+# number of elements of the synthetic bridges
+SIZES = [10, 1000, 100000]
+
+# maximum number of elements of the per element benchmarks
+PER_ELEMENT = 1000
+
+
+class PerElement(object):
+    """
+    Per element functions on the first elements of a bridge.
+    """
+    params = SIZES
+    param_names = ['elements']
+
+    def setup(self, n):
+        FORCE_CACHE.clear()
+        self.model = make_bridge(n)
+        self.ids = list(self.model._elements)[:PER_ELEMENT]
+
+    def items(self, n):
+        return min(n, PER_ELEMENT)
+
+    def time_calc_forces(self, n):
+        for id in self.ids:
+            self.model.calc_forces(id, 1)
+
+    def time_design_crosssection(self, n):
+        for id in self.ids:
+            self.model.design_crosssection(id, 1)
+
+    def time_solve_element(self, n):
+        for id in self.ids:
+            self.model.solve_element(id, 1)
+
+
+class Solve(object):
+    """
+    Full solve of a bridge with an empty force cache.
+    """
+    params = SIZES
+    param_names = ['elements']
+
+    def setup(self, n):
+        FORCE_CACHE.clear()
+        self.model = make_bridge(n)
+
+    def items(self, n):
+        return n
+
+    def time_solve(self, n):
+        self.model.solve(1)
+
+    def time_solve_all_elements(self, n):
+        self.model.solve_all_elements(2, lm1=True)
+
+    def time_calc_forces_all(self, n):
+        self.model.calc_forces_all(1)
+
+
+class Resolve(object):
+    """
+    Solve of a bridge after moving a single node.
+    """
+    params = SIZES
+    param_names = ['elements']
+
+    def setup(self, n):
+        self.model = make_bridge(n)
+        self.model.solve(1)
+        self.model._nodes[n // 2].x += 0.1
+
+    def items(self, n):
+        return 1
+
+    def time_resolve(self, n):
+        self.model.solve(1)
+
+
+class DesignCheck(object):
+    """
+    Design check kernel on the gathered element arrays.
+    """
+    params = SIZES
+    param_names = ['elements']
+
+    def setup(self, n):
+        self.model = make_bridge(n)
+        load = self.model._loadclasses[1]
+        self.data = self.model.get_element_arrays()
+        self.forces = self.model._calc_forces_arrays(load, self.data['span'], load.loadclass)
+
+    def items(self, n):
+        return n
+
+    def time_design_check(self, n):
+        self.model._design_arrays(self.data, *self.forces)
+
+
+class OptimizeSections(object):
+    """
+    Lightest section of a catalogue of timber and steel sections for all elements.
+    """
+    params = SIZES
+    param_names = ['elements']
+
+    def setup(self, n):
+        self.model = make_bridge(n)
+        self.catalogue = [(hight, width, grade) for hight in np.arange(0.1, 1.21, 0.02)
+            for width in np.arange(0.06, 0.61, 0.02) for grade in ['c24', 'c30', 'gl24h', 'gl28h', 's235', 's355']]
+
+    def items(self, n):
+        return n
+
+    def time_optimize_sections(self, n):
+        self.model.optimize_sections(1, self.catalogue)
+
+
+class SupportForces(object):
+    """
+    Support forces of all substructures.
+    """
+    params = SIZES
+    param_names = ['elements']
+
+    def setup(self, n):
+        self.model = make_bridge(n)
+        self.model.calc_forces_all(1)
+
+    def items(self, n):
+        return n
+
+    def time_calc_supportforce_auto(self, n):
+        self.model.calc_supportforce_auto()
+
+
+class Build(object):
+    """
+    Building a bridge with the add_* functions.
+    """
+    params = SIZES
+    param_names = ['elements']
+
+    def items(self, n):
+        return n
+
+    def time_make_bridge(self, n):
+        make_bridge(n)
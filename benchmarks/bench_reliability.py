@@ -0,0 +1,29 @@
+"""
+Benchmarks of the Monte Carlo reliability analysis.
+
+Author: Lukas Rauch
+"""
+
+from .bridges import make_bridge
+from Kernel.reliability import MonteCarlo
+
+# number of samples of the simulations
+SAMPLES = 10000
+
+
+class Reliability(object):
+    """
+    Monte Carlo simulation of all elements of a bridge.
+    """
+    params = [10, 1000]
+    param_names = ['elements']
+
+    def setup(self, n):
+        self.model = make_bridge(n)
+        self.simulation = MonteCarlo(SAMPLES, seed=0)
+
+    def items(self, n):
+        return n * SAMPLES
+
+    def time_monte_carlo(self, n):
+        self.simulation.run(self.model, 1)
@@ -0,0 +1,21 @@
+"""
+Synthetic bridges of the benchmarks.
+
+Author: Lukas Rauch
+"""
+
+from Kernel.testing import girder
+
+# spans of the synthetic elements [m], all within the load tables
+SPANS = [2.5, 4.0, 6.0, 7.5, 9.0, 12.0, 15.5, 18.0]
+
+
+def make_bridge(n_elements, substructures=True):
+    """
+    Builds a girder of n_elements elements with varying spans, alternating
+    wood and steel materials, three cross sections and a wheeled and a 
+    tracked MLC 40 load class.
+    """
+    return girder([SPANS[i % len(SPANS)] for i in range(n_elements)], materials=('S235', 'C24', 'C24', 'C24'),
+        crosssections=((0.4, 0.2), (0.6, 0.3), (0.8, 0.4)), loadclasses=(('mlc_wheeled', 40), ('mlc_tracked', 40)),
+        supports=None if substructures else [], name='bridge_{}'.format(n_elements))
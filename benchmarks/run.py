@@ -0,0 +1,211 @@
+"""
+Runner of the benchmark suite. Writes a JSON report with the wall times,
+the throughput and the peak memory of every benchmark and compares it with
+a previous report.
+
+    python -m benchmarks.run [--quick] [--filter NAME] [--repeat N]
+                             [--output report.json] [--compare old.json]
+                             [--check-import]
+
+Every repeat calls `setup` first, so the timed call always starts from the
+same state. The peak memory is traced with tracemalloc in an extra call.
+
+Author: Lukas Rauch
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# parameters of --quick runs
+QUICK_LIMIT = 1000
+
+# slowdown of the best time reported as regression by --compare
+REGRESSION = 1.2
+
+# budget of the package import [s] checked by --check-import
+IMPORT_BUDGET = 0.5
+
+
+def discover(pattern=None):
+    """
+    Returns the benchmarks of all bench_* modules as list of (name, class, method name).
+    """
+    package = os.path.dirname(os.path.abspath(__file__))
+    benchmarks = []
+
+    for module_info in pkgutil.iter_modules([package]):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module('benchmarks.' + module_info.name)
+
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for method in sorted(name for name in dir(cls) if name.startswith('time_')):
+                name = '{}.{}.{}'.format(module_info.name, class_name, method)
+                if pattern is None or pattern in name:
+                    benchmarks.append((name, cls, method))
+
+    return benchmarks
+
+
+def run_benchmark(cls, method, param, repeat):
+    """
+    Times one benchmark method for one parameter.
+    """
+    args = () if param is None else (param,)
+    bench = cls()
+    times = []
+
+    for i in range(repeat + 1):
+        if hasattr(bench, 'setup'):
+            bench.setup(*args)
+        start = time.perf_counter()
+        getattr(bench, method)(*args)
+        elapsed = time.perf_counter() - start
+        if hasattr(bench, 'teardown'):
+            bench.teardown(*args)
+        # the first call is a warm up
+        if i:
+            times.append(elapsed)
+
+    if hasattr(bench, 'setup'):
+        bench.setup(*args)
+    tracemalloc.start()
+    getattr(bench, method)(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if hasattr(bench, 'teardown'):
+        bench.teardown(*args)
+
+    items = bench.items(*args) if hasattr(bench, 'items') else 1
+    best = min(times)
+
+    return {
+        'param': param,
+        'best': best,
+        'median': float(np.median(times)),
+        'repeat': repeat,
+        'items': items,
+        'throughput': items / best if best > 0 else None,
+        'peak_memory_mb': peak / 1e6
+    }
+
+
+def run(pattern=None, repeat=5, quick=False, log=print):
+    """
+    Runs the benchmarks and returns the report as dictionary.
+    """
+    results = []
+
+    for name, cls, method in discover(pattern):
+        params = getattr(cls, 'params', [None])
+        if quick:
+            params = [p for p in params if not isinstance(p, int) or p <= QUICK_LIMIT]
+
+        for param in params:
+            result = run_benchmark(cls, method, param, repeat)
+            result['name'] = name
+            results.append(result)
+            log('{:<60} {:>8} {:>12.6f} s {:>14.1f} items/s {:>10.2f} MB'.format(
+                name, '' if param is None else param, result['best'], result['throughput'] or 0,
+                result['peak_memory_mb']))
+
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'machine': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count()
+        },
+        'results': results
+    }
+
+
+def compare(report, previous, threshold=REGRESSION):
+    """
+    Returns the benchmarks whose best time is slower than the previous
+    report by more than the threshold as list of (name, param, ratio).
+    """
+    old = {(r['name'], r['param']): r['best'] for r in previous['results']}
+    regressions = []
+
+    for r in report['results']:
+        key = (r['name'], r['param'])
+        if key in old and old[key] > 0:
+            ratio = r['best'] / old[key]
+            if ratio > threshold:
+                regressions.append((r['name'], r['param'], ratio))
+
+    return regressions
+
+
+def check_import(budget=IMPORT_BUDGET, repeat=3):
+    """
+    Checks that importing the package takes less than the budget [s] (best of
+    `repeat` fresh processes) and loads none of the heavy optional modules.
+    Returns a list of the violations.
+    """
+    from .bench_import import measure_import
+
+    measurements = [measure_import('Kernel') for i in range(repeat)]
+    seconds = min(m[0] for m in measurements)
+    errors = []
+
+    if seconds > budget:
+        errors.append('Importing Kernel takes {:.3f} s, the budget is {:.3f} s'.format(seconds, budget))
+    for module in measurements[0][1]:
+        errors.append('Importing Kernel loads {}'.format(module))
+
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Runs the benchmark suite of the BB Tool.')
+    parser.add_argument('--filter', default=None, help='run only benchmarks whose name contains FILTER')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed calls per benchmark')
+    parser.add_argument('--quick', action='store_true', help='skip bridges with more than {} elements'.format(QUICK_LIMIT))
+    parser.add_argument('--output', default=None, help='JSON report file')
+    parser.add_argument('--compare', default=None, help='previous JSON report to compare with')
+    parser.add_argument('--threshold', type=float, default=REGRESSION, help='slowdown reported as regression')
+    parser.add_argument('--check-import', action='store_true', help='only check the import time budget of the package')
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET, help='import time budget [s]')
+    args = parser.parse_args(argv)
+
+    if args.check_import:
+        errors = check_import(args.import_budget)
+        for error in errors:
+            print('IMPORT {}'.format(error))
+        return 1 if errors else 0
+
+    report = run(args.filter, args.repeat, args.quick)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for name, param, ratio in regressions:
+            print('REGRESSION {} [{}]: {:.2f}x slower'.format(name, param, ratio))
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())